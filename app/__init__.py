@@ -1,9 +1,12 @@
 from flask import Flask
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from .config import db, init_app, setup_logging
+from .cache import user_cache, user_identity_filter
+from .config import ReplicaSet, RoutingSession, db, init_app, setup_logging
 from .handlers import setup_error_handlers
+from .instrumentation import setup_instrumentation, setup_metrics
 from .routes import main_bp, api_bp
+from .serialization import setup_json_provider
 
 def create_app(config_class=None):
     app = Flask(__name__)
@@ -14,19 +17,32 @@ def create_app(config_class=None):
         app.config.from_object(Config)
 
     init_app(app)
+    setup_json_provider(app)
+    user_cache.init_app(app)
 
+    replicas = ReplicaSet.from_uris(
+        app.config.get('DB_REPLICA_URIS'),
+        app.config.get('DB_REPLICA_STRATEGY', 'round_robin'),
+        app.config.get('SERVER_THREADS')
+    )
+    app.extensions['db_replicas'] = replicas
     with app.app_context():
         db.session = scoped_session(
             sessionmaker(
                 bind=db.engine,
+                class_=RoutingSession,
+                replicas=replicas,
                 autocommit=False,
                 autoflush=False,
                 expire_on_commit=False
             )
         )
+    user_identity_filter.init_app(app)
 
     setup_error_handlers(app)
     setup_logging(app)
+    setup_instrumentation(app)
+    setup_metrics(app)
     
     @app.teardown_appcontext
     def shutdown_session(exception=None):
@@ -6,7 +6,7 @@ def main():
     app.run(
         host=os.getenv('FLASK_HOST', '0.0.0.0'),
         port=int(os.getenv('FLASK_PORT', 5000)),
-        debug=os.getenv('FLASK_DEBUG', 'True') == 'True'
+        debug=os.getenv('FLASK_DEBUG', 'False') == 'True'
     )
 
 if __name__ == "__main__":
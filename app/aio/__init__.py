@@ -0,0 +1,13 @@
+from .asgi import AsyncApp, create_asgi_app
+from .controllers import AsyncAddressController, AsyncUserController
+from .database import AsyncDatabase, async_database_uri, async_db
+
+__all__ = [
+    'AsyncAddressController',
+    'AsyncApp',
+    'AsyncDatabase',
+    'AsyncUserController',
+    'async_database_uri',
+    'async_db',
+    'create_asgi_app'
+]
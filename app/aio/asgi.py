@@ -0,0 +1,252 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from flask import Flask
+from werkzeug.http import parse_etags
+
+from ..config import build_async_engine_options, get_setting
+from ..constans import get_error_message
+from ..controllers.addresses import ADDRESS_FIELDS
+from ..decorators.users.query_params import parse_fields, split_user_query_params
+from ..decorators.users.request_validation import model_from_json
+from ..exceptions import (
+    BaseAppException,
+    InvalidJSONFormatException,
+    InvalidParameterValueException,
+    MissingJSONBodyException,
+    RequestBodyTooLargeException
+)
+from ..models import USER_FIELDS
+from ..schemas import CreateAddressSchema, CreateUserSchema, UpdateStatusUserSchema, UpdateUserSchema
+from ..utils import user_etag
+from .controllers import AsyncAddressController, AsyncUserController
+from .database import async_database_uri, async_db
+
+error_logger = logging.getLogger('app.errors')
+
+
+class AsyncRequest:
+    """Datos de la petición ASGI que usan las vistas"""
+    def __init__(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict[str, Any]]]):
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = dict(parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True))
+        self.headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope.get('headers', [])}
+        self._receive = receive
+
+    @property
+    def is_json(self) -> bool:
+        mimetype = self.headers.get('content-type', '').split(';')[0].strip().lower()
+        return mimetype == 'application/json' or (mimetype.startswith('application/') and mimetype.endswith('+json'))
+
+    async def body(self, max_bytes: int) -> bytes:
+        """Lee el body sin superar `max_bytes`"""
+        content_length = self.headers.get('content-length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise RequestBodyTooLargeException(int(content_length), max_bytes)
+        chunks, received = [], 0
+        while True:
+            message = await self._receive()
+            chunk = message.get('body', b'')
+            received += len(chunk)
+            if received > max_bytes:
+                raise RequestBodyTooLargeException(received, max_bytes)
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    async def validated(self, schema_class):
+        """Equivalente de `validate_body` para vistas asíncronas"""
+        body = await self.body(get_setting('MAX_JSON_BODY_BYTES'))
+        if not self.is_json:
+            if body:
+                raise InvalidJSONFormatException()
+            raise MissingJSONBodyException()
+        if not body.strip():
+            raise MissingJSONBodyException()
+        return model_from_json(schema_class, body)
+
+    def if_match(self):
+        header = self.headers.get('if-match')
+        return parse_etags(header) if header else None
+
+
+class AsyncResponse:
+    def __init__(self, body: Any = None, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+
+
+async def get_user(request: AsyncRequest) -> AsyncResponse:
+    key, value, options = split_user_query_params(request.args, ['username', 'email'], ['include', 'fields'])
+    include = options.get('include')
+    fields = parse_fields(options.get('fields'), USER_FIELDS)
+    if include == 'addresses':
+        return AsyncResponse(await AsyncAddressController.get_user_with_addresses(key, value, fields))
+    if include is not None:
+        raise InvalidParameterValueException('include', include, 'addresses')
+
+    user = await AsyncUserController.get_user(key, value, fields)
+    if 'uuid' not in user or 'version' not in user:
+        return AsyncResponse(user)
+    etag = user_etag(user['uuid'], user['version'])
+    headers = {'etag': f'"{etag}"'}
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and parse_etags(if_none_match).contains(etag):
+        return AsyncResponse(status=304, headers=headers)
+    return AsyncResponse(user, headers=headers)
+
+async def create_user(request: AsyncRequest) -> AsyncResponse:
+    user_data = await request.validated(CreateUserSchema)
+    return AsyncResponse(await AsyncUserController.create_user(user_data.model_dump()), 201)
+
+async def update_user(request: AsyncRequest) -> AsyncResponse:
+    key, value, _ = split_user_query_params(request.args, ['username', 'email'])
+    user_data = await request.validated(UpdateUserSchema)
+    result = await AsyncUserController.update_user(key, value, user_data.model_dump(), request.if_match())
+    return AsyncResponse(result, headers={'etag': f'"{user_etag(result["uuid"], result["version"])}"'})
+
+async def update_user_status(request: AsyncRequest) -> AsyncResponse:
+    key, value, _ = split_user_query_params(request.args, ['username', 'email'])
+    status_data = await request.validated(UpdateStatusUserSchema)
+    result = await AsyncUserController.update_user_status(key, value, status_data.model_dump(), request.if_match())
+    return AsyncResponse(status=204, headers={'etag': f'"{user_etag(result["uuid"], result["version"])}"'})
+
+async def get_user_address(request: AsyncRequest) -> AsyncResponse:
+    key, value, options = split_user_query_params(request.args, ['username', 'email'], ['fields'])
+    fields = parse_fields(options.get('fields'), ADDRESS_FIELDS)
+    return AsyncResponse(await AsyncAddressController.get_user_address(key, value, fields))
+
+async def create_address(request: AsyncRequest) -> AsyncResponse:
+    key, value, _ = split_user_query_params(request.args, ['username', 'email'])
+    address_data = await request.validated(CreateAddressSchema)
+    return AsyncResponse(await AsyncAddressController.create_address(key, value, address_data.model_dump()))
+
+async def ping(request: AsyncRequest) -> AsyncResponse:
+    return AsyncResponse('pong')
+
+# Subconjunto de la API síncrona con las mismas rutas, esquemas y respuestas
+ROUTES: Dict[Tuple[str, str], Callable[[AsyncRequest], Awaitable[AsyncResponse]]] = {
+    ('GET', '/ping'): ping,
+    ('GET', '/api/users/'): get_user,
+    ('POST', '/api/users/'): create_user,
+    ('PATCH', '/api/users/update/'): update_user,
+    ('PATCH', '/api/users/status/'): update_user_status,
+    ('GET', '/api/addresses/user'): get_user_address,
+    ('POST', '/api/addresses/'): create_address,
+}
+
+
+class AsyncApp:
+    """Aplicación ASGI mínima sobre AsyncSession.
+
+    Usa la configuración, el proveedor JSON y el logging de la app Flask
+    (cuyo contexto se activa en cada petición) y responde los errores con el
+    mismo formato que los manejadores de `app.handlers`.
+    """
+    def __init__(self, flask_app: Flask, routes=ROUTES):
+        self.flask_app = flask_app
+        self.routes = routes
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        request = AsyncRequest(scope, receive)
+        with self.flask_app.app_context():
+            try:
+                response = await self._dispatch(request)
+            except BaseAppException as error:
+                error.log_error(error_logger, {
+                    "request_endpoint": request.path,
+                    "request_method": request.method,
+                    "client_ip": (scope.get('client') or (None,))[0],
+                    "user_agent_header": request.headers.get('user-agent')
+                })
+                response = AsyncResponse(error.to_dict(), error.status_code)
+            except Exception as error:
+                error_logger.critical(f"Unexpected error: {error}", extra={
+                    "endpoint": request.path,
+                    "method": request.method,
+                    "error_type": type(error).__name__,
+                    "error_details": str(error)
+                }, exc_info=True)
+                response = AsyncResponse({
+                    "error": get_error_message('UNEXPECTED_ERROR'),
+                    "message": get_error_message('UNEXPECTED_ERROR'),
+                    "status_code": 500
+                }, 500)
+            finally:
+                await async_db.remove_session()
+            await self._send(send, response)
+
+    async def _dispatch(self, request: AsyncRequest) -> AsyncResponse:
+        view = self.routes.get((request.method, request.path))
+        if view is not None:
+            return await view(request)
+        if any(path == request.path for _, path in self.routes):
+            error_logger.warning(f"405 Method Not Allowed: {request.method} {request.path}", extra={
+                "exception_type": "MethodNotAllowed",
+                "endpoint": request.path
+            })
+            return AsyncResponse({
+                "error": get_error_message('METHOD_NOT_ALLOWED', method=request.method),
+                "message": get_error_message('METHOD_NOT_ALLOWED', method=request.method),
+                "status_code": 405
+            }, 405)
+        error_logger.warning(f"404 Not Found: {request.path}", extra={
+            "exception_type": "NotFound",
+            "method": request.method
+        })
+        return AsyncResponse({
+            "error": get_error_message('NOT_FOUND'),
+            "message": get_error_message('NOT_FOUND_ENDPOINT', method=request.method, path=request.path),
+            "status_code": 404
+        }, 404)
+
+    async def _send(self, send, response: AsyncResponse) -> None:
+        headers: List[Tuple[bytes, bytes]] = [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response.headers.items()]
+        if response.body is None:
+            body = b''
+        elif isinstance(response.body, str):
+            body = response.body.encode()
+            headers.append((b'content-type', b'text/html; charset=utf-8'))
+        else:
+            body = self.flask_app.json.dumps(response.body).encode() + b'\n'
+            headers.append((b'content-type', b'application/json'))
+        headers.append((b'content-length', str(len(body)).encode()))
+        await send({'type': 'http.response.start', 'status': response.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await async_db.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(flask_app: Flask) -> AsyncApp:
+    """Aplicación ASGI con la configuración de `flask_app` y un engine asíncrono.
+
+    La URI es ASYNC_DB_URI o, si no se define, DB_URI con el driver asíncrono equivalente.
+    La caché compartida es síncrona (bloquearía el event loop), así que no se admite.
+    """
+    if flask_app.config.get('USER_CACHE_BACKEND') == 'shared':
+        raise ValueError("USER_CACHE_BACKEND=shared is not supported by serve-async: its client blocks the event loop. "
+                         "Use USER_CACHE_BACKEND=memory or none.")
+    uri = flask_app.config.get('ASYNC_DB_URI') or async_database_uri(flask_app.config['SQLALCHEMY_DATABASE_URI'])
+    async_db.init(uri, **build_async_engine_options(
+        uri,
+        flask_app.config.get('ASYNC_DB_POOL_SIZE', 20),
+        flask_app.config.get('ASYNC_DB_MAX_OVERFLOW', 10)
+    ))
+    return AsyncApp(flask_app)
@@ -0,0 +1,188 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Any, Dict, Optional, Tuple, Union
+from uuid import uuid4
+from werkzeug.datastructures import ETags
+
+from ..cache import user_cache, user_identity_filter
+from ..controllers import AddressController, UserController
+from ..controllers.addresses import ADDRESS_FIELDS
+from ..controllers.users import UPDATE_RETURNING_COLUMNS, build_username
+from ..exceptions import DatabaseException, InvalidUserDataException, UserAlreadyExistsException, UserNotFoundException
+from ..models import Address, User, USER_FIELDS
+from ..serialization import serializer_for
+from .database import async_db
+
+class AsyncUserController:
+    """Versión asíncrona de UserController: mismas consultas, respuestas y excepciones sobre AsyncSession"""
+
+    @staticmethod
+    async def get_user(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        cached_user = user_cache.get(key, value)
+        if cached_user is not None:
+            return {field: cached_user[field] for field in fields} if fields else cached_user
+        if not user_identity_filter.might_exist(key, value):
+            raise UserNotFoundException(field=key, value=value)
+        selected_fields = fields or USER_FIELDS
+        try:
+            row = (await async_db.session.execute(
+                select(*(getattr(User, field) for field in selected_fields)).where(getattr(User, key) == value)
+            )).first()
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+        if row is None:
+            raise UserNotFoundException(field=key, value=value)
+
+        response = dict(zip(selected_fields, row))
+        if not fields:
+            user_cache.set(response)
+        return response
+
+    @staticmethod
+    async def create_user(user_data: Dict[str, Any]) -> Dict[str, Union[str, None]]:
+        try:
+            existing = (await async_db.session.execute(
+                select(User.uuid).where(User.email == user_data['email'])
+            )).first()
+            if existing:
+                raise UserAlreadyExistsException(field='email', value=user_data['email'])
+
+            new_user = User(
+                uuid=str(uuid4()),
+                first_name=user_data['first_name'],
+                last_name=user_data['last_name'],
+                username=build_username(user_data['first_name'], user_data['last_name']),
+                email=user_data['email'],
+                phone=user_data.get('phone'),
+                middle_name=user_data.get('middle_name'),
+                status='active'
+            )
+            async_db.session.add(new_user)
+            await async_db.session.commit()
+            response = new_user.to_dict()
+            user_cache.invalidate('email', new_user.email, user=response)
+            user_identity_filter.add(response)
+            return response
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+    @staticmethod
+    async def _update_returning(key: str, value: str, values: Dict[str, Any], conditions) -> Optional[Any]:
+        statement = UserController._update_statement(key, value, values, conditions)
+        if async_db.engine.dialect.update_returning:
+            row = (await async_db.session.execute(statement.returning(*UPDATE_RETURNING_COLUMNS))).first()
+        else:
+            row = None
+            if (await async_db.session.execute(statement)).rowcount:
+                row = (await async_db.session.execute(
+                    select(*UPDATE_RETURNING_COLUMNS).where(getattr(User, key) == value)
+                )).first()
+        await async_db.session.commit()
+        return row
+
+    @staticmethod
+    async def _current_version(key: str, value: str, if_match: Optional[ETags]) -> Any:
+        row = (await async_db.session.execute(
+            select(User.uuid, User.version).where(getattr(User, key) == value)
+        )).first()
+        return UserController._check_current_version(row, key, value, if_match)
+
+    @staticmethod
+    async def update_user(key: str, value: str, user_data: Dict[str, Any], if_match: Optional[ETags] = None) -> Dict[str, Any]:
+        changes = {field: new_value for field, new_value in user_data.items() if new_value is not None}
+        conditions = UserController._update_conditions(changes, if_match)
+        try:
+            row = await AsyncUserController._update_returning(key, value, changes, conditions) if changes else None
+            if row is None:
+                await AsyncUserController._current_version(key, value, if_match)
+                raise InvalidUserDataException(field=key, value=value)
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+        user_cache.invalidate(key, value, user={'username': row.username, 'email': row.email})
+        return {
+            key: value,
+            "uuid": row.uuid,
+            "version": row.version,
+            "fields_updated": list(changes.items())
+        }
+
+    @staticmethod
+    async def update_user_status(key: str, value: str, status_data: Dict[str, Any], if_match: Optional[ETags] = None) -> Dict[str, Any]:
+        new_status = status_data.get('status')
+        conditions = UserController._update_conditions({'status': new_status}, if_match)
+        try:
+            row = await AsyncUserController._update_returning(key, value, {'status': new_status}, conditions)
+            if row is None:
+                current = await AsyncUserController._current_version(key, value, if_match)
+                return {"uuid": current.uuid, "version": current.version}
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+        user_cache.invalidate(key, value, user={'username': row.username, 'email': row.email})
+        return {"uuid": row.uuid, "version": row.version}
+
+
+class AsyncAddressController:
+    """Versión asíncrona de AddressController"""
+
+    @staticmethod
+    async def _fetch_user_with_addresses(
+            key: str,
+            value: str,
+            user_fields: Tuple[str, ...],
+            address_fields: Tuple[str, ...] = ADDRESS_FIELDS):
+        if not user_identity_filter.might_exist(key, value):
+            raise UserNotFoundException(field=key, value=value)
+        try:
+            rows = (await async_db.session.execute(
+                AddressController._user_with_addresses_query(key, value, user_fields, address_fields)
+            )).all()
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+        return AddressController._split_user_rows(key, value, rows, user_fields, address_fields)
+
+    @staticmethod
+    async def get_user_address(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        user, addresses = await AsyncAddressController._fetch_user_with_addresses(
+            key, value, ('username',), fields or ADDRESS_FIELDS
+        )
+        return {
+            'metadata': {
+                'username': user['username'],
+                'length': len(addresses)
+            },
+            'addresses': addresses
+        }
+
+    @staticmethod
+    async def get_user_with_addresses(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        user, addresses = await AsyncAddressController._fetch_user_with_addresses(key, value, fields or USER_FIELDS)
+        return {
+            **user,
+            'addresses': addresses
+        }
+
+    @staticmethod
+    async def create_address(key: str, value: str, address_data: Dict[str, Any]) -> Dict[str, Any]:
+        user = await AsyncUserController.get_user(key, value, ('uuid', 'username'))
+        try:
+            new_address = Address(
+                uuid=str(uuid4()),
+                user_uuid=user['uuid'],
+                **{field: address_data[field] for field in ADDRESS_FIELDS}
+            )
+            async_db.session.add(new_address)
+            await async_db.session.commit()
+        except SQLAlchemyError as e:
+            await async_db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+        return {
+            'username': user['username'],
+            **serializer_for(Address, ADDRESS_FIELDS)(new_address)
+        }
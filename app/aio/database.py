@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any
+
+from sqlalchemy.engine import make_url
+
+# Driver asíncrono equivalente a cada driver síncrono
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'mysql+pymysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+}
+
+def async_database_uri(uri: str) -> str:
+    """Traduce la URI síncrona (DB_URI) a la del driver asíncrono equivalente"""
+    url = make_url(uri)
+    if url.drivername in ASYNC_DRIVERS.values():
+        return uri
+    if url.drivername not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for '{url.drivername}'. Set ASYNC_DB_URI explicitly.")
+    return url.set(drivername=ASYNC_DRIVERS[url.drivername]).render_as_string(hide_password=False)
+
+
+class AsyncDatabase:
+    """Equivalente asíncrono de `db`: engine y una sesión por tarea (petición)"""
+    def __init__(self):
+        self.engine = None
+        self.session = None
+
+    def init(self, uri: str, **engine_options: Any) -> None:
+        # Import diferido: sqlalchemy.ext.asyncio requiere greenlet (extra 'async')
+        from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+
+        self.engine = create_async_engine(uri, **engine_options)
+        self.session = async_scoped_session(
+            async_sessionmaker(self.engine, autoflush=False, expire_on_commit=False),
+            scopefunc=asyncio.current_task
+        )
+
+    async def remove_session(self) -> None:
+        if self.session is not None:
+            await self.session.remove()
+
+    async def dispose(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+
+async_db = AsyncDatabase()
@@ -0,0 +1,19 @@
+from .backends import CacheBackend, MemoryCacheBackend, SharedCacheBackend, LocalSharedClient
+from .bloom import BloomFilter
+from .identity_filter import UserIdentityFilter
+from .user_cache import UserCache
+
+user_cache = UserCache()
+user_identity_filter = UserIdentityFilter()
+
+__all__ = [
+    'BloomFilter',
+    'CacheBackend',
+    'MemoryCacheBackend',
+    'SharedCacheBackend',
+    'LocalSharedClient',
+    'UserCache',
+    'UserIdentityFilter',
+    'user_cache',
+    'user_identity_filter'
+]
@@ -0,0 +1,54 @@
+import hashlib
+import math
+from typing import Any, Dict, Optional
+
+class BloomFilter:
+    """Filtro de Bloom con doble hashing sobre blake2b.
+
+    Dimensiona el array de bits para `capacity` elementos y la tasa de falsos
+    positivos `error_rate`; si supera `max_bytes`, se recorta al presupuesto y la
+    tasa real estimada queda disponible en `stats()`.
+    """
+    def __init__(self, capacity: int, error_rate: float = 0.01, max_bytes: Optional[int] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be greater than zero")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        if max_bytes is not None:
+            num_bits = min(num_bits, max_bytes * 8)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.num_bits / 8))
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for index in range(self.num_hashes):
+            yield (first + index * second) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def estimated_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'items': self.count,
+            'capacity': self.capacity,
+            'size_bytes': len(self.bits),
+            'hash_count': self.num_hashes,
+            'target_false_positive_rate': self.error_rate,
+            'estimated_false_positive_rate': self.estimated_false_positive_rate()
+        }
@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..models import db, User
+from .bloom import BloomFilter
+
+logger = logging.getLogger('app.cache')
+
+class UserIdentityFilter:
+    """Filtro de Bloom sobre los username y email existentes.
+
+    Permite descartar búsquedas de identidades inexistentes sin consultar la base
+    de datos. Cada proceso mantiene su propio filtro y las altas hechas por otros
+    procesos (workers, CLI) no son visibles hasta el siguiente `rebuild`; por eso
+    un filtro con más de `refresh_interval` segundos deja de descartar búsquedas
+    y se reconstruye en segundo plano.
+    """
+    LOOKUP_FIELDS = ('username', 'email')
+
+    def __init__(self):
+        self.filter: Optional[BloomFilter] = None
+        self.negative_hits = 0
+        self.refresh_interval: Optional[float] = None
+        self.built_at = 0.0
+        self._lock = threading.Lock()
+        self._pending = None
+        self._app = None
+        self._options: Dict[str, Any] = {}
+        self._refreshing = False
+
+    @staticmethod
+    def _key(field: str, value: str) -> str:
+        return f"{field}:{value.lower()}"
+
+    def init_app(self, app) -> None:
+        app.extensions['user_identity_filter'] = self
+        if not app.config.get('USER_BLOOM_ENABLED', False):
+            self.filter = None
+            return
+        self._app = app
+        self._options = {
+            'capacity': app.config.get('USER_BLOOM_CAPACITY', 1000000),
+            'error_rate': app.config.get('USER_BLOOM_ERROR_RATE', 0.01),
+            'max_bytes': app.config.get('USER_BLOOM_MAX_BYTES')
+        }
+        self.refresh_interval = app.config.get('USER_BLOOM_REFRESH_INTERVAL', 60)
+        with app.app_context():
+            try:
+                self.rebuild(**self._options)
+            except SQLAlchemyError as e:
+                logger.warning("User identity filter disabled: rebuild failed", extra={"error_details": str(e)})
+                self.filter = None
+
+    def rebuild(self, capacity: int, error_rate: float, max_bytes: Optional[int] = None, batch_size: int = 5000) -> None:
+        """Reconstruye el filtro recorriendo la tabla de usuarios en streaming"""
+        new_filter = BloomFilter(capacity, error_rate, max_bytes)
+        with self._lock:
+            self._pending = []
+        try:
+            rows = db.session.execute(
+                db.select(User.username, User.email).execution_options(yield_per=batch_size)
+            )
+            for username, email in rows:
+                new_filter.add(self._key('username', username))
+                new_filter.add(self._key('email', email))
+        finally:
+            with self._lock:
+                pending, self._pending = self._pending, None
+        for key in pending:
+            new_filter.add(key)
+
+        with self._lock:
+            self.filter = new_filter
+            self.built_at = time.monotonic()
+        if new_filter.count > capacity:
+            logger.warning("User identity filter over capacity", extra=new_filter.stats())
+
+    @property
+    def enabled(self) -> bool:
+        return self.filter is not None
+
+    @property
+    def stale(self) -> bool:
+        return self.refresh_interval is not None and time.monotonic() - self.built_at > self.refresh_interval
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing or self._app is None:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                with self._app.app_context():
+                    self.rebuild(**self._options)
+            except SQLAlchemyError as e:
+                logger.warning("User identity filter refresh failed", extra={"error_details": str(e)})
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=refresh, name='user-identity-filter', daemon=True).start()
+
+    def add(self, user: Dict[str, Any]) -> None:
+        keys = [self._key(field, user[field]) for field in self.LOOKUP_FIELDS if user.get(field)]
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(keys)
+            if self.filter is not None:
+                for key in keys:
+                    self.filter.add(key)
+
+    def might_exist(self, field: str, value: str) -> bool:
+        """False solo si la identidad no existe con seguridad"""
+        current = self.filter
+        if current is None or field not in self.LOOKUP_FIELDS:
+            return True
+        if self.stale:
+            # Un filtro antiguo no ve las altas de otros procesos: no se descarta nada hasta reconstruirlo
+            self._refresh_in_background()
+            return True
+        if self._key(field, value) in current:
+            return True
+        self.negative_hits += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        if self.filter is None:
+            return {'enabled': False}
+        return {
+            'enabled': True,
+            'negative_hits': self.negative_hits,
+            'age_seconds': round(time.monotonic() - self.built_at, 3),
+            **self.filter.stats()
+        }
@@ -0,0 +1,65 @@
+from typing import Any, Dict, Optional
+
+from .backends import CacheBackend, MemoryCacheBackend, SharedCacheBackend
+
+class UserCache:
+    """Caché de lectura de usuarios indexada por username y email"""
+    LOOKUP_FIELDS = ('username', 'email')
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend
+
+    def init_app(self, app) -> None:
+        backend = app.config.get('USER_CACHE_BACKEND', 'none')
+        ttl = app.config.get('USER_CACHE_TTL', 60)
+        if backend == 'memory':
+            self.backend = MemoryCacheBackend(
+                max_entries=app.config.get('USER_CACHE_MAX_ENTRIES', 10000),
+                ttl=ttl
+            )
+        elif backend == 'shared':
+            self.backend = SharedCacheBackend.from_url(app.config.get('USER_CACHE_URL', 'local://'), ttl=ttl)
+        elif backend == 'none':
+            self.backend = None
+        else:
+            raise ValueError(f"Unknown USER_CACHE_BACKEND: {backend}")
+        app.extensions['user_cache'] = self
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, key: str, value: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled or key not in self.LOOKUP_FIELDS:
+            return None
+        user = self.backend.get(f"{key}:{value}")
+        return dict(user) if user is not None else None
+
+    def set(self, user: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        for field in self.LOOKUP_FIELDS:
+            if user.get(field) is not None:
+                self.backend.set(f"{field}:{user[field]}", user)
+
+    def invalidate(self, key: str, value: str, user: Optional[Dict[str, Any]] = None) -> None:
+        """Elimina las entradas del usuario bajo todas sus claves de búsqueda"""
+        if not self.enabled:
+            return
+        keys = {f"{key}:{value}"}
+        if user is None:
+            user = self.backend.get(f"{key}:{value}")
+        if user is not None:
+            for field in self.LOOKUP_FIELDS:
+                if user.get(field) is not None:
+                    keys.add(f"{field}:{user[field]}")
+        self.backend.delete(*keys)
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.enabled:
+            return {'backend': 'none'}
+        return self.backend.stats()
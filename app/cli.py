@@ -0,0 +1,185 @@
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from . import create_app
+from .models import UserStatus
+
+def _read_checkpoint(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with path.open() as checkpoint_file:
+        return int(json.load(checkpoint_file).get('offset', 0))
+
+def _write_checkpoint(path: Path, progress) -> None:
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with tmp_path.open('w') as checkpoint_file:
+        json.dump({'offset': progress.offset, 'users_created': progress.users_created}, checkpoint_file)
+    os.replace(tmp_path, path)
+
+def import_ndjson(args) -> int:
+    """Importa un fichero NDJSON de usuarios con checkpoint reanudable"""
+    from .config import get_setting
+    from .importers import NDJSONImporter
+
+    app = create_app()
+    checkpoint_path = Path(args.checkpoint) if args.checkpoint else None
+    offset = args.offset
+    if offset is None:
+        offset = _read_checkpoint(checkpoint_path) if checkpoint_path else 0
+
+    def on_checkpoint(progress):
+        if checkpoint_path:
+            _write_checkpoint(checkpoint_path, progress)
+        print(
+            f"offset={progress.offset} lines={progress.lines_read} "
+            f"created={progress.users_created} failed={progress.failed}",
+            file=sys.stderr
+        )
+
+    with app.app_context():
+        importer = NDJSONImporter(
+            batch_size=args.batch_size or get_setting('IMPORT_BATCH_SIZE'),
+            max_errors=get_setting('IMPORT_MAX_ERRORS'),
+            on_checkpoint=on_checkpoint,
+            max_line_bytes=get_setting('MAX_JSON_BODY_BYTES')
+        )
+        with open(args.file, 'rb') as stream:
+            progress = importer.run(stream, offset=offset)
+
+    print(json.dumps(progress.to_dict(), ensure_ascii=False, default=str))
+    return 0 if not progress.failed else 1
+
+def run_migrations(args) -> int:
+    """Aplica las migraciones de esquema pendientes"""
+    from .config import db
+    from .migrations import MIGRATIONS, migrate, pending_migrations
+
+    app = create_app()
+    with app.app_context():
+        if args.list:
+            for migration in pending_migrations(db.engine, MIGRATIONS, args.target, args.include):
+                print(f"{migration.version:04d} {migration.name}")
+            return 0
+        applied = migrate(db.engine, MIGRATIONS, target=args.target, include_optional=args.include)
+
+    for migration in applied:
+        print(f"applied {migration.version:04d} {migration.name}")
+    return 0
+
+def bulk_status(args) -> int:
+    """Cambia el status de los usuarios de un fichero de identificadores o de un filtro"""
+    from .config import get_setting
+    from .controllers import UserController
+
+    if bool(args.ids_file) == bool(args.filter_status or args.email_domain):
+        print("Provide either --ids-file or --filter-status/--email-domain", file=sys.stderr)
+        return 2
+
+    identifiers = filters = None
+    if args.ids_file:
+        with open(args.ids_file) as ids_file:
+            values = list(dict.fromkeys(line.strip() for line in ids_file if line.strip()))
+        identifiers = {args.key: values}
+    else:
+        filters = {'statuses': args.filter_status, 'email_domain': args.email_domain.lstrip('@').lower() if args.email_domain else None}
+
+    app = create_app()
+    with app.app_context():
+        report = UserController.update_users_status_bulk(
+            args.status,
+            identifiers=identifiers,
+            filters=filters,
+            dry_run=args.dry_run,
+            chunk_size=args.chunk_size or get_setting('BULK_STATUS_CHUNK_SIZE')
+        )
+
+    print(json.dumps(report, ensure_ascii=False))
+    return 0
+
+def serve(args) -> int:
+    """Arranca la aplicación con el servidor de producción"""
+    from .server import build_options, serve as run_server, serve_config
+
+    options = build_options(
+        bind=args.bind,
+        workers=args.workers,
+        threads=args.threads,
+        keepalive=args.keepalive,
+        timeout=args.timeout,
+        graceful_timeout=args.graceful_timeout,
+        max_requests=args.max_requests,
+        preload=not args.no_preload
+    )
+    config = serve_config(options)
+    run_server(lambda: create_app(config), options, metrics_dir=config.METRICS_DIR)
+    return 0
+
+def serve_async(args) -> int:
+    """Arranca el modo asíncrono (ASGI) con uvicorn"""
+    from .aio import create_asgi_app
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise RuntimeError("uvicorn is required for 'serve-async'. Install the 'async' extra.")
+
+    host = args.host or os.getenv('FLASK_HOST', '0.0.0.0')
+    port = args.port or int(os.getenv('FLASK_PORT', 5000))
+    uvicorn.Server(uvicorn.Config(create_asgi_app(create_app()), host=host, port=port, lifespan='on')).run()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m app.cli')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import-ndjson', help='Import users and addresses from an NDJSON file')
+    import_parser.add_argument('file', help='Path to the NDJSON file')
+    import_parser.add_argument('--batch-size', type=int, default=None, help='Rows flushed per batch')
+    import_parser.add_argument('--checkpoint', default=None, help='Checkpoint file used to resume the import')
+    import_parser.add_argument('--offset', type=int, default=None, help='Byte offset to resume from (overrides checkpoint)')
+    import_parser.set_defaults(handler=import_ndjson)
+
+    migrate_parser = subparsers.add_parser('migrate', help='Apply pending schema migrations')
+    migrate_parser.add_argument('--target', type=int, default=None, help='Stop after this migration version')
+    migrate_parser.add_argument('--include', action='append', default=[], help='Optional migration to apply (e.g. compact-uuid)')
+    migrate_parser.add_argument('--list', action='store_true', help='Only list pending migrations')
+    migrate_parser.set_defaults(handler=run_migrations)
+
+    statuses = [status.value for status in UserStatus]
+    status_parser = subparsers.add_parser('bulk-status', help='Change the status of many users with chunked UPDATEs')
+    status_parser.add_argument('--status', required=True, choices=statuses, help='Target status')
+    status_parser.add_argument('--key', default='uuid', choices=['uuid', 'username', 'email'], help='Identifier type in --ids-file')
+    status_parser.add_argument('--ids-file', default=None, help='File with one identifier per line')
+    status_parser.add_argument('--filter-status', action='append', default=[], choices=statuses, help='Select users currently in this status')
+    status_parser.add_argument('--email-domain', default=None, help='Select users whose email belongs to this domain')
+    status_parser.add_argument('--chunk-size', type=int, default=None, help='Rows updated per statement (BULK_STATUS_CHUNK_SIZE)')
+    status_parser.add_argument('--dry-run', action='store_true', help='Only count the users that would change')
+    status_parser.set_defaults(handler=bulk_status)
+
+    serve_parser = subparsers.add_parser('serve', help='Run the production multi-worker server (gunicorn)')
+    serve_parser.add_argument('--bind', default=None, help='Address to bind (SERVER_BIND)')
+    serve_parser.add_argument('--workers', type=int, default=None, help='Worker processes (SERVER_WORKERS, default 2*cores+1)')
+    serve_parser.add_argument('--threads', type=int, default=None, help='Threads per worker (SERVER_THREADS)')
+    serve_parser.add_argument('--keepalive', type=int, default=None, help='Keep-alive seconds (SERVER_KEEPALIVE)')
+    serve_parser.add_argument('--timeout', type=int, default=None, help='Worker timeout seconds (SERVER_TIMEOUT)')
+    serve_parser.add_argument('--graceful-timeout', type=int, default=None, help='Graceful shutdown seconds (SERVER_GRACEFUL_TIMEOUT)')
+    serve_parser.add_argument('--max-requests', type=int, default=None, help='Recycle workers after N requests (SERVER_MAX_REQUESTS)')
+    serve_parser.add_argument('--no-preload', action='store_true', help='Load the app in each worker instead of the master')
+    serve_parser.set_defaults(handler=serve)
+
+    async_parser = subparsers.add_parser('serve-async', help='Run the async ASGI server (uvicorn)')
+    async_parser.add_argument('--host', default=None, help='Host to bind (FLASK_HOST)')
+    async_parser.add_argument('--port', type=int, default=None, help='Port to bind (FLASK_PORT)')
+    async_parser.set_defaults(handler=serve_async)
+
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 
-from .settings import Config, TestConfig
+from .database import TimedQueuePool, build_async_engine_options, build_engine_options, warm_pool
+from .routing import ReplicaSet, RoutingSession, use_primary, use_replica
+from .settings import Config, TestConfig, get_setting
 from .logging import setup_logging
 db = SQLAlchemy()
 
@@ -10,4 +12,7 @@ def init_app(app):
     db.init_app(app)
     return app
 
-__all__ = ['Config', 'db', 'init_app', 'setup_logging', 'TestConfig']
\ No newline at end of file
+__all__ = [
+    'build_async_engine_options', 'build_engine_options', 'Config', 'db', 'get_setting', 'init_app', 'ReplicaSet', 'RoutingSession',
+    'setup_logging', 'TestConfig', 'TimedQueuePool', 'use_primary', 'use_replica', 'warm_pool'
+]
\ No newline at end of file
@@ -0,0 +1,89 @@
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+def _env_number(name: str, default: Any, minimum: float, cast=int):
+    raw = os.getenv(name, default)
+    try:
+        value = cast(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, got '{raw}'")
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}, got {value}")
+    return value
+
+class TimedQueuePool(QueuePool):
+    """QueuePool que notifica a sus `wait_observers` los segundos que esperó cada checkout.
+
+    Ningún evento del pool se emite antes de esperar una conexión, así que la
+    medida se hace en el propio pool; `recreate()` tras `dispose()` conserva la
+    clase y los observadores.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_observers: List[Callable[[float], None]] = []
+
+    def recreate(self) -> 'TimedQueuePool':
+        pool = super().recreate()
+        pool.wait_observers = self.wait_observers
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            for observer in self.wait_observers:
+                observer(waited)
+
+def build_engine_options(uri: Optional[str], threads: Optional[int] = None) -> Dict[str, Any]:
+    """Opciones de `create_engine` a partir de las variables DB_POOL_*.
+
+    El pool se dimensiona por worker: por defecto una conexión por hilo
+    (`threads` o SERVER_THREADS). SQLite no admite pool_size/max_overflow/pool_timeout.
+    """
+    options = {'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'False') == 'True'}
+    if uri and make_url(uri).get_backend_name() == 'sqlite':
+        return options
+
+    pool_recycle = _env_number('DB_POOL_RECYCLE', 1800, -1)
+    if pool_recycle == 0:
+        raise ValueError("DB_POOL_RECYCLE must be -1 (disabled) or a positive number of seconds")
+    options.update({
+        'poolclass': TimedQueuePool,
+        'pool_size': _env_number('DB_POOL_SIZE', threads or os.getenv('SERVER_THREADS', 4), 1),
+        'max_overflow': _env_number('DB_MAX_OVERFLOW', 2, 0),
+        'pool_timeout': _env_number('DB_POOL_TIMEOUT', 30, 0, float),
+        'pool_recycle': pool_recycle
+    })
+    return options
+
+def build_async_engine_options(uri: Optional[str], pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    """Opciones de `create_async_engine`: las de DB_POOL_* con el pool propio del modo asíncrono.
+
+    Un worker asíncrono atiende muchas peticiones a la vez, no una por hilo, y
+    TimedQueuePool no es compatible con asyncio: se usa el pool por defecto del engine.
+    """
+    options = build_engine_options(uri)
+    options.pop('poolclass', None)
+    if 'pool_size' in options:
+        options.update({'pool_size': pool_size, 'max_overflow': max_overflow})
+    return options
+
+def warm_pool(engine: Engine, count: int) -> int:
+    """Abre hasta `count` conexiones a la vez (sin superar pool_size) y las deja en el pool"""
+    if count <= 0:
+        return 0
+    size = engine.pool.size() if hasattr(engine.pool, 'size') else count
+    connections = []
+    try:
+        for _ in range(min(count, size)):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
@@ -0,0 +1,168 @@
+import atexit
+import copy
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from typing import Iterable, List
+
+DROP = 'drop'
+BLOCK = 'block'
+QUEUE_POLICIES = (DROP, BLOCK)
+
+class DeferredFlushMixin:
+    """Permite al escritor en segundo plano agrupar varias escrituras en un único flush"""
+    _deferring = False
+
+    def flush(self):
+        if not self._deferring:
+            super().flush()
+
+    def handle_batch(self, records: Iterable[logging.LogRecord]) -> None:
+        self._deferring = True
+        try:
+            for record in records:
+                if record.levelno >= self.level:
+                    self.handle(record)
+        finally:
+            self._deferring = False
+            self.flush()
+
+class BatchStreamHandler(DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+class BatchRotatingFileHandler(DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Encola los registros en una cola acotada; con la cola llena descarta o espera según `policy`"""
+    def __init__(self, log_queue: queue.Queue, policy: str = DROP):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Invalid log queue policy '{policy}'. Expected one of: {', '.join(QUEUE_POLICIES)}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self._lock_dropped = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Solo se fija el mensaje; el formateo (JSON, traceback) se hace en el hilo escritor
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self.dropped += 1
+
+    def take_dropped(self) -> int:
+        with self._lock_dropped:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class BatchingQueueListener:
+    """Hilo escritor que vacía la cola en lotes de hasta `batch_size` registros"""
+    _sentinel = None
+
+    def __init__(self, queue_handler: BoundedQueueHandler, handlers: List[logging.Handler], batch_size: int = 100):
+        self.queue_handler = queue_handler
+        self.queue = queue_handler.queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.dropped_total = 0
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Escribe lo pendiente y detiene el hilo"""
+        if self._thread is None:
+            return
+        self.queue.put(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+    def restart_after_fork(self) -> None:
+        """Los hilos no sobreviven a fork: el proceso hijo necesita su propia cola y escritor"""
+        if self._thread is None:
+            return
+        self.queue = self.queue_handler.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self.queue_handler._lock_dropped = threading.Lock()
+        self.start()
+
+    def _next_batch(self) -> List[logging.LogRecord]:
+        batch = [self.queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not self._sentinel:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            stopping = batch[-1] is self._sentinel
+            records = [record for record in batch if record is not self._sentinel]
+            dropped = self.queue_handler.take_dropped()
+            if dropped:
+                self.dropped_total += dropped
+                records.append(logging.makeLogRecord({
+                    'name': 'app.logging',
+                    'levelno': logging.WARNING,
+                    'levelname': 'WARNING',
+                    'msg': f"{dropped} log records dropped (log queue full)",
+                    'dropped_records': dropped
+                }))
+            self._write(records)
+            if stopping:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        if not records:
+            return
+        for handler in self.handlers:
+            try:
+                if isinstance(handler, DeferredFlushMixin):
+                    handler.handle_batch(records)
+                else:
+                    for record in records:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            except Exception:
+                handler.handleError(records[-1])
+
+
+_listeners: List[BatchingQueueListener] = []
+
+def stop_log_listeners() -> None:
+    while _listeners:
+        _listeners.pop().stop()
+
+def _restart_listeners_after_fork() -> None:
+    for listener in _listeners:
+        listener.restart_after_fork()
+
+atexit.register(stop_log_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+def make_async(logger: logging.Logger, queue_size: int, policy: str, batch_size: int) -> BatchingQueueListener:
+    """Sustituye los handlers del logger por una cola acotada atendida por un hilo escritor"""
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), policy)
+    listener = BatchingQueueListener(queue_handler, list(logger.handlers), batch_size)
+    logger.handlers = [queue_handler]
+    listener.start()
+    _listeners.append(listener)
+    return listener
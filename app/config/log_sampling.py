@@ -0,0 +1,123 @@
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+def parse_sample_ratios(value: str) -> Dict[int, float]:
+    """Convierte 'WARNING=0.1,ERROR=1' en {logging.WARNING: 0.1, logging.ERROR: 1.0}"""
+    ratios = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        level_name, _, ratio = item.partition('=')
+        level = logging.getLevelName(level_name.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Invalid log level '{level_name}' in sample ratios")
+        ratios[level] = float(ratio)
+    return ratios
+
+
+class _Bucket:
+    __slots__ = ('tokens', 'updated', 'suppressed')
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.suppressed = 0
+
+
+class RateLimitFilter(logging.Filter):
+    """Limita eventos repetidos por (exception_type, endpoint) con un token bucket.
+
+    Los registros que superan el límite o quedan fuera del muestreo por nivel se
+    descartan y se cuentan; cada `summary_interval` segundos se emite un resumen
+    "N similar events suppressed" por clave. Los resúmenes se generan al llegar
+    nuevos registros, no con un temporizador propio.
+    """
+    def __init__(self,
+            rate: float = 1.0,
+            burst: int = 20,
+            sample_ratios: Optional[Dict[int, float]] = None,
+            summary_interval: float = 60,
+            max_keys: int = 1000):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.sample_ratios = sample_ratios or {}
+        self.summary_interval = summary_interval
+        self.max_keys = max_keys
+        self._buckets: 'OrderedDict[Hashable, _Bucket]' = OrderedDict()
+        self._evicted_suppressed = 0
+        self._lock = threading.Lock()
+        self._last_summary = time.monotonic()
+
+    @staticmethod
+    def event_key(record: logging.LogRecord) -> Tuple[str, Optional[str]]:
+        attributes = record.__dict__
+        exception_type = attributes.get('exception_type') or attributes.get('error_type') or record.levelname
+        endpoint = attributes.get('request_endpoint', attributes.get('endpoint'))
+        return exception_type, endpoint
+
+    def _sampled_out(self, levelno: int) -> bool:
+        ratio = self.sample_ratios.get(levelno, 1.0)
+        return ratio < 1.0 and random.random() >= ratio
+
+    def _bucket(self, key: Hashable, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.burst, now)
+            if len(self._buckets) > self.max_keys:
+                _, evicted = self._buckets.popitem(last=False)
+                self._evicted_suppressed += evicted.suppressed
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+        return bucket
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.__dict__.get('log_summary'):
+            return True
+
+        key = self.event_key(record)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(key, now)
+            if self._sampled_out(record.levelno) or bucket.tokens < 1:
+                bucket.suppressed += 1
+                allowed = False
+            else:
+                bucket.tokens -= 1
+                allowed = True
+            summaries = self._take_summaries(now)
+
+        for summary_key, suppressed in summaries:
+            self._emit_summary(record, summary_key, suppressed)
+        return allowed
+
+    def _take_summaries(self, now: float) -> List[Tuple[Tuple[str, Optional[str]], int]]:
+        if now - self._last_summary < self.summary_interval:
+            return []
+        self._last_summary = now
+        summaries = []
+        for key, bucket in self._buckets.items():
+            if bucket.suppressed:
+                summaries.append((key, bucket.suppressed))
+                bucket.suppressed = 0
+        if self._evicted_suppressed:
+            summaries.append((('*', None), self._evicted_suppressed))
+            self._evicted_suppressed = 0
+        return summaries
+
+    def _emit_summary(self, record: logging.LogRecord, key: Tuple[str, Optional[str]], suppressed: int) -> None:
+        exception_type, endpoint = key
+        logging.getLogger(record.name).warning(
+            f"{suppressed} similar events suppressed: {exception_type} at {endpoint}",
+            extra={
+                'log_summary': True,
+                'suppressed_events': suppressed,
+                'exception_type': exception_type,
+                'request_endpoint': endpoint,
+                'summary_interval': self.summary_interval
+            }
+        )
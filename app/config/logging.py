@@ -1,7 +1,48 @@
 import json
 import logging
 import logging.config
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 from pathlib import Path
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+from ..utils.log_records import RESERVED_RECORD_ATTRS
+from .log_queue import make_async, stop_log_listeners
+from .log_sampling import RateLimitFilter, parse_sample_ratios
+from .settings import Config
+
+# Campos de excepción que se emiten en posición fija, justo después de los campos base
+PROMOTED_FIELDS = ('exception_type', 'error_message', 'status_code', 'details')
+
+EXCLUDED_FIELDS = RESERVED_RECORD_ATTRS | frozenset(PROMOTED_FIELDS) | {'timestamp'}
+
+_MISSING = object()
+
+def _json_default(value):
+    """Serialización de tipos no nativos de JSON"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # Un log nunca debe fallar por un valor desconocido
+    return repr(value)
+
+if orjson is not None:
+    def dumps_log(data) -> str:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def dumps_log(data) -> str:
+        return json.dumps(data, ensure_ascii=False, default=_json_default)
 
 class CustomJSONFormatter(logging.Formatter):
     """Formatter personalizado para generar logs en formato JSON"""
@@ -12,32 +53,21 @@ class CustomJSONFormatter(logging.Formatter):
             'level': record.levelname,
             'message': record.getMessage(),
         }
-        
-        if hasattr(record, 'exception_type'):
-            log_data['exception_type'] = record.exception_type
-        if hasattr(record, 'error_message'):
-            log_data['error_message'] = record.error_message
-        if hasattr(record, 'status_code'):
-            log_data['status_code'] = record.status_code
-        if hasattr(record, 'details'):
-            log_data['details'] = record.details
-        if hasattr(record, 'timestamp') and record.timestamp != log_data['timestamp']:
-            log_data['exception_timestamp'] = record.timestamp
-            
-        excluded_fields = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-            'filename', 'module', 'lineno', 'funcName', 'created', 
-            'msecs', 'relativeCreated', 'thread', 'threadName', 
-            'processName', 'process', 'message', 'exc_info', 'exc_text', 
-            'stack_info', 'getMessage', 'exception_type', 'error_message', 
-            'status_code', 'details', 'timestamp'
-        }
-        
-        for key, value in record.__dict__.items():
-            if key not in excluded_fields and not key.startswith('_'):
+
+        attributes = record.__dict__
+        for field in PROMOTED_FIELDS:
+            value = attributes.get(field, _MISSING)
+            if value is not _MISSING:
+                log_data[field] = value
+        exception_timestamp = attributes.get('timestamp', _MISSING)
+        if exception_timestamp is not _MISSING and exception_timestamp != log_data['timestamp']:
+            log_data['exception_timestamp'] = exception_timestamp
+
+        for key, value in attributes.items():
+            if key not in EXCLUDED_FIELDS and key[0] != '_':
                 log_data[key] = value
-        
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+        return dumps_log(log_data)
 
 def setup_logging(app):
     """Configura el sistema de logging"""
@@ -57,13 +87,13 @@ def setup_logging(app):
         },
         'handlers': {
             'console': {
-                'class': 'logging.StreamHandler',
+                'class': 'app.config.log_queue.BatchStreamHandler',
                 'level': 'INFO',
                 'formatter': 'detailed',
                 'stream': 'ext://sys.stdout'
             },
             'file_error': {
-                'class': 'logging.handlers.RotatingFileHandler',
+                'class': 'app.config.log_queue.BatchRotatingFileHandler',
                 'level': 'WARNING',
                 'formatter': 'json',
                 'filename': 'logs/errors.log',
@@ -71,7 +101,7 @@ def setup_logging(app):
                 'backupCount': 5
             },
             'file_app': {
-                'class': 'logging.handlers.RotatingFileHandler',
+                'class': 'app.config.log_queue.BatchRotatingFileHandler',
                 'level': 'INFO',
                 'formatter': 'json',
                 'filename': 'logs/app.log',
@@ -96,5 +126,32 @@ def setup_logging(app):
             'handlers': ['console']
         }
     }
-    
-    logging.config.dictConfig(LOGGING_CONFIG)
\ No newline at end of file
+
+    def setting(name):
+        return app.config.get(name, getattr(Config, name))
+
+    if setting('LOG_RATE_LIMIT_ENABLED'):
+        LOGGING_CONFIG['filters'] = {
+            'error_rate_limit': {
+                '()': RateLimitFilter,
+                'rate': setting('LOG_RATE_LIMIT_PER_SECOND'),
+                'burst': setting('LOG_RATE_LIMIT_BURST'),
+                'sample_ratios': parse_sample_ratios(setting('LOG_SAMPLE_RATIOS')),
+                'summary_interval': setting('LOG_SUMMARY_INTERVAL'),
+                'max_keys': setting('LOG_RATE_LIMIT_MAX_KEYS')
+            }
+        }
+        LOGGING_CONFIG['loggers']['app.errors']['filters'] = ['error_rate_limit']
+
+    # Los escritores anteriores deben vaciarse antes de que dictConfig cierre sus handlers
+    stop_log_listeners()
+    logging.config.dictConfig(LOGGING_CONFIG)
+
+    if setting('LOG_ASYNC'):
+        for name in ('app.errors', 'app', None):
+            make_async(
+                logging.getLogger(name),
+                queue_size=setting('LOG_QUEUE_SIZE'),
+                policy=setting('LOG_QUEUE_POLICY'),
+                batch_size=setting('LOG_BATCH_SIZE')
+            )
\ No newline at end of file
@@ -0,0 +1,99 @@
+import itertools
+import threading
+from functools import wraps
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .database import build_engine_options
+
+ROUND_ROBIN = 'round_robin'
+LEAST_CONNECTIONS = 'least_connections'
+REPLICA_STRATEGIES = (ROUND_ROBIN, LEAST_CONNECTIONS)
+
+class ReplicaSet:
+    """Engines de las réplicas de lectura y la estrategia para elegir una"""
+    def __init__(self, engines: Optional[List[Engine]] = None, strategy: str = ROUND_ROBIN):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Invalid replica strategy '{strategy}'. Expected one of: {', '.join(REPLICA_STRATEGIES)}")
+        self.engines = engines or []
+        self.strategy = strategy
+        self._cycle = itertools.cycle(self.engines)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_uris(cls, uris: str, strategy: str = ROUND_ROBIN, threads: Optional[int] = None) -> 'ReplicaSet':
+        """Crea un engine por URI (separadas por comas) con las mismas opciones de pool que el primario"""
+        engines = [
+            create_engine(uri, **build_engine_options(uri, threads))
+            for uri in filter(None, (part.strip() for part in (uris or '').split(',')))
+        ]
+        return cls(engines, strategy)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Engine:
+        if self.strategy == LEAST_CONNECTIONS:
+            return min(self.engines, key=lambda engine: getattr(engine.pool, 'checkedout', lambda: 0)())
+        with self._lock:
+            return next(self._cycle)
+
+    def dispose(self, close: bool = True) -> None:
+        for engine in self.engines:
+            engine.dispose(close=close)
+
+
+class RoutingSession(Session):
+    """Sesión que envía las lecturas marcadas con `use_replica` a una réplica.
+
+    Cualquier escritura (flush o sentencia DML) fija la sesión al primario hasta
+    que se cierre, de modo que las lecturas posteriores de la misma petición ven
+    sus propios cambios. Cada sesión usa siempre la misma réplica.
+    """
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas or ReplicaSet()
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or (clause is not None and getattr(clause, 'is_dml', False)):
+            self.info['primary'] = True
+        elif (self.replicas and self.info.get('read_only') and not self.info.get('primary')
+                and clause is not None and getattr(clause, 'is_select', False)):
+            if 'replica' not in self.info:
+                self.info['replica'] = self.replicas.choose()
+            return self.info['replica']
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        for key in ('primary', 'replica', 'read_only'):
+            self.info.pop(key, None)
+
+
+def use_replica(database: Any) -> Callable:
+    """Marca un método de solo lectura: sus SELECT en `database.session` pueden ir a una réplica"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            info = database.session.info
+            previous = info.get('read_only', False)
+            info['read_only'] = True
+            try:
+                return f(*args, **kwargs)
+            finally:
+                info['read_only'] = previous
+        return wrapper
+    return decorator
+
+def use_primary(database: Any) -> Callable:
+    """Fija la sesión al primario: para escrituras que antes leen (p. ej. comprobar que el usuario existe)"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            database.session.info['primary'] = True
+            return f(*args, **kwargs)
+        return wrapper
+    return decorator
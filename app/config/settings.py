@@ -1,20 +1,99 @@
 import os
 from dotenv import load_dotenv
+from flask import current_app, has_app_context
+
+from .database import _env_number, build_engine_options
 
 load_dotenv()
 
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DB_URI')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 10,
-        'max_overflow': 5,
-        'pool_timeout': 30,
-        'pool_recycle': 20,
-        'pool_pre_ping': True
-    }
+    # Pool por worker: DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(SQLALCHEMY_DATABASE_URI)
+    # Réplicas de lectura (URIs separadas por comas) y estrategia: round_robin o least_connections
+    DB_REPLICA_URIS = os.getenv('DB_REPLICA_URIS', '')
+    DB_REPLICA_STRATEGY = os.getenv('DB_REPLICA_STRATEGY', 'round_robin')
+    # Conexiones que cada worker abre al arrancar
+    DB_POOL_WARMUP = _env_number('DB_POOL_WARMUP', 0, 0)
+    # URI del modo asíncrono (serve-async); por defecto DB_URI con el driver asíncrono equivalente
+    ASYNC_DB_URI = os.getenv('ASYNC_DB_URI')
+    # Pool del modo asíncrono: un solo proceso atiende muchas peticiones concurrentes
+    ASYNC_DB_POOL_SIZE = _env_number('ASYNC_DB_POOL_SIZE', 20, 1)
+    ASYNC_DB_MAX_OVERFLOW = _env_number('ASYNC_DB_MAX_OVERFLOW', 10, 0)
+
+    # Almacenamiento de UUID: string (CHAR 36) o binary (BINARY 16)
+    UUID_STORAGE = os.getenv('UUID_STORAGE', 'string')
+
+    # Instrumentación por petición (cabecera Server-Timing y log de tiempos)
+    REQUEST_INSTRUMENTATION = os.getenv('REQUEST_INSTRUMENTATION', 'False') == 'True'
+
+    # Métricas Prometheus en /metrics; METRICS_DIR comparte los datos entre workers
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+    METRICS_DIR = os.getenv('METRICS_DIR')
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 1.0))
+
+    # Logging asíncrono: cola acotada con política drop (descartar) o block (esperar)
+    LOG_ASYNC = os.getenv('LOG_ASYNC', 'True') == 'True'
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+    LOG_QUEUE_POLICY = os.getenv('LOG_QUEUE_POLICY', 'drop')
+    LOG_BATCH_SIZE = int(os.getenv('LOG_BATCH_SIZE', 100))
+
+    # Limitación de logs de error repetidos por (exception_type, endpoint)
+    LOG_RATE_LIMIT_ENABLED = os.getenv('LOG_RATE_LIMIT_ENABLED', 'True') == 'True'
+    LOG_RATE_LIMIT_PER_SECOND = float(os.getenv('LOG_RATE_LIMIT_PER_SECOND', 1))
+    LOG_RATE_LIMIT_BURST = int(os.getenv('LOG_RATE_LIMIT_BURST', 20))
+    LOG_RATE_LIMIT_MAX_KEYS = int(os.getenv('LOG_RATE_LIMIT_MAX_KEYS', 1000))
+    LOG_SUMMARY_INTERVAL = float(os.getenv('LOG_SUMMARY_INTERVAL', 60))
+    LOG_SAMPLE_RATIOS = os.getenv('LOG_SAMPLE_RATIOS', 'WARNING=1.0,ERROR=1.0,CRITICAL=1.0')
+
+    # Tamaño máximo de los body JSON (bytes); los masivos se leen por trozos
+    MAX_JSON_BODY_BYTES = int(os.getenv('MAX_JSON_BODY_BYTES', 1024 * 1024))
+    MAX_BULK_BODY_BYTES = int(os.getenv('MAX_BULK_BODY_BYTES', 64 * 1024 * 1024))
+    BODY_STREAM_CHUNK_SIZE = int(os.getenv('BODY_STREAM_CHUNK_SIZE', 64 * 1024))
+
+    # Proveedor JSON de Flask: auto (orjson si está instalado), orjson o default
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'auto')
+
+    # Operaciones masivas
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 10000))
+    BULK_INSERT_CHUNK_SIZE = int(os.getenv('BULK_INSERT_CHUNK_SIZE', 1000))
+    BULK_STATUS_CHUNK_SIZE = int(os.getenv('BULK_STATUS_CHUNK_SIZE', 1000))
+    IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 500))
+    IMPORT_MAX_ERRORS = int(os.getenv('IMPORT_MAX_ERRORS', 100))
+
+    # Caché de usuarios: memory, shared o none
+    USER_CACHE_BACKEND = os.getenv('USER_CACHE_BACKEND', 'memory')
+    USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 60))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', 10000))
+    USER_CACHE_URL = os.getenv('USER_CACHE_URL', 'local://')
+
+    # Filtro de Bloom de identidades inexistentes
+    USER_BLOOM_ENABLED = os.getenv('USER_BLOOM_ENABLED', 'False') == 'True'
+    USER_BLOOM_CAPACITY = int(os.getenv('USER_BLOOM_CAPACITY', 1000000))
+    USER_BLOOM_ERROR_RATE = float(os.getenv('USER_BLOOM_ERROR_RATE', 0.01))
+    USER_BLOOM_MAX_BYTES = int(os.getenv('USER_BLOOM_MAX_BYTES', 8 * 1024 * 1024))
+    # Segundos tras los que el filtro deja de descartar búsquedas y se reconstruye
+    # (las altas de otros workers o de la CLI solo se ven tras reconstruirlo)
+    USER_BLOOM_REFRESH_INTERVAL = float(os.getenv('USER_BLOOM_REFRESH_INTERVAL', 60))
+
+    # Búsqueda por lotes (POST /api/users/lookup)
+    USERS_LOOKUP_MAX_KEYS = int(os.getenv('USERS_LOOKUP_MAX_KEYS', 1000))
+    USERS_LOOKUP_CHUNK_SIZE = int(os.getenv('USERS_LOOKUP_CHUNK_SIZE', 500))
+
+    # Paginación
+    USERS_PAGE_SIZE = int(os.getenv('USERS_PAGE_SIZE', 20))
+    USERS_PAGE_MAX_SIZE = int(os.getenv('USERS_PAGE_MAX_SIZE', 100))
 
 class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    USER_CACHE_BACKEND = 'none'
+
+def get_setting(name: str):
+    """Devuelve un valor de configuración de la app activa o el valor por defecto de Config"""
+    if has_app_context():
+        return current_app.config.get(name, getattr(Config, name))
+    return getattr(Config, name)
@@ -3,11 +3,13 @@ ERROR_MESSAGES = {
     'USER_NOT_FOUND': "User with {field} = '{value}' not found",
     'USER_EXISTS': "User with {field} '{value}' already exists",
     'USER_INVALID_DATA_UPDATE': "No fields to update for {field}: {value}",
+    'USER_PRECONDITION_FAILED': "User with {field} = '{value}' has been modified. Fetch it again and retry",
     
     # Errores de query_params
     'MISSING_PARAMETER': "Missing query parameter. You must provide one of: {params}",
     'TOO_MANY_PARAMETERS': "Too many parameters. Only one is allowed: {params}",
     'INVALID_PARAMETER': "Invalid parameter '{param}'. Allowed: {params}",
+    'INVALID_PARAMETER_VALUE': "Invalid value '{value}' for parameter '{param}'. Expected: {expected}",
     
     # Errores de request body
     'MISSING_JSON_BODY': "Missing JSON body",
@@ -16,6 +18,11 @@ ERROR_MESSAGES = {
     'VALUE_CANT_BE_NULL': "Some fields cannot be null",
     'SCHEMA_VALIDATION_ERROR': "Request data validation failed",
     'FIELD_VALIDATION_ERROR': "Field '{field}' validation failed: {message}",
+    'BULK_BODY_NOT_A_LIST': "Bulk request body must be a non-empty JSON array",
+    'BULK_LIMIT_EXCEEDED': "Too many items in bulk request: {count}. Maximum allowed: {limit}",
+    'REQUEST_BODY_TOO_LARGE': "Request body too large: {size} bytes. Maximum allowed: {limit} bytes",
+    'BULK_ITEM_TOO_LARGE': "Bulk request item too large: more than {limit} bytes",
+    'IMPORT_LINE_TOO_LARGE': "Import line too large: more than {limit} bytes",
     
     # Errores HTTP
     'NOT_FOUND': "The requested resource was not found",
@@ -1,40 +1,93 @@
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Any, Optional, Dict, Union
+from typing import Any, Optional, Dict, List, Tuple, Union
 from uuid import uuid4
 
-from ..exceptions import DatabaseException
-from ..models import db, Address, User
+from ..cache import user_identity_filter
+from ..config import use_primary, use_replica
+from ..exceptions import DatabaseException, UserNotFoundException
+from ..models import db, Address, User, USER_FIELDS
+from ..serialization import serializer_for
 from .users import UserController
 
+ADDRESS_FIELDS = ('street', 'number', 'city', 'state', 'country', 'instructions')
+
 class AddressController:
 
     @staticmethod
-    def get_user_address(key: str, value: str) -> Optional[Dict[str, Union[str, None]]]:
-        try:
-            user = db.session.execute(
-                db.select(User).filter_by(**{key: value})
-            ).scalar_one_or_none()
+    def _fetch_user_with_addresses(
+            key: str,
+            value: str,
+            user_fields: Tuple[str, ...],
+            address_fields: Tuple[str, ...] = ADDRESS_FIELDS) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Obtiene las columnas pedidas del usuario y de sus direcciones en una sola consulta (LEFT OUTER JOIN)"""
+        if not user_identity_filter.might_exist(key, value):
+            raise UserNotFoundException(field=key, value=value)
+
+        rows = db.session.execute(
+            AddressController._user_with_addresses_query(key, value, user_fields, address_fields)
+        ).all()
+        return AddressController._split_user_rows(key, value, rows, user_fields, address_fields)
+
+    @staticmethod
+    def _user_with_addresses_query(key: str, value: str, user_fields: Tuple[str, ...], address_fields: Tuple[str, ...]):
+        return (
+            db.select(
+                *(getattr(User, field) for field in user_fields),
+                Address.uuid,
+                *(getattr(Address, field) for field in address_fields)
+            )
+            .outerjoin(Address, Address.user_uuid == User.uuid)
+            .where(getattr(User, key) == value)
+        )
 
-            addresses = db.session.execute(
-                db.select(Address)
-                .join(User, Address.user_uuid == User.uuid)
-                .where(Address.user_uuid == user.uuid)
-            ).scalars().all()
+    @staticmethod
+    def _split_user_rows(
+            key: str,
+            value: str,
+            rows: List[Any],
+            user_fields: Tuple[str, ...],
+            address_fields: Tuple[str, ...]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        if not rows:
+            raise UserNotFoundException(field=key, value=value)
+
+        # Address.uuid separa las columnas del usuario de las de la dirección y marca las filas sin dirección
+        marker = len(user_fields)
+        user = dict(zip(user_fields, rows[0][:marker]))
+        addresses = [dict(zip(address_fields, row[marker + 1:])) for row in rows if row[marker] is not None]
+        return user, addresses
+
+    @staticmethod
+    def _address_to_dict(address: Address) -> Dict[str, Union[str, int, None]]:
+        return serializer_for(Address, ADDRESS_FIELDS)(address)
+
+    @staticmethod
+    @use_replica(db)
+    def get_user_address(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Union[str, None]]]:
+        try:
+            user, addresses = AddressController._fetch_user_with_addresses(
+                key, value, ('username',), fields or ADDRESS_FIELDS
+            )
             return {
                 'metadata': {
-                    'username': user.username,
+                    'username': user['username'],
                     'length': len(addresses)
                 },
-                'addresses': [
-                    {
-                        'street': addr.street,
-                        'number': addr.number,
-                        'city': addr.city,
-                        'state': addr.state,
-                        'country': addr.country,
-                        'instructions': addr.instructions
-                    } for addr in addresses
-                ]
+                'addresses': addresses
+            }
+
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+    @staticmethod
+    @use_replica(db)
+    def get_user_with_addresses(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Datos del usuario junto con sus direcciones, para GET /api/users/?include=addresses"""
+        try:
+            user, addresses = AddressController._fetch_user_with_addresses(key, value, fields or USER_FIELDS)
+            return {
+                **user,
+                'addresses': addresses
             }
 
         except SQLAlchemyError as e:
@@ -42,6 +95,7 @@ class AddressController:
             raise DatabaseException(original_error=str(e))
         
     @staticmethod
+    @use_primary(db)
     def create_address(key: str, value: str, address_data: Dict[str, Any]) -> Optional[Dict[str, Union[str, None]]]:
         try:
             user = UserController.get_user(key, value)
@@ -61,14 +115,9 @@ class AddressController:
             db.session.commit()
             return {
                 'username': user['username'],
-                'street': new_address.street,
-                'number': new_address.number,
-                'city': new_address.city,
-                'state': new_address.state,
-                'country': new_address.country,
-                'instructions': new_address.instructions
+                **AddressController._address_to_dict(new_address)
             }
         
         except SQLAlchemyError as e:
             db.session.rollback()
-            raise DatabaseException(original_error=str(e))
\ No newline at end of file
+            raise DatabaseException(original_error=str(e))
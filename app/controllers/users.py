@@ -1,13 +1,33 @@
+from sqlalchemy import and_, false, func, or_
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from typing import Any, Optional, Dict, Union
-from uuid import uuid4
+from typing import Any, Optional, Dict, List, Tuple, Union
+from uuid import UUID, uuid4
+from werkzeug.datastructures import ETags
 
-from ..exceptions import UserNotFoundException, UserAlreadyExistsException, InvalidUserDataException, DatabaseException
-from ..models import db, User
+from ..cache import user_cache, user_identity_filter
+from ..config import use_replica
+from ..exceptions import UserNotFoundException, UserAlreadyExistsException, UserPreconditionFailedException, InvalidUserDataException, DatabaseException
+from ..models import db, User, USER_FIELDS, UserStatus, Address
+from ..serialization import rows_to_dicts
+from ..utils import chunked, encode_cursor, user_etag
+
+# Columnas que devuelven los UPDATE de un solo usuario (ETag e invalidación de caché)
+UPDATE_RETURNING_COLUMNS = (User.uuid, User.username, User.email, User.version)
+
+def build_username(first_name: str, last_name: str) -> str:
+    return f"{first_name}{last_name}".lower()
 
 class UserController:
     @staticmethod
-    def get_user(key: str, value: str) -> Optional[Dict[str, Union[str, None]]]:
+    @use_replica(db)
+    def get_user(key: str, value: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Union[str, None]]]:
+        cached_user = user_cache.get(key, value)
+        if cached_user is not None:
+            return {field: cached_user[field] for field in fields} if fields else cached_user
+        if not user_identity_filter.might_exist(key, value):
+            raise UserNotFoundException(field=key, value=value)
+        if fields:
+            return UserController._get_user_fields(key, value, fields)
         try:
             user = db.session.execute(
                 db.select(User).filter_by(**{key: value})
@@ -15,17 +35,131 @@ class UserController:
             if not user:
                 raise UserNotFoundException(field=key, value=value)
             
-            if user:
-                return {
-                    'uuid': user.uuid,
-                    'first_name': user.first_name,
-                    'middle_name': user.middle_name,
-                    'last_name': user.last_name,
-                    'username': user.username,
-                    'status': user.status,
-                    'email': user.email,
-                    'phone': user.phone
-                }
+            response = user.to_dict()
+            # Una réplica puede ir por detrás del primario: sus lecturas no se guardan en caché
+            if 'replica' not in db.session.info:
+                user_cache.set(response)
+            return response
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+    @staticmethod
+    def _get_user_fields(key: str, value: str, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Consulta solo las columnas pedidas, sin instanciar el modelo (no se guarda en caché)"""
+        try:
+            row = db.session.execute(
+                db.select(*(getattr(User, field) for field in fields)).where(getattr(User, key) == value)
+            ).first()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+        if row is None:
+            raise UserNotFoundException(field=key, value=value)
+        return dict(zip(fields, row))
+
+    @staticmethod
+    @use_replica(db)
+    def lookup_users(
+            usernames: List[str],
+            emails: List[str],
+            chunk_size: int = 500,
+            fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Resuelve varios usernames/emails con consultas `username IN (...) OR email IN (...)` por lotes"""
+        requested = [('username', value) for value in usernames] + [('email', value) for value in emails]
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        pending = []
+        for key, value in requested:
+            cached_user = user_cache.get(key, value)
+            if cached_user is not None:
+                found[(key, value)] = cached_user
+            elif user_identity_filter.might_exist(key, value):
+                pending.append((key, value))
+
+        keys = USER_FIELDS
+        try:
+            for chunk in chunked(pending, chunk_size):
+                chunk_usernames = [value for key, value in chunk if key == 'username']
+                chunk_emails = [value for key, value in chunk if key == 'email']
+                rows = db.session.execute(
+                    db.select(*(getattr(User, key) for key in keys)).where(or_(
+                        User.username.in_(chunk_usernames),
+                        User.email.in_(chunk_emails)
+                    ))
+                ).all()
+                from_replica = 'replica' in db.session.info
+                for user in rows_to_dicts(keys, rows):
+                    if not from_replica:
+                        user_cache.set(user)
+                    found[('username', user['username'])] = user
+                    found[('email', user['email'])] = user
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise DatabaseException(original_error=str(e))
+
+        response = {
+            'metadata': {'requested': len(requested), 'found': 0, 'missing': 0},
+            'found': {'usernames': {}, 'emails': {}},
+            'missing': {'usernames': [], 'emails': []}
+        }
+        for key, value in requested:
+            user = found.get((key, value))
+            if user is None:
+                response['missing'][f"{key}s"].append(value)
+                response['metadata']['missing'] += 1
+            else:
+                response['found'][f"{key}s"][value] = {field: user[field] for field in fields} if fields else user
+                response['metadata']['found'] += 1
+        return response
+
+    @staticmethod
+    @use_replica(db)
+    def list_users(
+            order_by: str = 'uuid',
+            limit: int = 20,
+            after: Optional[List[Any]] = None,
+            statuses: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Lista usuarios con paginación por clave (keyset) sobre (uuid) o (last_name, uuid)"""
+        try:
+            keys = USER_FIELDS
+            query = db.select(*(getattr(User, key) for key in keys))
+            if statuses:
+                query = query.where(User.status.in_(statuses))
+
+            if order_by == 'last_name':
+                order_columns = [User.last_name, User.uuid]
+                if after:
+                    last_name, uuid = after
+                    query = query.where(or_(
+                        User.last_name > last_name,
+                        and_(User.last_name == last_name, User.uuid > uuid)
+                    ))
+            else:
+                order_columns = [User.uuid]
+                if after:
+                    query = query.where(User.uuid > after[0])
+
+            # Filas por columnas: se serializan sin crear instancias ORM
+            rows = db.session.execute(
+                query.order_by(*order_columns).limit(limit + 1)
+            ).all()
+
+            has_more = len(rows) > limit
+            users = rows_to_dicts(keys, rows[:limit])
+            next_cursor = None
+            if has_more:
+                last_user = users[-1]
+                next_cursor = encode_cursor(order_by, [last_user[column.key] for column in order_columns])
+
+            return {
+                'metadata': {
+                    'count': len(users),
+                    'limit': limit,
+                    'order_by': order_by,
+                    'next_cursor': next_cursor
+                },
+                'data': users
+            }
         except SQLAlchemyError as e:
             db.session.rollback()
             raise DatabaseException(original_error=str(e))
@@ -44,7 +178,7 @@ class UserController:
                 uuid=uuid,
                 first_name=user_data['first_name'],
                 last_name=user_data['last_name'],
-                username=f"{user_data['first_name']}{user_data['last_name']}".lower(),
+                username=build_username(user_data['first_name'], user_data['last_name']),
                 email=user_data['email'],
                 phone=user_data.get('phone'),  # Opcional
                 middle_name=user_data.get('middle_name'),  # Opcional
@@ -52,6 +186,8 @@ class UserController:
             )
             db.session.add(new_user)
             db.session.commit()
+            user_cache.invalidate('email', new_user.email, user=new_user.to_dict())
+            user_identity_filter.add(new_user.to_dict())
             return new_user.to_dict()
 
         except IntegrityError as e:
@@ -65,53 +201,279 @@ class UserController:
             raise DatabaseException(original_error=str(e))
         
     @staticmethod
-    def update_user(key: str, value: str, user_data: Dict[str, Any]) -> str:
-        try:
-            result = db.session.execute(
-                db.select(User).filter_by(**{key: value})
-            ).first()
-            user = result[0] if result else None
+    def create_users_bulk(
+            rows: List[Tuple[int, Dict[str, Any]]],
+            chunk_size: int = 1000,
+            addresses: Optional[Dict[int, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+        """Crea usuarios por lotes: una consulta de conflictos y un INSERT multi-fila por lote.
 
-            if not user:
-                raise UserNotFoundException(field=key, value=value)
-            fields_updated = []
+        `addresses` asocia el índice de una fila con sus direcciones, que se insertan
+        en la misma transacción que el usuario.
+        """
+        addresses = addresses or {}
+        results = []
+        seen_emails = set()
+        seen_usernames = set()
+
+        for chunk in chunked(rows, chunk_size):
+            candidates = []
+            for index, user_data in chunk:
+                username = build_username(user_data['first_name'], user_data['last_name'])
+                candidates.append((index, user_data, username))
+
+            try:
+                emails = [user_data['email'] for _, user_data, _ in candidates]
+                usernames = [username for _, _, username in candidates]
+                existing = db.session.execute(
+                    db.select(User.email, User.username)
+                    .where(or_(User.email.in_(emails), User.username.in_(usernames)))
+                ).all()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                error = DatabaseException(original_error=str(e))
+                results.extend({'index': index, 'status': 'error', **error.to_dict()} for index, _, _ in candidates)
+                continue
+
+            taken_emails = seen_emails.union(row.email for row in existing)
+            taken_usernames = seen_usernames.union(row.username for row in existing)
 
-            for field, new_value in user_data.items():
-                if new_value is None:
+            new_users = []
+            new_addresses = []
+            pending = []
+            for index, user_data, username in candidates:
+                if user_data['email'] in taken_emails:
+                    error = UserAlreadyExistsException(field='email', value=user_data['email'])
+                    results.append({'index': index, 'status': 'error', **error.to_dict()})
                     continue
+                if username in taken_usernames:
+                    error = UserAlreadyExistsException(field='username', value=username)
+                    results.append({'index': index, 'status': 'error', **error.to_dict()})
+                    continue
+
+                taken_emails.add(user_data['email'])
+                taken_usernames.add(username)
+                new_user = {
+                    'uuid': str(uuid4()),
+                    'first_name': user_data['first_name'],
+                    'middle_name': user_data.get('middle_name'),
+                    'last_name': user_data['last_name'],
+                    'username': username,
+                    'status': 'active',
+                    'email': user_data['email'],
+                    'phone': user_data.get('phone'),
+                    'version': 1
+                }
+                new_users.append(new_user)
+                user_addresses = [
+                    {'uuid': str(uuid4()), 'user_uuid': new_user['uuid'], **address_data}
+                    for address_data in addresses.get(index, [])
+                ]
+                new_addresses.extend(user_addresses)
+                pending.append((index, new_user, len(user_addresses)))
+
+            if not new_users:
+                continue
+
+            try:
+                db.session.execute(db.insert(User), new_users)
+                if new_addresses:
+                    db.session.execute(db.insert(Address), new_addresses)
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                error = DatabaseException(original_error=str(e))
+                results.extend({'index': index, 'status': 'error', **error.to_dict()} for index, _, _ in pending)
+                continue
 
-                current_value = getattr(user, field, None)
-                if current_value != new_value:
-                    setattr(user, field, new_value)
-                    fields_updated.append((field, new_value))
+            for user in new_users:
+                user_identity_filter.add(user)
+            seen_emails.update(user['email'] for user in new_users)
+            seen_usernames.update(user['username'] for user in new_users)
+            results.extend(
+                {'index': index, 'status': 'created', 'user': user, 'addresses_created': address_count}
+                for index, user, address_count in pending
+            )
+
+        return results
+
+    @staticmethod
+    def _version_condition(if_match: Optional[ETags]) -> Optional[Any]:
+        """Condición WHERE equivalente a If-Match (None si no hay cabecera o es `*`)"""
+        if if_match is None or if_match.star_tag:
+            return None
+        conditions = []
+        for etag in if_match.as_set():
+            uuid, _, version = etag.rpartition('.')
+            try:
+                conditions.append(and_(User.uuid == str(UUID(uuid)), User.version == int(version)))
+            except ValueError:
+                continue
+        return or_(*conditions) if conditions else false()
+
+    @staticmethod
+    def _update_conditions(values: Dict[str, Any], if_match: Optional[ETags]) -> List[Any]:
+        """Algún campo cambia (`IS DISTINCT FROM`) y, si hay If-Match, la versión coincide"""
+        conditions = [or_(*(getattr(User, field).is_distinct_from(new_value) for field, new_value in values.items()))]
+        version_condition = UserController._version_condition(if_match)
+        if version_condition is not None:
+            conditions.append(version_condition)
+        return conditions
+
+    @staticmethod
+    def _update_statement(key: str, value: str, values: Dict[str, Any], conditions: List[Any]):
+        return (
+            db.update(User)
+            .where(getattr(User, key) == value, *conditions)
+            .values(**values, version=User.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _update_returning(key: str, value: str, values: Dict[str, Any], conditions: List[Any]) -> Optional[Any]:
+        """`UPDATE ... WHERE key = value RETURNING` en una sola sentencia.
 
-            if not fields_updated:
+        Devuelve uuid, username, email y version de la fila actualizada o None si
+        ninguna cumple las condiciones. Sin soporte de RETURNING se relee la fila.
+        """
+        statement = UserController._update_statement(key, value, values, conditions)
+        if db.session.get_bind().dialect.update_returning:
+            row = db.session.execute(statement.returning(*UPDATE_RETURNING_COLUMNS)).first()
+        else:
+            row = None
+            if db.session.execute(statement).rowcount:
+                row = db.session.execute(
+                    db.select(*UPDATE_RETURNING_COLUMNS).where(getattr(User, key) == value)
+                ).first()
+        db.session.commit()
+        return row
+
+    @staticmethod
+    def _current_version(key: str, value: str, if_match: Optional[ETags]) -> Any:
+        """Tras un UPDATE sin filas distingue 404 y 412 del caso sin cambios"""
+        row = db.session.execute(
+            db.select(User.uuid, User.version).where(getattr(User, key) == value)
+        ).first()
+        return UserController._check_current_version(row, key, value, if_match)
+
+    @staticmethod
+    def _check_current_version(row: Optional[Any], key: str, value: str, if_match: Optional[ETags]) -> Any:
+        if row is None:
+            raise UserNotFoundException(field=key, value=value)
+        if if_match is not None and not if_match.contains(user_etag(row.uuid, row.version)):
+            raise UserPreconditionFailedException(field=key, value=value, current_version=row.version)
+        return row
+
+    @staticmethod
+    def update_user(key: str, value: str, user_data: Dict[str, Any], if_match: Optional[ETags] = None) -> Dict[str, Any]:
+        """Actualiza los campos enviados sin cargar la entidad.
+
+        Solo se escribe si algún campo cambia (`IS DISTINCT FROM`); `fields_updated`
+        lista los campos enviados con valor.
+        """
+        changes = {field: new_value for field, new_value in user_data.items() if new_value is not None}
+        conditions = UserController._update_conditions(changes, if_match)
+        try:
+            row = UserController._update_returning(key, value, changes, conditions) if changes else None
+            if row is None:
+                UserController._current_version(key, value, if_match)
                 raise InvalidUserDataException(field=key, value=value)
-            
-            db.session.commit()
-            return {
-                key: value,
-                "fields_updated": fields_updated
-            }
         except SQLAlchemyError as e:
             db.session.rollback()
             raise DatabaseException(original_error=str(e))
-        
+
+        user_cache.invalidate(key, value, user={'username': row.username, 'email': row.email})
+        return {
+            key: value,
+            "uuid": row.uuid,
+            "version": row.version,
+            "fields_updated": list(changes.items())
+        }
+
     @staticmethod
-    def update_user_status(key: str, value: str, status_data: Dict[str, Any]) -> Dict[str, str]:
+    def update_user_status(key: str, value: str, status_data: Dict[str, Any], if_match: Optional[ETags] = None) -> Dict[str, Any]:
+        """Cambia el status con un único UPDATE; si ya tenía ese status no se escribe nada"""
+        new_status = status_data.get('status')
+        conditions = UserController._update_conditions({'status': new_status}, if_match)
         try:
-            result = db.session.execute(
-                db.select(User).filter_by(**{key: value})
-            ).first()
+            row = UserController._update_returning(key, value, {'status': new_status}, conditions)
+            if row is None:
+                current = UserController._current_version(key, value, if_match)
+                return {"uuid": current.uuid, "version": current.version}
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise DatabaseException(original_error=str(e))
 
-            user = result[0] if result else None
-            if not user:
-                raise UserNotFoundException(field=key, value=value)
+        user_cache.invalidate(key, value, user={'username': row.username, 'email': row.email})
+        return {"uuid": row.uuid, "version": row.version}
 
-            new_status = status_data.get('status')
-            user.status = new_status
-            db.session.commit()
-            return None
+    @staticmethod
+    def _apply_status(rows: List[Any], status: str, dry_run: bool, report: Dict[str, Any]) -> None:
+        """UPDATE por lote de uuids, commit e invalidación de caché de las filas afectadas"""
+        if dry_run or not rows:
+            return
+        result = db.session.execute(
+            db.update(User)
+            .where(User.uuid.in_([row.uuid for row in rows]))
+            .values(status=status, version=User.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        report['affected'] += result.rowcount
+        report['chunks'] += 1
+        for row in rows:
+            user_cache.invalidate('username', row.username, user={'username': row.username, 'email': row.email})
+
+    @staticmethod
+    def update_users_status_bulk(
+            status: str,
+            identifiers: Optional[Dict[str, List[str]]] = None,
+            filters: Optional[Dict[str, Any]] = None,
+            dry_run: bool = False,
+            chunk_size: int = 1000) -> Dict[str, Any]:
+        """Cambia el status de muchos usuarios con `UPDATE ... WHERE uuid IN (...)` por lotes.
+
+        La selección es una lista de identificadores por clave (uuid, username, email)
+        o un filtro (`statuses`, `email_domain`). Con `dry_run` solo se cuentan las filas.
+        """
+        status = UserStatus(status).value
+        report = {'status': status, 'dry_run': dry_run, 'matched': 0, 'unchanged': 0, 'not_found': 0, 'affected': 0, 'chunks': 0}
+        selected_columns = (User.uuid, User.username, User.email, User.status)
+        try:
+            if identifiers:
+                for key, values in identifiers.items():
+                    column = getattr(User, key)
+                    for chunk in chunked(values, chunk_size):
+                        rows = db.session.execute(db.select(*selected_columns).where(column.in_(chunk))).all()
+                        to_update = [row for row in rows if row.status != status]
+                        report['not_found'] += len(chunk) - len(rows)
+                        report['unchanged'] += len(rows) - len(to_update)
+                        report['matched'] += len(to_update)
+                        UserController._apply_status(to_update, status, dry_run, report)
+                return report
+
+            conditions = [User.status != status]
+            if filters.get('statuses'):
+                conditions.append(User.status.in_([UserStatus(value).value for value in filters['statuses']]))
+            if filters.get('email_domain'):
+                conditions.append(User.email.endswith(f"@{filters['email_domain']}", autoescape=True))
+
+            if dry_run:
+                report['matched'] = db.session.execute(
+                    db.select(func.count()).select_from(User).where(*conditions)
+                ).scalar_one()
+                return report
+
+            last_uuid = None
+            while True:
+                query = db.select(*selected_columns).where(*conditions).order_by(User.uuid).limit(chunk_size)
+                if last_uuid is not None:
+                    query = query.where(User.uuid > last_uuid)
+                rows = db.session.execute(query).all()
+                if not rows:
+                    return report
+                report['matched'] += len(rows)
+                UserController._apply_status(rows, status, dry_run, report)
+                last_uuid = rows[-1].uuid
         except SQLAlchemyError as e:
             db.session.rollback()
-            raise DatabaseException(original_error=str(e))
\ No newline at end of file
+            raise DatabaseException(original_error=str(e))
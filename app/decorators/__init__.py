@@ -1,3 +1,3 @@
-from .users import validate_user_query_params, validate_body
+from .users import parse_fields, validate_user_query_params, validate_pagination_params, validate_body, validate_bulk_body
 
-__all__ = ["validate_user_query_params", "validate_body"]
\ No newline at end of file
+__all__ = ["parse_fields", "validate_user_query_params", "validate_pagination_params", "validate_body", "validate_bulk_body"]
\ No newline at end of file
@@ -1,4 +1,5 @@
-from .query_params import validate_user_query_params
-from .request_validation import validate_body
+from .pagination import validate_pagination_params
+from .query_params import parse_fields, validate_user_query_params
+from .request_validation import validate_body, validate_bulk_body
 
-__all__ = [ "validate_user_query_params", "validate_body"]
\ No newline at end of file
+__all__ = [ "parse_fields", "validate_user_query_params", "validate_pagination_params", "validate_body", "validate_bulk_body"]
\ No newline at end of file
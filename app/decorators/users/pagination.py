@@ -0,0 +1,57 @@
+from flask import request
+from functools import wraps
+
+from ...config import get_setting
+from ...exceptions import InvalidParameterException, InvalidParameterValueException
+from ...models import UserStatus
+from ...utils import decode_cursor
+
+# Columnas de la clave de paginación para cada orden soportado
+ORDER_FIELDS = {
+    'uuid': ('uuid',),
+    'last_name': ('last_name', 'uuid')
+}
+
+def validate_pagination_params(allowed_params=('limit', 'cursor', 'order_by', 'status')):
+    """Valida los parámetros de paginación por cursor y los pasa a la vista como `pagination`"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            params = request.args.to_dict()
+            for key in params:
+                if key not in allowed_params:
+                    raise InvalidParameterException(key, list(allowed_params))
+
+            max_size = get_setting('USERS_PAGE_MAX_SIZE')
+            limit = params.get('limit', str(get_setting('USERS_PAGE_SIZE')))
+            if not limit.isdigit() or not 1 <= int(limit) <= max_size:
+                raise InvalidParameterValueException('limit', limit, f"integer between 1 and {max_size}")
+
+            order_by = params.get('order_by', 'uuid')
+            if order_by not in ORDER_FIELDS:
+                raise InvalidParameterValueException('order_by', order_by, ', '.join(ORDER_FIELDS))
+
+            statuses = None
+            if params.get('status'):
+                statuses = params['status'].split(',')
+                allowed_statuses = [status.value for status in UserStatus]
+                for status in statuses:
+                    if status not in allowed_statuses:
+                        raise InvalidParameterValueException('status', status, ', '.join(allowed_statuses))
+
+            after = None
+            if params.get('cursor'):
+                try:
+                    after = decode_cursor(params['cursor'], order_by, len(ORDER_FIELDS[order_by]))
+                except ValueError:
+                    raise InvalidParameterValueException('cursor', params['cursor'], 'cursor returned by a previous page')
+
+            pagination = {
+                'limit': int(limit),
+                'order_by': order_by,
+                'statuses': statuses,
+                'after': after
+            }
+            return f(*args, **kwargs, pagination=pagination)
+        return wrapper
+    return decorator
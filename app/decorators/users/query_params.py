@@ -1,24 +1,53 @@
 from flask import request
 from functools import wraps
+from typing import Dict, Optional, Sequence, Tuple
 
-from ...exceptions import MissingParameterException, TooManyParametersException, InvalidParameterException
+from ...exceptions import (
+    MissingParameterException,
+    TooManyParametersException,
+    InvalidParameterException,
+    InvalidParameterValueException
+)
 
-def validate_user_query_params(allowed_params):
-    def decorator(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            params = request.args.to_dict()
+def parse_fields(value: Optional[str], allowed_fields: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """Convierte `?fields=uuid,status` en una tupla validada; None si no se pidió proyección"""
+    if value is None:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    if not fields or any(field not in allowed_fields for field in fields):
+        raise InvalidParameterValueException('fields', value, f"comma-separated subset of: {', '.join(allowed_fields)}")
+    return fields
+
+def split_user_query_params(
+        params: Dict[str, str],
+        allowed_params: Sequence[str],
+        optional_params: Optional[Sequence[str]] = None) -> Tuple[str, str, Dict[str, str]]:
+    """Separa la única clave de búsqueda permitida de los parámetros opcionales"""
+    params = dict(params)
+    options = {name: params.pop(name) for name in optional_params or () if name in params}
+
+    if not params:
+        raise MissingParameterException(allowed_params)   
 
-            if not params:
-                raise MissingParameterException(allowed_params)   
+    if len(params) > 1:
+        raise TooManyParametersException(allowed_params)
 
-            if len(params) > 1:
-                raise TooManyParametersException(allowed_params)
+    key = next(iter(params))
+    if key not in allowed_params:
+        raise InvalidParameterException(key, list(allowed_params) + list(optional_params or []))
+    return key, params[key], options
 
-            key = next(iter(params))
-            if key not in allowed_params:
-                raise InvalidParameterException(key, allowed_params)
-            value = params[key]
+def validate_user_query_params(allowed_params, optional_params=None):
+    """Exige exactamente uno de `allowed_params`.
+
+    Los `optional_params` no cuentan para esa regla y se pasan a la vista en `query_options`.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            key, value, options = split_user_query_params(request.args.to_dict(), allowed_params, optional_params)
+            if optional_params is not None:
+                kwargs['query_options'] = options
             return f(*args, **kwargs, query_key=key, query_value=value)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
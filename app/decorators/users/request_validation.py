@@ -1,25 +1,138 @@
+import time
+
 from flask import request
 from functools import wraps
 from pydantic import ValidationError
+from typing import Iterator
+
+from ...config import get_setting
+from ...instrumentation import record_validation_time
+from ...schemas.bulk import validate_rows
+from ...utils import EmptyJSONDocumentError, JSONItemTooLargeError, NotAJSONArrayError, chunked, iter_json_array
+from ...exceptions import (
+    MissingJSONBodyException,
+    InvalidJSONFormatException,
+    SchemaValidationException,
+    InvalidBulkBodyException,
+    BulkLimitExceededException,
+    BulkItemTooLargeException,
+    RequestBodyTooLargeException
+)
+
+def _iter_body_chunks(max_bytes: int, chunk_size: int) -> Iterator[bytes]:
+    """Lee el body por trozos sin superar `max_bytes`"""
+    received = 0
+    while True:
+        chunk = request.stream.read(chunk_size)
+        if not chunk:
+            return
+        received += len(chunk)
+        if received > max_bytes:
+            raise RequestBodyTooLargeException(received, max_bytes)
+        yield chunk
+
+def _check_content_length(max_bytes: int) -> None:
+    if request.content_length is not None and request.content_length > max_bytes:
+        raise RequestBodyTooLargeException(request.content_length, max_bytes)
+
+def _read_json_body(max_bytes: int) -> bytes:
+    """Body crudo de una petición JSON, comprobando el tamaño antes de leerlo"""
+    _check_content_length(max_bytes)
+    if request.content_length is None:
+        body = b''.join(_iter_body_chunks(max_bytes, get_setting('BODY_STREAM_CHUNK_SIZE')))
+    else:
+        body = request.get_data(cache=True)
+    if not request.is_json:
+        if body:
+            raise InvalidJSONFormatException()
+        raise MissingJSONBodyException()
+    if not body.strip():
+        raise MissingJSONBodyException()
+    return body
 
-from ...exceptions import MissingJSONBodyException, InvalidJSONFormatException, SchemaValidationException
+def model_from_json(schema_class, body: bytes):
+    """Valida el body con `schema_class`; JSON mal formado y errores de esquema se traducen a excepciones de la app"""
+    try:
+        return schema_class.model_validate_json(body)
+    except ValidationError as e:
+        errors = e.errors()
+        json_error = next((error for error in errors if error['type'] == 'json_invalid'), None)
+        if json_error is not None:
+            raise InvalidJSONFormatException(json_error.get('ctx', {}).get('error'))
+        raise SchemaValidationException(errors, schema_class.__name__)
 
 def validate_body(schema_class):
+    """Valida el body directamente desde los bytes recibidos, sin decodificarlo antes a dict"""
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            json_data = request.get_json(silent=True)
-            if json_data is None:
-                if request.data:
-                    raise InvalidJSONFormatException()
-                else:
-                    raise MissingJSONBodyException()
+            started = time.perf_counter()
+            try:
+                body = _read_json_body(get_setting('MAX_JSON_BODY_BYTES'))
+                request.validated_data = model_from_json(schema_class, body)
+            finally:
+                record_validation_time(time.perf_counter() - started)
+            return f(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+def validate_bulk_body(schema_class):
+    """Valida un array JSON elemento a elemento sin abortar por filas inválidas.
+
+    El body se decodifica por trozos a medida que llega y se valida en lotes de
+    BULK_INSERT_CHUNK_SIZE elementos: nunca se guardan el body completo ni todos
+    los elementos decodificados, solo las filas ya validadas. Un array con más
+    de BULK_MAX_ITEMS elementos o con un elemento mayor que MAX_JSON_BODY_BYTES
+    se rechaza sin leerlo completo.
+    Deja en `request.validated_rows` los pares (índice, datos) válidos y en
+    `request.rejected_rows` los pares (índice, excepción) de las filas rechazadas.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
             try:
-                validated_data = schema_class(**request.get_json())
-                request.validated_data = validated_data
-                return f(*args, **kwargs)
-            except ValidationError as e:
-                raise SchemaValidationException(e.errors(), schema_class.__name__)
+                max_bytes = get_setting('MAX_BULK_BODY_BYTES')
+                _check_content_length(max_bytes)
+                chunks = _iter_body_chunks(max_bytes, get_setting('BODY_STREAM_CHUNK_SIZE'))
+                if not request.is_json:
+                    if next(chunks, b''):
+                        raise InvalidJSONFormatException()
+                    raise MissingJSONBodyException()
+
+                max_items = get_setting('BULK_MAX_ITEMS')
+                items = iter_json_array(chunks, max_item_bytes=get_setting('MAX_JSON_BODY_BYTES'))
+                validated_rows = []
+                rejected_rows = []
+                received = 0
+                try:
+                    for batch in chunked(items, get_setting('BULK_INSERT_CHUNK_SIZE')):
+                        if received + len(batch) > max_items:
+                            raise BulkLimitExceededException(received + len(batch), max_items)
+                        validated, errors_by_row = validate_rows(schema_class, batch)
+                        validated_rows.extend((received + index, data) for index, data in validated)
+                        rejected_rows.extend(
+                            (received + index, SchemaValidationException(errors, schema_class.__name__))
+                            for index, errors in errors_by_row
+                        )
+                        received += len(batch)
+                except EmptyJSONDocumentError:
+                    raise MissingJSONBodyException()
+                except NotAJSONArrayError:
+                    raise InvalidBulkBodyException()
+                except JSONItemTooLargeError as e:
+                    raise BulkItemTooLargeException(e.limit)
+                except ValueError as e:
+                    raise InvalidJSONFormatException(str(e))
+                if not received:
+                    raise InvalidBulkBodyException()
+            finally:
+                record_validation_time(time.perf_counter() - started)
+
+            request.validated_rows = validated_rows
+            request.rejected_rows = rejected_rows
+            return f(*args, **kwargs)
 
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
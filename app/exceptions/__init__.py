@@ -4,21 +4,28 @@ from .database_exceptions import DatabaseException
 from .user_exceptions import (
     UserAlreadyExistsException, 
     InvalidUserDataException, 
-    UserNotFoundException
+    UserNotFoundException,
+    UserPreconditionFailedException
 )
 
 from .query_params_exceptions import (
     QueryParamException, 
     MissingParameterException, 
     InvalidParameterException, 
-    TooManyParametersException
+    TooManyParametersException,
+    InvalidParameterValueException
 )
 
 from .body_exceptions import (
     MissingJSONBodyException, 
     InvalidJSONFormatException, 
     InvalidNullValueExeption, 
-    SchemaValidationException
+    SchemaValidationException,
+    InvalidBulkBodyException,
+    BulkLimitExceededException,
+    BulkItemTooLargeException,
+    ImportLineTooLargeException,
+    RequestBodyTooLargeException
 )
 
 __all__ = [
@@ -28,14 +35,21 @@ __all__ = [
     'UserAlreadyExistsException', 
     'InvalidUserDataException',
     'UserNotFoundException',
+    'UserPreconditionFailedException',
     
     'QueryParamException',
     'MissingParameterException', 
     'InvalidParameterException', 
     'TooManyParametersException',
+    'InvalidParameterValueException',
 
     'MissingJSONBodyException', 
     'InvalidJSONFormatException',
     'InvalidNullValueExeption',
-    'SchemaValidationException'
+    'SchemaValidationException',
+    'InvalidBulkBodyException',
+    'BulkLimitExceededException',
+    'BulkItemTooLargeException',
+    'ImportLineTooLargeException',
+    'RequestBodyTooLargeException'
 ]
\ No newline at end of file
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from ..utils.log_records import RESERVED_RECORD_ATTRS
+
 class BaseAppException(Exception):
     """Excepción base para toda la aplicación"""
     def __init__(self, 
@@ -35,27 +37,5 @@ class BaseAppException(Exception):
             "timestamp": self.timestamp.isoformat()
         }
         if additional_context:
-            safe_context = {k: v for k, v in additional_context.items() 
-                if k not in [
-                    'message', 
-                    'msg', 
-                    'args', 
-                    'levelname', 
-                    'levelno', 
-                    'pathname', 
-                    'filename', 
-                    'module', 
-                    'lineno', 
-                    'funcName', 
-                    'created', 
-                    'msecs', 
-                    'relativeCreated', 
-                    'thread', 
-                    'threadName', 
-                    'processName', 
-                    'process', 
-                    'name'
-                ]
-            }
-            context.update(safe_context)
+            context.update({k: v for k, v in additional_context.items() if k not in RESERVED_RECORD_ATTRS})
         logger.log(self.log_level, f"Application Error: {self.message}", extra=context)
\ No newline at end of file
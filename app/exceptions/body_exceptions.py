@@ -37,6 +37,38 @@ class InvalidNullValueExeption(BaseAppException):
         super().__init__(message, 400, details, logging.WARNING)
 
 
+class InvalidBulkBodyException(BaseAppException):
+    """Body de una petición masiva que no es una lista"""
+    def __init__(self):
+        message = get_error_message('BULK_BODY_NOT_A_LIST')
+        details = {"expected": "Non-empty JSON array"}
+        super().__init__(message, 400, details, logging.WARNING)
+
+
+class BulkLimitExceededException(BaseAppException):
+    """Petición masiva con demasiados elementos"""
+    def __init__(self, count: int, limit: int):
+        message = get_error_message('BULK_LIMIT_EXCEEDED', count=count, limit=limit)
+        details = {"received_items": count, "max_items": limit}
+        super().__init__(message, 413, details, logging.WARNING)
+
+
+class BulkItemTooLargeException(BaseAppException):
+    """Elemento de una petición masiva que supera el tamaño máximo de un body JSON"""
+    def __init__(self, limit: int):
+        message = get_error_message('BULK_ITEM_TOO_LARGE', limit=limit)
+        details = {"max_item_bytes": limit}
+        super().__init__(message, 413, details, logging.WARNING)
+
+
+class ImportLineTooLargeException(BaseAppException):
+    """Línea de una importación NDJSON que supera el tamaño máximo de un body JSON"""
+    def __init__(self, limit: int):
+        message = get_error_message('IMPORT_LINE_TOO_LARGE', limit=limit)
+        details = {"max_line_bytes": limit}
+        super().__init__(message, 413, details, logging.WARNING)
+
+
 class SchemaValidationException(BaseAppException):
     """Error de validación de schema (Pydantic)"""
     def __init__(self, validation_errors: List[Dict[str, Any]], schema_name: str = ""):
@@ -63,4 +95,12 @@ class SchemaValidationException(BaseAppException):
         """Override para incluir formato específico para errores de validación"""
         base_dict = super().to_dict()
         base_dict["validation_errors"] = self.details.get("validation_errors", [])
-        return base_dict
\ No newline at end of file
+        return base_dict
+
+
+class RequestBodyTooLargeException(BaseAppException):
+    """Body que supera el tamaño máximo permitido"""
+    def __init__(self, size: int, limit: int):
+        message = get_error_message('REQUEST_BODY_TOO_LARGE', size=size, limit=limit)
+        details = {"received_bytes": size, "max_bytes": limit}
+        super().__init__(message, 413, details, logging.WARNING)
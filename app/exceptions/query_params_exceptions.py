@@ -32,4 +32,11 @@ class InvalidParameterException(QueryParamException):
     def __init__(self, param: str, allowed_params: list):
         message = get_error_message('INVALID_PARAMETER', param=param, params=', '.join(allowed_params))
         details = {"invalid_parameter": param, "allowed_parameters": allowed_params}
+        super().__init__(message, 400, details)
+
+class InvalidParameterValueException(QueryParamException):
+    """Valor de parámetro inválido"""
+    def __init__(self, param: str, value: str, expected: str):
+        message = get_error_message('INVALID_PARAMETER_VALUE', param=param, value=value, expected=expected)
+        details = {"parameter": param, "value": value, "expected": expected}
         super().__init__(message, 400, details)
\ No newline at end of file
@@ -22,4 +22,11 @@ class InvalidUserDataException(BaseAppException):
     def __init__(self, field: str, value: str = "Invalid data"):
         message = get_error_message('USER_INVALID_DATA_UPDATE', field=field, value=value)
         details = {"invalid_field": field, "reason": value}
-        super().__init__(message, 400, details, logging.WARNING)
\ No newline at end of file
+        super().__init__(message, 400, details, logging.WARNING)
+
+class UserPreconditionFailedException(BaseAppException):
+    """La versión del usuario no coincide con el If-Match recibido"""
+    def __init__(self, field: str, value: str, current_version: int = None):
+        message = get_error_message('USER_PRECONDITION_FAILED', field=field, value=value)
+        details = {"search_key": field, "search_value": value, "current_version": current_version}
+        super().__init__(message, 412, details, logging.WARNING)
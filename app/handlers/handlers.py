@@ -2,6 +2,7 @@ import logging
 from flask import Flask, jsonify, request
 from werkzeug.exceptions import HTTPException, NotFound, InternalServerError
 from ..exceptions.base import BaseAppException
+from ..instrumentation import current_metrics, metrics_registry
 from ..constans import get_error_message
 
 def setup_error_handlers(app: Flask):
@@ -18,6 +19,10 @@ def setup_error_handlers(app: Flask):
             "client_ip": request.remote_addr,
             "user_agent_header": request.headers.get('User-Agent')
         }
+        metrics = current_metrics()
+        if metrics is not None:
+            context.update(metrics.log_fields())
+        metrics_registry.inc('app_exceptions_total', {'exception': type(error).__name__})
         
         error.log_error(error_logger, context)
         response = jsonify(error.to_dict())
@@ -28,6 +33,7 @@ def setup_error_handlers(app: Flask):
     def handle_not_found(error):
         """Maneja errores 404 personalizados"""
         error_logger.warning(f"404 Not Found: {request.url}", extra={
+            "exception_type": "NotFound",
             "endpoint": request.endpoint,
             "method": request.method,
             "url": request.url,
@@ -43,7 +49,10 @@ def setup_error_handlers(app: Flask):
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
         """Maneja errores 405 (método no permitido)"""
-        error_logger.warning(f"405 Method Not Allowed: {request.method} {request.url}")
+        error_logger.warning(f"405 Method Not Allowed: {request.method} {request.url}", extra={
+            "exception_type": "MethodNotAllowed",
+            "endpoint": request.endpoint
+        })
         
         return jsonify({
             "error": get_error_message('METHOD_NOT_ALLOWED', method=request.method),
@@ -55,6 +64,7 @@ def setup_error_handlers(app: Flask):
     def handle_internal_error(error):
         """Maneja errores internos del servidor"""
         error_logger.error(f"500 Internal Server Error: {str(error)}", extra={
+            "exception_type": "InternalServerError",
             "endpoint": request.endpoint,
             "method": request.method,
             "url": request.url,
@@ -0,0 +1,3 @@
+from .ndjson import ImportProgress, NDJSONImporter, iter_ndjson_lines
+
+__all__ = ['ImportProgress', 'NDJSONImporter', 'iter_ndjson_lines']
@@ -0,0 +1,175 @@
+import json
+import logging
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from ..controllers import UserController
+from ..exceptions import BaseAppException, ImportLineTooLargeException, InvalidJSONFormatException, SchemaValidationException
+from ..schemas import CreateUserSchema, CreateAddressSchema
+
+logger = logging.getLogger('app.importers')
+
+_SKIP_BUFFER_SIZE = 1024 * 1024
+
+def iter_ndjson_lines(
+        stream: BinaryIO,
+        offset: int = 0,
+        max_line_bytes: Optional[int] = None) -> Iterator[Tuple[int, int, Optional[bytes]]]:
+    """Recorre un stream NDJSON línea a línea devolviendo (offset_inicio, offset_fin, línea).
+
+    Si el stream no admite `seek` se descartan los primeros `offset` bytes leyéndolos.
+    Las líneas de más de `max_line_bytes` se descartan sin cargarlas y se devuelven como None.
+    """
+    if offset:
+        seekable = getattr(stream, 'seekable', None)
+        if seekable is not None and seekable():
+            stream.seek(offset)
+        else:
+            remaining = offset
+            while remaining > 0:
+                skipped = stream.read(min(remaining, _SKIP_BUFFER_SIZE))
+                if not skipped:
+                    break
+                remaining -= len(skipped)
+
+    position = offset
+    while True:
+        line = stream.readline(max_line_bytes + 1) if max_line_bytes else stream.readline()
+        if not line:
+            return
+        start = position
+        position += len(line)
+        if max_line_bytes and len(line) > max_line_bytes and not line.endswith(b'\n'):
+            while not line.endswith(b'\n'):
+                line = stream.readline(_SKIP_BUFFER_SIZE)
+                if not line:
+                    break
+                position += len(line)
+            yield start, position, None
+        elif line.strip():
+            yield start, position, line
+
+
+class ImportProgress:
+    """Contadores de progreso y checkpoint de una importación"""
+    def __init__(self, offset: int = 0, max_errors: int = 100):
+        self.offset = offset
+        self.lines_read = 0
+        self.users_created = 0
+        self.addresses_created = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_errors = max_errors
+        self.errors: List[Dict[str, Any]] = []
+
+    def add_error(self, offset: int, error: Dict[str, Any]):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'offset': offset, **error})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'checkpoint': {'offset': self.offset},
+            'lines_read': self.lines_read,
+            'users_created': self.users_created,
+            'addresses_created': self.addresses_created,
+            'failed': self.failed,
+            'batches': self.batches,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors)
+        }
+
+
+class NDJSONImporter:
+    """Importa usuarios (con sus direcciones opcionales) desde NDJSON en lotes acotados.
+
+    Cada línea es un objeto `CreateUserSchema` que puede incluir una lista `addresses`
+    de objetos `CreateAddressSchema`. Solo se mantiene en memoria el lote en curso.
+    """
+    def __init__(self,
+            batch_size: int = 500,
+            max_errors: int = 100,
+            on_checkpoint: Optional[Callable[[ImportProgress], None]] = None,
+            max_line_bytes: Optional[int] = None):
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.on_checkpoint = on_checkpoint
+        self.max_line_bytes = max_line_bytes
+
+    def run(self, stream: BinaryIO, offset: int = 0) -> ImportProgress:
+        progress = ImportProgress(offset=offset, max_errors=self.max_errors)
+        batch = []
+        last_end = offset
+        for start, end, line in iter_ndjson_lines(stream, offset, self.max_line_bytes):
+            progress.lines_read += 1
+            last_end = end
+            parsed = ImportLineTooLargeException(self.max_line_bytes) if line is None else self._parse_line(line)
+            if isinstance(parsed, BaseAppException):
+                progress.add_error(start, parsed.to_dict())
+            else:
+                batch.append((start, parsed))
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch, progress)
+                batch = []
+                self._checkpoint(progress, end)
+
+        if batch:
+            self._flush(batch, progress)
+        self._checkpoint(progress, last_end)
+        return progress
+
+    @staticmethod
+    def _parse_line(line: bytes):
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            return InvalidJSONFormatException(str(e))
+        if not isinstance(record, dict):
+            return InvalidJSONFormatException("Each line must be a JSON object")
+
+        addresses = record.pop('addresses', None)
+        if addresses is None:
+            addresses = []
+        elif not isinstance(addresses, list):
+            return SchemaValidationException([{
+                'loc': ('addresses',),
+                'msg': 'Input should be a valid list',
+                'type': 'list_type',
+                'input': addresses
+            }], CreateUserSchema.__name__)
+        try:
+            user = CreateUserSchema.model_validate(record).model_dump()
+        except ValidationError as e:
+            return SchemaValidationException(e.errors(), CreateUserSchema.__name__)
+        try:
+            user_addresses = [CreateAddressSchema.model_validate(address).model_dump() for address in addresses]
+        except ValidationError as e:
+            return SchemaValidationException(e.errors(), CreateAddressSchema.__name__)
+        return user, user_addresses
+
+    def _flush(self, batch: List[Tuple[int, Tuple[Dict[str, Any], List[Dict[str, Any]]]]], progress: ImportProgress):
+        rows = [(start, user) for start, (user, _) in batch]
+        addresses = {start: user_addresses for start, (_, user_addresses) in batch if user_addresses}
+        results = UserController.create_users_bulk(rows, chunk_size=self.batch_size, addresses=addresses)
+
+        for result in results:
+            if result['status'] == 'created':
+                progress.users_created += 1
+                progress.addresses_created += result['addresses_created']
+            else:
+                error = {key: value for key, value in result.items() if key not in ('index', 'status')}
+                progress.add_error(result['index'], error)
+        progress.batches += 1
+        logger.info("NDJSON import batch flushed", extra={
+            'lines_read': progress.lines_read,
+            'users_created': progress.users_created,
+            'addresses_created': progress.addresses_created,
+            'failed': progress.failed
+        })
+
+    def _checkpoint(self, progress: ImportProgress, offset: int):
+        progress.offset = offset
+        if self.on_checkpoint:
+            self.on_checkpoint(progress)
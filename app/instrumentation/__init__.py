@@ -0,0 +1,14 @@
+from .metrics import MetricsRegistry, listen_pool_events, metrics_registry, setup_metrics
+from .timing import RequestMetrics, current_metrics, instrument_engine, record_validation_time, setup_instrumentation
+
+__all__ = [
+    'MetricsRegistry',
+    'RequestMetrics',
+    'current_metrics',
+    'instrument_engine',
+    'listen_pool_events',
+    'metrics_registry',
+    'record_validation_time',
+    'setup_instrumentation',
+    'setup_metrics'
+]
@@ -0,0 +1,297 @@
+import atexit
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from flask import Flask, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..cache import user_cache, user_identity_filter
+from ..config import TimedQueuePool, db
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+GaugeSample = Tuple[str, Dict[str, Any], float]
+
+def _labels(labels: Optional[Dict[str, Any]]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    labels = list(labels)
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """Registro de contadores, histogramas y gauges con agregación multiproceso.
+
+    Cada proceso acumula en memoria y, si hay `directory`, vuelca periódicamente
+    una instantánea a `metrics_<pid>.json`. Al exponer las métricas se suman las
+    instantáneas de todos los procesos; los gauges de procesos muertos se ignoran.
+    """
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 1.0):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Dict[str, Any]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Iterable[GaugeSample]]] = {}
+        self._last_flush = 0.0
+
+    def configure(self, directory: Optional[str] = None, flush_interval: float = 1.0) -> None:
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def describe(self, name: str, metric_type: str, help_text: str) -> None:
+        self._help[name] = (metric_type, help_text)
+
+    def inc(self, name: str, labels: Optional[Dict[str, Any]] = None, value: float = 1) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None,
+            buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            buckets = self._buckets.setdefault(name, buckets)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram['buckets'][index] += 1
+                    break
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def register_gauges(self, key: str, callback: Callable[[], Iterable[GaugeSample]]) -> None:
+        """`callback` devuelve tuplas (nombre, labels, valor) evaluadas al volcar o exponer"""
+        self._gauge_callbacks[key] = callback
+
+    def _collect_gauges(self) -> List[Tuple[str, Labels, float]]:
+        samples = []
+        for callback in list(self._gauge_callbacks.values()):
+            for name, labels, value in callback():
+                if value is not None:
+                    samples.append((name, _labels(labels), float(value)))
+        return samples
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [
+                [name, list(labels), list(histogram['buckets']), histogram['sum'], histogram['count']]
+                for (name, labels), histogram in self._histograms.items()
+            ]
+            buckets = {name: list(bounds) for name, bounds in self._buckets.items()}
+        gauges = [[name, list(labels), value] for name, labels, value in self._collect_gauges()]
+        return {'pid': os.getpid(), 'counters': counters, 'histograms': histograms, 'buckets': buckets, 'gauges': gauges}
+
+    def flush(self, force: bool = False) -> None:
+        if not self.directory:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.flush_interval:
+            return
+        self._last_flush = now
+        path = self.directory / f"metrics_{os.getpid()}.json"
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp_path, path)
+
+    def clear_directory(self) -> None:
+        """Borra las instantáneas de ejecuciones anteriores (llamar antes de crear los workers)"""
+        if self.directory and self.directory.exists():
+            for path in self.directory.glob('metrics_*.json'):
+                path.unlink(missing_ok=True)
+
+    def _snapshots(self) -> List[Dict[str, Any]]:
+        snapshots = [self.snapshot()]
+        if not self.directory:
+            return snapshots
+        own_file = f"metrics_{os.getpid()}.json"
+        for path in self.directory.glob('metrics_*.json'):
+            if path.name == own_file:
+                continue
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def collect(self) -> Dict[str, Any]:
+        counters: Dict[Tuple[str, Labels], float] = {}
+        histograms: Dict[Tuple[str, Labels], Dict[str, Any]] = {}
+        gauges: Dict[Tuple[str, Labels], float] = {}
+        buckets: Dict[str, List[float]] = {}
+        for snapshot in self._snapshots():
+            buckets.update(snapshot.get('buckets', {}))
+            for name, labels, value in snapshot['counters']:
+                key = (name, tuple(tuple(label) for label in labels))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, bucket_counts, total, count in snapshot['histograms']:
+                key = (name, tuple(tuple(label) for label in labels))
+                histogram = histograms.setdefault(key, {'buckets': [0] * len(bucket_counts), 'sum': 0.0, 'count': 0})
+                histogram['buckets'] = [a + b for a, b in zip(histogram['buckets'], bucket_counts)]
+                histogram['sum'] += total
+                histogram['count'] += count
+            if snapshot['pid'] != os.getpid() and not _pid_alive(snapshot['pid']):
+                continue
+            for name, labels, value in snapshot['gauges']:
+                key = (name, tuple(tuple(label) for label in labels))
+                gauges[key] = gauges.get(key, 0) + value
+        return {'counters': counters, 'histograms': histograms, 'gauges': gauges, 'buckets': buckets}
+
+    def render(self) -> str:
+        """Exposición en formato de texto de Prometheus"""
+        collected = self.collect()
+        lines = []
+        described = set()
+
+        def header(name: str, default_type: str):
+            if name in described:
+                return
+            described.add(name)
+            metric_type, help_text = self._help.get(name, (default_type, ''))
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for (name, labels), value in sorted(collected['counters'].items()):
+            header(name, 'counter')
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), value in sorted(collected['gauges'].items()):
+            header(name, 'gauge')
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(collected['histograms'].items()):
+            header(name, 'histogram')
+            cumulative = 0
+            for bound, count in zip(collected['buckets'].get(name, DEFAULT_BUCKETS), histogram['buckets']):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', repr(float(bound))),))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram['count']}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram['sum']}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+metrics_registry = MetricsRegistry()
+atexit.register(lambda: metrics_registry.flush(force=True))
+
+metrics_registry.describe('http_requests_total', 'counter', 'HTTP requests by endpoint, method and status.')
+metrics_registry.describe('http_request_duration_seconds', 'histogram', 'HTTP request latency by endpoint.')
+metrics_registry.describe('app_exceptions_total', 'counter', 'Application exceptions by type.')
+metrics_registry.describe('db_pool_wait_seconds', 'histogram', 'Time spent waiting for a pooled connection.')
+metrics_registry.describe('db_pool_checked_out', 'gauge', 'Connections currently checked out of the pool.')
+metrics_registry.describe('db_pool_overflow', 'gauge', 'Connections opened beyond pool_size.')
+metrics_registry.describe('db_pool_size', 'gauge', 'Configured pool size.')
+metrics_registry.describe('db_pool_connections_total', 'counter', 'DBAPI connections opened, closed and invalidated.')
+metrics_registry.describe('db_pool_checkouts_total', 'counter', 'Pool checkouts, split by whether the pool was in overflow.')
+
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+def observe_pool_wait(seconds: float, pool_name: str = 'primary') -> None:
+    metrics_registry.observe('db_pool_wait_seconds', seconds, {'pool': pool_name}, buckets=POOL_WAIT_BUCKETS)
+
+_engines_with_pool_events: 'weakref.WeakSet[Engine]' = weakref.WeakSet()
+
+def listen_pool_events(engine: Engine, pool_name: str = 'primary') -> None:
+    """Cuenta aperturas, cierres e invalidaciones de conexiones, los checkouts en overflow
+    y, con TimedQueuePool, la espera de cada checkout"""
+    if engine in _engines_with_pool_events:
+        return
+    _engines_with_pool_events.add(engine)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.wait_observers.append(lambda seconds: observe_pool_wait(seconds, pool_name))
+
+    def connection_event(name):
+        return lambda *args: metrics_registry.inc('db_pool_connections_total', {'pool': pool_name, 'event': name})
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool = engine.pool
+        overflow = hasattr(pool, 'overflow') and pool.overflow() > 0
+        metrics_registry.inc('db_pool_checkouts_total', {'pool': pool_name, 'overflow': 'true' if overflow else 'false'})
+
+    event.listen(engine, 'connect', connection_event('connect'))
+    event.listen(engine, 'close', connection_event('close'))
+    event.listen(engine, 'close_detached', connection_event('close'))
+    event.listen(engine, 'invalidate', connection_event('invalidate'))
+    event.listen(engine, 'checkout', on_checkout)
+
+def pool_gauges(engine: Engine, pool_name: str = 'primary') -> Callable[[], Iterable[GaugeSample]]:
+    def collect():
+        pool = engine.pool
+        for name, method in (('db_pool_checked_out', 'checkedout'), ('db_pool_overflow', 'overflow'), ('db_pool_size', 'size')):
+            if hasattr(pool, method):
+                yield name, {'pool': pool_name}, getattr(pool, method)()
+    return collect
+
+def cache_gauges() -> Iterable[GaugeSample]:
+    cache_stats = user_cache.stats()
+    for field in ('hits', 'misses', 'evictions', 'expirations', 'size'):
+        yield f"user_cache_{field}", {'backend': cache_stats['backend']}, cache_stats.get(field)
+    filter_stats = user_identity_filter.stats()
+    if filter_stats['enabled']:
+        yield 'identity_filter_negative_hits', {}, filter_stats['negative_hits']
+        yield 'identity_filter_items', {}, filter_stats['items']
+
+def setup_metrics(app: Flask, engine: Optional[Engine] = None) -> None:
+    """Registra la recogida de métricas para `/metrics` si METRICS_ENABLED está activo"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    metrics_registry.configure(app.config.get('METRICS_DIR'), app.config.get('METRICS_FLUSH_INTERVAL', 1.0))
+    if engine is None:
+        with app.app_context():
+            engine = db.engine
+    # Cada engine (primario y réplicas de `db_replicas`) se distingue con la etiqueta pool
+    replicas = getattr(app.extensions.get('db_replicas'), 'engines', [])
+    pools = [('primary', engine)] + [(f"replica_{index}", replica) for index, replica in enumerate(replicas)]
+    for pool_name, pool_engine in pools:
+        listen_pool_events(pool_engine, pool_name)
+    collectors = [pool_gauges(pool_engine, pool_name) for pool_name, pool_engine in pools]
+    metrics_registry.register_gauges('db_pool', lambda: itertools.chain.from_iterable(collect() for collect in collectors))
+    metrics_registry.register_gauges('user_cache', cache_gauges)
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+        endpoint = request.endpoint or 'unmatched'
+        metrics_registry.inc('http_requests_total', {
+            'endpoint': endpoint,
+            'method': request.method,
+            'status': response.status_code
+        })
+        metrics_registry.observe('http_request_duration_seconds', time.perf_counter() - started, {'endpoint': endpoint})
+        metrics_registry.flush()
+        return response
@@ -0,0 +1,104 @@
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from flask import Flask, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import db
+
+logger = logging.getLogger('app.requests')
+
+class RequestMetrics:
+    """Tiempos y contadores acumulados durante una petición"""
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_time = 0.0
+        self.db_statements = 0
+        self.db_rows = 0
+        self.validation_time = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def log_fields(self) -> Dict[str, Any]:
+        return {
+            'duration_ms': round(self.elapsed * 1000, 3),
+            'db_time_ms': round(self.db_time * 1000, 3),
+            'db_statements': self.db_statements,
+            'db_rows': self.db_rows,
+            'validation_time_ms': round(self.validation_time * 1000, 3)
+        }
+
+    def server_timing(self) -> str:
+        return ', '.join([
+            f'db;dur={self.db_time * 1000:.3f};desc="{self.db_statements} statements"',
+            f'validation;dur={self.validation_time * 1000:.3f}',
+            f'total;dur={self.elapsed * 1000:.3f}'
+        ])
+
+def current_metrics() -> Optional[RequestMetrics]:
+    if not has_app_context():
+        return None
+    return g.get('request_metrics')
+
+def record_validation_time(seconds: float) -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.validation_time += seconds
+
+# El inicio se guarda en el contexto de ejecución: si la sentencia falla no se
+# llama a after_cursor_execute y el valor se descarta con el contexto
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_query_start_time', None)
+    metrics = current_metrics()
+    if started is None or metrics is None:
+        return
+    metrics.db_time += time.perf_counter() - started
+    metrics.db_statements += 1
+    # rowcount es -1 en los SELECT de algunos drivers (p. ej. sqlite3)
+    if cursor.rowcount and cursor.rowcount > 0:
+        metrics.db_rows += cursor.rowcount
+
+def instrument_engine(engine: Engine) -> None:
+    """Mide el tiempo y el número de sentencias ejecutadas por el engine"""
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+def setup_instrumentation(app: Flask, engine: Optional[Engine] = None) -> None:
+    """Registra la instrumentación por petición si REQUEST_INSTRUMENTATION está activo"""
+    if not app.config.get('REQUEST_INSTRUMENTATION', False):
+        return
+
+    if engine is None:
+        with app.app_context():
+            engine = db.engine
+    instrument_engine(engine)
+    for replica in getattr(app.extensions.get('db_replicas'), 'engines', []):
+        instrument_engine(replica)
+
+    @app.before_request
+    def start_request_metrics():
+        g.request_metrics = RequestMetrics()
+
+    @app.after_request
+    def finish_request_metrics(response):
+        metrics = current_metrics()
+        if metrics is None:
+            return response
+        response.headers['Server-Timing'] = metrics.server_timing()
+        logger.info(f"{request.method} {request.path} {response.status_code}", extra={
+            'request_endpoint': request.endpoint,
+            'request_method': request.method,
+            'request_path': request.path,
+            'status_code': response.status_code,
+            **metrics.log_fields()
+        })
+        return response
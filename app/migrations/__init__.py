@@ -0,0 +1,11 @@
+from .runner import Migration, MigrationError, applied_versions, migrate, pending_migrations
+from .versions import MIGRATIONS
+
+__all__ = [
+    'MIGRATIONS',
+    'Migration',
+    'MigrationError',
+    'applied_versions',
+    'migrate',
+    'pending_migrations'
+]
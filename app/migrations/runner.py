@@ -0,0 +1,83 @@
+import logging
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger('app.migrations')
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    'schema_migrations',
+    _metadata,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('name', String(100), nullable=False),
+    Column('applied_at', DateTime, nullable=False)
+)
+
+class MigrationError(Exception):
+    """Error al aplicar una migración de esquema"""
+
+
+class Migration:
+    """Cambio de esquema versionado.
+
+    Las migraciones `optional` solo se aplican cuando se piden explícitamente y,
+    mientras no se apliquen, no bloquean las versiones posteriores.
+    """
+    def __init__(self, version: int, name: str, upgrade: Callable[[Connection], None], optional: bool = False):
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+        self.optional = optional
+
+    def __repr__(self) -> str:
+        return f"<Migration {self.version:04d} {self.name}>"
+
+
+def applied_versions(engine: Engine) -> List[int]:
+    with engine.begin() as connection:
+        schema_migrations.create(connection, checkfirst=True)
+        return list(connection.execute(select(schema_migrations.c.version)).scalars())
+
+def pending_migrations(
+        engine: Engine,
+        migrations: Iterable[Migration],
+        target: Optional[int] = None,
+        include_optional: Iterable[str] = ()) -> List[Migration]:
+    applied = set(applied_versions(engine))
+    include_optional = set(include_optional)
+    return [
+        migration for migration in sorted(migrations, key=lambda migration: migration.version)
+        if migration.version not in applied
+        and (target is None or migration.version <= target)
+        and (not migration.optional or migration.name in include_optional)
+    ]
+
+def migrate(
+        engine: Engine,
+        migrations: Iterable[Migration],
+        target: Optional[int] = None,
+        include_optional: Iterable[str] = ()) -> List[Migration]:
+    """Aplica en orden las migraciones pendientes, cada una en su propia transacción.
+
+    En MySQL los DDL confirman implícitamente: una migración que falla a medias no
+    se registra y debe poder volver a ejecutarse sobre el esquema parcial.
+    """
+    applied = []
+    for migration in pending_migrations(engine, migrations, target, include_optional):
+        logger.info(f"Applying migration {migration.version:04d} {migration.name}")
+        try:
+            with engine.begin() as connection:
+                migration.upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.utcnow()
+                ))
+        except Exception as e:
+            raise MigrationError(f"Migration {migration.version:04d} {migration.name} failed: {e}") from e
+        applied.append(migration)
+    return applied
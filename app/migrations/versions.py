@@ -0,0 +1,104 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from ..models import User, Address
+from .runner import Migration, MigrationError
+
+LOOKUP_INDEXES = ['ix_addresses_user_uuid', 'ix_users_last_name_uuid', 'ix_users_status_last_name_uuid']
+
+def _index(name: str):
+    for table in (User.__table__, Address.__table__):
+        for index in table.indexes:
+            if index.name == name:
+                return index
+    raise KeyError(name)
+
+def create_base_tables(connection: Connection) -> None:
+    """Crea las tablas users y addresses si todavía no existen"""
+    existing = set(inspect(connection).get_table_names())
+    for table in (User.__table__, Address.__table__):
+        if table.name not in existing:
+            table.create(connection)
+
+def create_lookup_indexes(connection: Connection) -> None:
+    """Índice de la FK de direcciones e índices compuestos para los listados"""
+    for name in LOOKUP_INDEXES:
+        _index(name).create(connection, checkfirst=True)
+
+def _column_types(connection: Connection, table: str) -> Dict[str, Any]:
+    return {column['name']: column['type'] for column in inspect(connection).get_columns(table)}
+
+def _is_binary(column_type) -> bool:
+    try:
+        return column_type.python_type is bytes
+    except NotImplementedError:
+        return False
+
+def compact_uuid_statements(users_columns: Dict[str, Any], addresses_columns: Dict[str, Any]) -> List[str]:
+    """Sentencias que faltan para pasar los UUID a BINARY(16) según el estado actual de las columnas.
+
+    En MySQL cada ALTER TABLE confirma implícitamente la transacción, así que un
+    fallo a medias deja parte del esquema convertido; al volver a ejecutar la
+    migración solo se aplican los pasos pendientes.
+    """
+    statements = []
+    if not _is_binary(users_columns['uuid']):
+        if 'uuid_bin' not in users_columns:
+            statements.append("ALTER TABLE users ADD COLUMN uuid_bin BINARY(16)")
+        statements += [
+            "UPDATE users SET uuid_bin = UNHEX(REPLACE(uuid, '-', ''))",
+            "ALTER TABLE users DROP PRIMARY KEY, DROP COLUMN uuid, "
+            "CHANGE uuid_bin uuid BINARY(16) NOT NULL FIRST, ADD PRIMARY KEY (uuid)",
+        ]
+    if not _is_binary(addresses_columns['uuid']):
+        missing = [f"ADD COLUMN {name} BINARY(16)" for name in ('uuid_bin', 'user_uuid_bin') if name not in addresses_columns]
+        if missing:
+            statements.append(f"ALTER TABLE addresses {', '.join(missing)}")
+        statements += [
+            "UPDATE addresses SET uuid_bin = UNHEX(REPLACE(uuid, '-', '')), "
+            "user_uuid_bin = UNHEX(REPLACE(user_uuid, '-', ''))",
+            "ALTER TABLE addresses DROP PRIMARY KEY, DROP COLUMN uuid, DROP COLUMN user_uuid, "
+            "CHANGE uuid_bin uuid BINARY(16) NOT NULL FIRST, CHANGE user_uuid_bin user_uuid BINARY(16) NULL AFTER uuid, "
+            "ADD PRIMARY KEY (uuid)",
+        ]
+    return statements
+
+def convert_uuids_to_binary(connection: Connection) -> None:
+    """Convierte las columnas UUID de CHAR(36) a BINARY(16) (solo MySQL).
+
+    Cada paso comprueba el tipo actual de las columnas, por lo que la migración
+    puede reanudarse si falló a medias. Requiere arrancar la aplicación con
+    `UUID_STORAGE=binary` tras aplicarla.
+    """
+    if connection.dialect.name not in ('mysql', 'mariadb'):
+        raise MigrationError(f"compact-uuid is only supported on MySQL, not {connection.dialect.name}")
+
+    inspector = inspect(connection)
+    for foreign_key in inspector.get_foreign_keys('addresses'):
+        if foreign_key['referred_table'] == 'users' and foreign_key.get('name'):
+            connection.execute(text(f"ALTER TABLE addresses DROP FOREIGN KEY `{foreign_key['name']}`"))
+    for name in LOOKUP_INDEXES:
+        _index(name).drop(connection, checkfirst=True)
+
+    for statement in compact_uuid_statements(_column_types(connection, 'users'), _column_types(connection, 'addresses')):
+        connection.execute(text(statement))
+    connection.execute(text(
+        "ALTER TABLE addresses ADD CONSTRAINT fk_addresses_user_uuid FOREIGN KEY (user_uuid) REFERENCES users (uuid)"
+    ))
+    for name in LOOKUP_INDEXES:
+        _index(name).create(connection, checkfirst=True)
+
+def add_user_version(connection: Connection) -> None:
+    """Columna `version` de users para la concurrencia optimista y los ETag"""
+    columns = {column['name'] for column in inspect(connection).get_columns('users')}
+    if 'version' not in columns:
+        connection.execute(text("ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+MIGRATIONS = [
+    Migration(1, 'base-tables', create_base_tables),
+    Migration(2, 'lookup-indexes', create_lookup_indexes),
+    Migration(3, 'compact-uuid', convert_uuids_to_binary, optional=True),
+    Migration(4, 'user-version', add_user_version),
+]
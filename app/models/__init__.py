@@ -1,6 +1,7 @@
 from app.config import db  
 
-from .user import User, UserStatus
+from .types import CompactUUID
+from .user import USER_FIELDS, User, UserStatus
 from .address import Address
 
-__all__ = ['db', 'User', 'UserStatus', 'Address']
\ No newline at end of file
+__all__ = ['db', 'CompactUUID', 'User', 'USER_FIELDS', 'UserStatus', 'Address']
\ No newline at end of file
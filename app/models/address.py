@@ -1,11 +1,13 @@
 from typing import Dict, Union
 from . import db
+from .types import CompactUUID
+from ..serialization import serializer_for
 
 class Address(db.Model):
     __tablename__ = "addresses"
     
-    uuid = db.Column(db.String(36), primary_key=True)
-    user_uuid = db.Column(db.String(36), db.ForeignKey('users.uuid'))
+    uuid = db.Column(CompactUUID(), primary_key=True)
+    user_uuid = db.Column(CompactUUID(), db.ForeignKey('users.uuid'), index=True)
     street = db.Column(db.String(50))
     number = db.Column(db.Integer)
     city = db.Column(db.String(30))
@@ -15,13 +17,4 @@ class Address(db.Model):
     user = db.relationship('User', back_populates='addresses')
 
     def to_dict(self) -> Dict[str, Union[str, None]]:
-        return {
-            'uuid': self.uuid,
-            'user_uuid': self.user_uuid,
-            'street': self.street,
-            'number': self.number,
-            'city': self.city,
-            'state': self.state,
-            'country': self.country,
-            'instructions': self.instructions
-        }
\ No newline at end of file
+        return serializer_for(Address)(self)
\ No newline at end of file
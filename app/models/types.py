@@ -0,0 +1,49 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy.types import BINARY, String, TypeDecorator
+
+from app.config import get_setting
+
+class CompactUUID(TypeDecorator):
+    """UUID almacenado como texto (CHAR 36) o en formato compacto BINARY(16).
+
+    La aplicación siempre trabaja con el UUID en texto; la conversión a bytes
+    se hace de forma transparente cuando `UUID_STORAGE=binary`. Sin `binary`
+    explícito, el formato se toma de la configuración de la app en el primer uso.
+    """
+    impl = String(36)
+    cache_ok = True
+
+    def __init__(self, binary: Optional[bool] = None):
+        super().__init__()
+        self._binary = binary
+
+    @property
+    def binary(self) -> bool:
+        # Se resuelve al usarse (con la app activa), no al importar los modelos;
+        # después queda fijo, igual que el tipo que SQLAlchemy guarda por dialecto
+        if self._binary is None:
+            self._binary = get_setting('UUID_STORAGE') == 'binary'
+        return self._binary
+
+    def load_dialect_impl(self, dialect):
+        if self.binary:
+            return dialect.type_descriptor(BINARY(16))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not self.binary:
+            return str(value)
+        if isinstance(value, bytes):
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or not self.binary:
+            return value
+        return str(uuid.UUID(bytes=bytes(value)))
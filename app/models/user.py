@@ -3,6 +3,8 @@ from typing import Dict, Union
 from uuid import uuid4
 
 from . import db
+from .types import CompactUUID
+from ..serialization import serializer_for
 
 class UserStatus(str, Enum):
     ACTIVE = 'active'
@@ -10,10 +12,17 @@ class UserStatus(str, Enum):
     SUSPENDED = 'suspended'
     DELETED = 'deleted'
 
+# Campos de las respuestas, la caché y las búsquedas: una columna nueva no se expone sin añadirla aquí
+USER_FIELDS = ('uuid', 'first_name', 'middle_name', 'last_name', 'username', 'status', 'email', 'phone', 'version')
+
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index('ix_users_last_name_uuid', 'last_name', 'uuid'),
+        db.Index('ix_users_status_last_name_uuid', 'status', 'last_name', 'uuid'),
+    )
     
-    uuid = db.Column(db.String(36), primary_key=True, autoincrement=False, default=uuid4)
+    uuid = db.Column(CompactUUID(), primary_key=True, autoincrement=False, default=uuid4)
     first_name = db.Column(db.String(30), nullable=False)
     middle_name = db.Column(db.String(30))
     last_name = db.Column(db.String(30), nullable=False)
@@ -21,16 +30,11 @@ class User(db.Model):
     status = db.Column(db.String(30), nullable=False, default=UserStatus.PENDING)
     email = db.Column(db.String(100), nullable=False, unique=True)
     phone = db.Column(db.String(20))
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
     addresses = db.relationship('Address', back_populates='user', lazy='dynamic')
 
+    # Cada UPDATE del ORM incrementa `version` y exige la versión leída (concurrencia optimista)
+    __mapper_args__ = {'version_id_col': version}
+
     def to_dict(self) -> Dict[str, Union[str, None]]:
-        return {
-            'uuid': self.uuid,
-            'first_name': self.first_name,
-            'middle_name': self.middle_name,
-            'last_name': self.last_name,
-            'username': self.username,
-            'status': self.status,
-            'email': self.email,
-            'phone': self.phone
-        }
+        return serializer_for(User, USER_FIELDS)(self)
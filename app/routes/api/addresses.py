@@ -1,15 +1,17 @@
 from flask import Blueprint, request
 
 from ...controllers import AddressController
-from ...decorators import validate_user_query_params, validate_body
+from ...controllers.addresses import ADDRESS_FIELDS
+from ...decorators import parse_fields, validate_user_query_params, validate_body
 from ...schemas import CreateAddressSchema
 
 addresses_bp = Blueprint('addresses', __name__)
 
 @addresses_bp.route('/user', methods=['GET'])
-@validate_user_query_params(['username', 'email'])
-def get_users_address(query_key, query_value):
-    data = AddressController.get_user_address(query_key, query_value)
+@validate_user_query_params(['username', 'email'], optional_params=['fields'])
+def get_users_address(query_key, query_value, query_options):
+    fields = parse_fields(query_options.get('fields'), ADDRESS_FIELDS)
+    data = AddressController.get_user_address(query_key, query_value, fields)
     return data, 200
 @addresses_bp.route('/', methods=['POST'])
 @validate_user_query_params(['username', 'email'])
@@ -1,15 +1,60 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 
-from ...controllers import UserController
-from ...decorators import validate_user_query_params, validate_body
-from ...schemas import CreateUserSchema, UpdateUserSchema, UpdateStatusUserSchema
+from ...config import get_setting
+from ...controllers import UserController, AddressController
+from ...decorators import parse_fields, validate_user_query_params, validate_pagination_params, validate_body, validate_bulk_body
+from ...exceptions import BulkLimitExceededException, InvalidParameterValueException
+from ...importers import NDJSONImporter
+from ...models import USER_FIELDS
+from ...schemas import BulkStatusSchema, CreateUserSchema, LookupUsersSchema, UpdateUserSchema, UpdateStatusUserSchema
+from ...utils import user_etag
 
 users_bp = Blueprint('users', __name__)
 
+def _if_match():
+    """ETags de If-Match, o None si la cabecera no se envió"""
+    return request.if_match if request.headers.get('If-Match') else None
+
 @users_bp.route('/', methods=['GET'])
-@validate_user_query_params(['username', 'email'])
-def get_user(query_key, query_value):
-    response = UserController.get_user(query_key, query_value)
+@validate_user_query_params(['username', 'email'], optional_params=['include', 'fields'])
+def get_user(query_key, query_value, query_options):
+    include = query_options.get('include')
+    fields = parse_fields(query_options.get('fields'), USER_FIELDS)
+    if include is None:
+        user = UserController.get_user(query_key, query_value, fields)
+    elif include == 'addresses':
+        return jsonify(AddressController.get_user_with_addresses(query_key, query_value, fields)), 200
+    else:
+        raise InvalidParameterValueException('include', include, 'addresses')
+
+    response = jsonify(user)
+    # Sin uuid y version (proyección con ?fields=) no hay ETag fiable
+    if 'uuid' in user and 'version' in user:
+        response.set_etag(user_etag(user['uuid'], user['version']))
+        response.make_conditional(request)
+    return response
+
+@users_bp.route('/lookup', methods=['POST'])
+@validate_body(LookupUsersSchema)
+def lookup_users():
+    lookup = request.validated_data
+    max_keys = get_setting('USERS_LOOKUP_MAX_KEYS')
+    requested = len(lookup.usernames) + len(lookup.emails)
+    if requested > max_keys:
+        raise BulkLimitExceededException(requested, max_keys)
+
+    response = UserController.lookup_users(
+        lookup.usernames,
+        lookup.emails,
+        chunk_size=get_setting('USERS_LOOKUP_CHUNK_SIZE'),
+        fields=parse_fields(request.args.get('fields'), USER_FIELDS)
+    )
+    return jsonify(response), 200
+
+@users_bp.route('/list', methods=['GET'])
+@validate_pagination_params()
+def list_users(pagination):
+    response = UserController.list_users(**pagination)
     return jsonify(response), 200
 
 @users_bp.route('/', methods=['POST'])
@@ -17,17 +62,82 @@ def get_user(query_key, query_value):
 def create_user():
     response = UserController.create_user(request.validated_data.model_dump())
     return jsonify(response), 201
-    
+
+@users_bp.route('/bulk', methods=['POST'])
+@validate_bulk_body(CreateUserSchema)
+def create_users_bulk():
+    results = UserController.create_users_bulk(
+        request.validated_rows,
+        chunk_size=get_setting('BULK_INSERT_CHUNK_SIZE')
+    )
+    results.extend(
+        {'index': index, 'status': 'error', **error.to_dict()}
+        for index, error in request.rejected_rows
+    )
+    results.sort(key=lambda result: result['index'])
+
+    created = sum(1 for result in results if result['status'] == 'created')
+    response = {
+        'metadata': {
+            'total': len(results),
+            'created': created,
+            'failed': len(results) - created
+        },
+        'results': results
+    }
+    return jsonify(response), 201 if created == len(results) else 207
+
+@users_bp.route('/import', methods=['POST'])
+def import_users():
+    offset = request.args.get('offset', '0')
+    if not offset.isdigit():
+        raise InvalidParameterValueException('offset', offset, 'non-negative integer')
+
+    importer = NDJSONImporter(
+        batch_size=get_setting('IMPORT_BATCH_SIZE'),
+        max_errors=get_setting('IMPORT_MAX_ERRORS'),
+        max_line_bytes=get_setting('MAX_JSON_BODY_BYTES')
+    )
+    progress = importer.run(request.stream, offset=int(offset))
+    return jsonify(progress.to_dict()), 200
+
 @users_bp.route('/update/', methods=['PATCH'])
 @validate_user_query_params(['username', 'email'])
 @validate_body(UpdateUserSchema)
 def update_user(query_key, query_value):
-    response = UserController.update_user(query_key, query_value, request.validated_data.model_dump())
-    return jsonify(response), 200
+    result = UserController.update_user(query_key, query_value, request.validated_data.model_dump(), _if_match())
+    response = jsonify(result)
+    response.set_etag(user_etag(result['uuid'], result['version']))
+    return response
     
 @users_bp.route('/status/', methods=['PATCH'])
 @validate_user_query_params(['username', 'email'])
 @validate_body(UpdateStatusUserSchema)
 def update_user_status(query_key, query_value):
-    response = UserController.update_user_status(query_key, query_value, request.validated_data.model_dump())
-    return jsonify(response), 204
\ No newline at end of file
+    result = UserController.update_user_status(query_key, query_value, request.validated_data.model_dump(), _if_match())
+    response = current_app.response_class(status=204)
+    response.set_etag(user_etag(result['uuid'], result['version']))
+    return response
+
+@users_bp.route('/status/bulk', methods=['PATCH'])
+@validate_body(BulkStatusSchema)
+def update_users_status_bulk():
+    bulk = request.validated_data
+    identifiers = {
+        key: values
+        for key, values in (('uuid', bulk.uuids), ('username', bulk.usernames), ('email', bulk.emails))
+        if values
+    }
+    max_items = get_setting('BULK_MAX_ITEMS')
+    requested = sum(len(values) for values in identifiers.values())
+    if requested > max_items:
+        raise BulkLimitExceededException(requested, max_items)
+
+    response = UserController.update_users_status_bulk(
+        bulk.status.value,
+        identifiers=identifiers or None,
+        filters=bulk.filter.model_dump() if bulk.filter else None,
+        dry_run=bulk.dry_run,
+        chunk_size=get_setting('BULK_STATUS_CHUNK_SIZE')
+    )
+    return jsonify(response), 200
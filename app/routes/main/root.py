@@ -1,4 +1,7 @@
-from flask import Blueprint
+from flask import Blueprint, Response, jsonify
+
+from ...cache import user_cache, user_identity_filter
+from ...instrumentation import metrics_registry
 
 root_bp = Blueprint('main', __name__)
 
@@ -6,3 +9,13 @@ root_bp = Blueprint('main', __name__)
 def ping():
     return 'pong', 200
 
+@root_bp.route('/cache/stats')
+def cache_stats():
+    return jsonify({
+        'user_cache': user_cache.stats(),
+        'identity_filter': user_identity_filter.stats()
+    }), 200
+
+@root_bp.route('/metrics')
+def metrics():
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
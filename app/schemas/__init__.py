@@ -1,4 +1,24 @@
-from .users import CreateUserSchema, UpdateUserSchema, UpdateStatusUserSchema
+from .users import (
+    CreateUserSchema,
+    UpdateUserSchema,
+    UpdateStatusUserSchema,
+    LookupUsersSchema,
+    BulkStatusSchema,
+    BulkStatusFilterSchema
+)
 from .addresses import CreateAddressSchema
+from .bulk import validate_rows
+from .normalization import NameField, normalize_name
 
-__all__ = ["CreateUserSchema", "UpdateUserSchema", "CreateAddressSchema", "UpdateStatusUserSchema"]
\ No newline at end of file
+__all__ = [
+    "CreateUserSchema",
+    "UpdateUserSchema",
+    "CreateAddressSchema",
+    "UpdateStatusUserSchema",
+    "LookupUsersSchema",
+    "BulkStatusSchema",
+    "BulkStatusFilterSchema",
+    "NameField",
+    "normalize_name",
+    "validate_rows"
+]
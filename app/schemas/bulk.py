@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema_class: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema_class])
+
+def validate_rows(
+        schema_class: Type[BaseModel],
+        rows: Sequence[Any]) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, List[Dict[str, Any]]]]]:
+    """Valida una lista de registros con una sola llamada al validador compilado.
+
+    Devuelve los pares (índice, datos) válidos y los pares (índice, errores)
+    rechazados; los `loc` de los errores no incluyen el índice de la fila.
+    """
+    adapter = _list_adapter(schema_class)
+    try:
+        models = adapter.validate_python(rows)
+        return list(enumerate(adapter.dump_python(models))), []
+    except ValidationError as e:
+        errors_by_row: Dict[int, List[Dict[str, Any]]] = {}
+        for error in e.errors():
+            index, *loc = error['loc']
+            errors_by_row.setdefault(index, []).append({**error, 'loc': tuple(loc)})
+
+    valid_indexes = [index for index in range(len(rows)) if index not in errors_by_row]
+    models = adapter.validate_python([rows[index] for index in valid_indexes])
+    validated = list(zip(valid_indexes, adapter.dump_python(models)))
+    return validated, sorted(errors_by_row.items())
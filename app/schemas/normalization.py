@@ -0,0 +1,49 @@
+import unicodedata
+from functools import lru_cache
+from typing import Annotated
+
+from pydantic import AfterValidator, StringConstraints
+
+NAME_PATTERN = r'^[a-zA-Z\s]+$'
+
+class _NameCharacters(dict):
+    """Tabla de `str.translate` que elimina marcas combinantes y caracteres que no son letras ni espacios.
+
+    Se rellena bajo demanda: cada carácter se clasifica una sola vez por proceso.
+    """
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = not unicodedata.combining(char) and (char.isalpha() or char.isspace())
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+_NAME_CHARACTERS = _NameCharacters()
+
+def _capitalize_word(word: str) -> str:
+    if len(word) <= 1:
+        return word.upper()
+    return word[0].upper() + word[1:].lower()
+
+@lru_cache(maxsize=4096)
+def normalize_name(value: str) -> str:
+    """Elimina acentos y símbolos y capitaliza cada palabra: 'josé  DE la' -> 'Jose De La'"""
+    if not value:
+        return value
+    if not value.isascii():
+        value = unicodedata.normalize('NFKD', value).translate(_NAME_CHARACTERS)
+        return ' '.join(_capitalize_word(word) for word in value.split())
+    if not value.replace(' ', '').isalpha():
+        value = value.translate(_NAME_CHARACTERS)
+    # En ASCII, capitalize() equivale a _capitalize_word y se ejecuta en C
+    return ' '.join(word.capitalize() for word in value.split())
+
+NameField = Annotated[
+    str,
+    StringConstraints(
+        min_length=2,
+        max_length=30,
+        strip_whitespace=True,
+        pattern=NAME_PATTERN
+    ),
+    AfterValidator(normalize_name)
+]
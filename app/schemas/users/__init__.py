@@ -1,5 +1,14 @@
 from .create_user import CreateUserSchema
 from .update_user import UpdateUserSchema
 from .update_status_user import UpdateStatusUserSchema
+from .lookup_users import LookupUsersSchema
+from .bulk_status import BulkStatusSchema, BulkStatusFilterSchema
 
-__all__ = ["CreateUserSchema", "UpdateUserSchema", "UpdateStatusUserSchema"]
\ No newline at end of file
+__all__ = [
+    "CreateUserSchema",
+    "UpdateUserSchema",
+    "UpdateStatusUserSchema",
+    "LookupUsersSchema",
+    "BulkStatusSchema",
+    "BulkStatusFilterSchema"
+]
\ No newline at end of file
@@ -0,0 +1,53 @@
+from pydantic import BaseModel, field_validator, model_validator
+from pydantic.config import ConfigDict
+from typing import List, Optional
+
+from app.exceptions import InvalidNullValueExeption
+from app.models import UserStatus
+from .lookup_users import normalize_lookup_keys
+
+class BulkStatusFilterSchema(BaseModel):
+    statuses: List[UserStatus] = []
+    email_domain: Optional[str] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator('email_domain')
+    def normalize_domain(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
+        return v.strip().lstrip('@').lower() or None
+
+    @model_validator(mode='after')
+    def at_least_one_criterion(cls, values):
+        if not values.statuses and not values.email_domain:
+            raise InvalidNullValueExeption(allowed_fields=['statuses', 'email_domain'])
+        return values
+
+
+class BulkStatusSchema(BaseModel):
+    status: UserStatus
+    uuids: List[str] = []
+    usernames: List[str] = []
+    emails: List[str] = []
+    filter: Optional[BulkStatusFilterSchema] = None
+    dry_run: bool = False
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator('uuids')
+    def deduplicate_uuids(cls, v: List[str]) -> List[str]:
+        return list(dict.fromkeys(uuid.strip() for uuid in v if uuid.strip()))
+
+    @field_validator('usernames', 'emails')
+    def normalize_keys(cls, v: List[str]) -> List[str]:
+        return normalize_lookup_keys(v)
+
+    @model_validator(mode='after')
+    def identifiers_or_filter(cls, values):
+        has_identifiers = bool(values.uuids or values.usernames or values.emails)
+        if not has_identifiers and values.filter is None:
+            raise InvalidNullValueExeption(allowed_fields=['uuids', 'usernames', 'emails', 'filter'])
+        if has_identifiers and values.filter is not None:
+            raise ValueError("Provide either identifiers or a filter, not both")
+        return values
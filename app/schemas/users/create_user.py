@@ -1,37 +1,12 @@
 from typing import Annotated, Optional
 from pydantic import BaseModel, EmailStr, field_validator, StringConstraints
-import unicodedata
+
+from ..normalization import NameField
 
 class CreateUserSchema(BaseModel):
-    first_name: Annotated[
-        str,
-        StringConstraints(
-            min_length=2,
-            max_length=30,
-            strip_whitespace=True,
-            pattern=r'^[a-zA-Z\s]+$'
-        )
-    ]
-    middle_name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-            min_length=2,
-            max_length=30,
-            strip_whitespace=True,
-            pattern=r'^[a-zA-Z\s]+$'
-            )
-        ]
-    ] = None
-    last_name: Annotated[
-        str,
-        StringConstraints(
-            min_length=2,
-            max_length=30,
-            strip_whitespace=True,
-            pattern=r'^[a-zA-Z\s]+$'
-        )
-    ]
+    first_name: NameField
+    middle_name: Optional[NameField] = None
+    last_name: NameField
     email: EmailStr
     phone: Optional[
         Annotated[
@@ -44,21 +19,6 @@ class CreateUserSchema(BaseModel):
         ]
     ] = None
 
-    @field_validator('first_name', 'last_name', 'middle_name')
-    def normalize_and_capitalize_names(cls, v: str) -> str:
-        if not v:
-            return v
-        v = unicodedata.normalize('NFKD', v)
-        v = ''.join(c for c in v if not unicodedata.combining(c))
-        v = ''.join(c for c in v if c.isalpha() or c.isspace())
-
-        def capitalize_word(word: str) -> str:
-            if len(word) <= 1:
-                return word.upper()
-            return word[0].upper() + word[1:].lower()
-
-        return ' '.join(capitalize_word(word) for word in v.split())
-
     @field_validator('email')
     def normalize_email(cls, v: str) -> str:
         return v.lower().strip()
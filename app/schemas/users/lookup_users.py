@@ -0,0 +1,25 @@
+from pydantic import BaseModel, field_validator, model_validator
+from pydantic.config import ConfigDict
+from typing import List
+
+from app.exceptions import InvalidNullValueExeption
+
+def normalize_lookup_keys(keys: List[str]) -> List[str]:
+    """Usernames y emails se guardan en minúsculas; se eliminan duplicados conservando el orden"""
+    return list(dict.fromkeys(key.strip().lower() for key in keys if key.strip()))
+
+class LookupUsersSchema(BaseModel):
+    usernames: List[str] = []
+    emails: List[str] = []
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator('usernames', 'emails')
+    def normalize_keys(cls, v: List[str]) -> List[str]:
+        return normalize_lookup_keys(v)
+
+    @model_validator(mode='after')
+    def at_least_one_key(cls, values):
+        if not values.usernames and not values.emails:
+            raise InvalidNullValueExeption(allowed_fields=['usernames', 'emails'])
+        return values
@@ -0,0 +1,4 @@
+from .json_provider import OrjsonJSONProvider, setup_json_provider
+from .serializers import column_keys, rows_to_dicts, serializer_for
+
+__all__ = ['OrjsonJSONProvider', 'column_keys', 'rows_to_dicts', 'serializer_for', 'setup_json_provider']
@@ -0,0 +1,53 @@
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Proveedor JSON de Flask basado en orjson, con la misma salida que el proveedor por defecto.
+
+    Conserva `sort_keys`, el modo compacto/indentado y la conversión de fechas a
+    fecha HTTP; las llamadas con argumentos propios de `json.dumps` usan el
+    proveedor por defecto.
+    """
+    def _options(self, indent: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent)) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+JSON_PROVIDERS = ('auto', 'orjson', 'default')
+
+def setup_json_provider(app: Flask) -> None:
+    """Instala el proveedor JSON indicado en JSON_PROVIDER (auto usa orjson si está instalado)"""
+    provider = app.config.get('JSON_PROVIDER', 'auto')
+    if provider not in JSON_PROVIDERS:
+        raise ValueError(f"Invalid JSON_PROVIDER '{provider}'. Expected one of: {', '.join(JSON_PROVIDERS)}")
+    if provider == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_PROVIDER=orjson requires orjson. Install the 'speedups' extra.")
+    if provider == 'default' or orjson is None:
+        return
+    app.json = OrjsonJSONProvider(app)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import inspect
+
+def column_keys(model: type) -> Tuple[str, ...]:
+    """Atributos de columna del modelo en orden de declaración"""
+    return tuple(attribute.key for attribute in inspect(model).column_attrs)
+
+@lru_cache(maxsize=None)
+def serializer_for(model: type, fields: Optional[Tuple[str, ...]] = None) -> Callable[[Any], Dict[str, Any]]:
+    """Genera (una vez por modelo y conjunto de campos) la función instancia -> dict"""
+    keys = fields or column_keys(model)
+    getter = attrgetter(*keys)
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda instance: {key: getter(instance)}
+    return lambda instance: dict(zip(keys, getter(instance)))
+
+def rows_to_dicts(keys: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Convierte tuplas `Row` de una consulta por columnas sin pasar por instancias ORM"""
+    return [dict(zip(keys, row)) for row in rows]
@@ -0,0 +1,108 @@
+import logging
+import multiprocessing
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+from .config import Config, build_engine_options, db, warm_pool
+from .instrumentation import MetricsRegistry
+
+logger = logging.getLogger('app.server')
+
+def default_workers() -> int:
+    return multiprocessing.cpu_count() * 2 + 1
+
+def build_options(
+        bind: Optional[str] = None,
+        workers: Optional[int] = None,
+        threads: Optional[int] = None,
+        keepalive: Optional[int] = None,
+        timeout: Optional[int] = None,
+        graceful_timeout: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        preload: bool = True) -> Dict[str, Any]:
+    """Opciones de gunicorn a partir de argumentos o variables de entorno SERVER_*"""
+    threads = threads or int(os.getenv('SERVER_THREADS', 4))
+    max_requests = max_requests if max_requests is not None else int(os.getenv('SERVER_MAX_REQUESTS', 0))
+    return {
+        'bind': bind or os.getenv('SERVER_BIND', f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', 5000)}"),
+        'workers': workers or int(os.getenv('SERVER_WORKERS', default_workers())),
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'keepalive': keepalive or int(os.getenv('SERVER_KEEPALIVE', 5)),
+        'timeout': timeout or int(os.getenv('SERVER_TIMEOUT', 30)),
+        'graceful_timeout': graceful_timeout or int(os.getenv('SERVER_GRACEFUL_TIMEOUT', 30)),
+        'max_requests': max_requests,
+        'max_requests_jitter': max_requests // 10,
+        'preload_app': preload,
+    }
+
+def serve_config(options: Dict[str, Any], config_class: type = Config) -> type:
+    """Configuración de la app ajustada a las opciones del servidor"""
+    # El pool de cada worker se dimensiona con los hilos efectivos (p. ej. --threads), no con SERVER_THREADS
+    overrides = {
+        'SERVER_THREADS': options['threads'],
+        'SQLALCHEMY_ENGINE_OPTIONS': build_engine_options(config_class.SQLALCHEMY_DATABASE_URI, options['threads']),
+    }
+    if options['workers'] > 1 and config_class.USER_CACHE_BACKEND == 'memory':
+        # Una caché por proceso solo se invalida en el worker que atiende la escritura
+        logger.warning("USER_CACHE_BACKEND=memory is per-process; disabling the user cache with %s workers. "
+                       "Use USER_CACHE_BACKEND=shared to cache across workers.", options['workers'])
+        overrides['USER_CACHE_BACKEND'] = 'none'
+    if options['workers'] > 1 and config_class.USER_BLOOM_ENABLED:
+        # Cada worker tiene su filtro: un alta en otro worker respondería 404 hasta la siguiente reconstrucción
+        logger.warning("USER_BLOOM_ENABLED is per-process; disabling the identity filter with %s workers.",
+                       options['workers'])
+        overrides['USER_BLOOM_ENABLED'] = False
+    if options['workers'] > 1 and config_class.METRICS_ENABLED and not config_class.METRICS_DIR:
+        # Sin directorio compartido /metrics solo mostraría el worker que atiende la petición
+        overrides['METRICS_DIR'] = tempfile.mkdtemp(prefix='users-metrics-')
+        logger.info("METRICS_DIR not set; aggregating worker metrics in %s", overrides['METRICS_DIR'])
+    return type('ServeConfig', (config_class,), overrides)
+
+def prepare_worker(app) -> None:
+    """Descarta en el worker las conexiones heredadas del proceso master y precalienta su pool"""
+    with app.app_context():
+        db.engine.dispose(close=False)
+        if 'db_replicas' in app.extensions:
+            app.extensions['db_replicas'].dispose(close=False)
+        warm_pool(db.engine, app.config.get('DB_POOL_WARMUP', 0))
+
+def post_fork(server, worker) -> None:
+    # Sin preload la app todavía no existe: se crea (y prepara) después en el propio worker
+    app = worker.app.callable
+    if app is not None:
+        prepare_worker(app)
+
+def serve(app_factory: Callable[[], Any], options: Dict[str, Any], metrics_dir: Optional[str] = None) -> None:
+    """Sirve la aplicación con gunicorn (multi-proceso, recarga gradual con SIGHUP).
+
+    `app_factory` se llama en el master con preload, en cada worker sin preload
+    y de nuevo en cada recarga con SIGHUP.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("gunicorn is required for 'serve'. Install the 'server' extra.")
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+            self.cfg.set('post_fork', post_fork)
+
+        def load(self):
+            app = app_factory()
+            if not self.cfg.preload_app:
+                prepare_worker(app)
+            return app
+
+        def reload(self):
+            super().reload()
+            # Con preload el master vuelve a crear la app antes de lanzar los nuevos workers
+            self.callable = None
+
+    # Las instantáneas de métricas de una ejecución anterior no deben sumarse a la nueva
+    if metrics_dir:
+        MetricsRegistry(metrics_dir).clear_directory()
+    Application().run()
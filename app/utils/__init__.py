@@ -0,0 +1,7 @@
+from .batching import chunked
+from .cursor import encode_cursor, decode_cursor
+from .etag import user_etag
+from .json_stream import EmptyJSONDocumentError, JSONItemTooLargeError, NotAJSONArrayError, iter_json_array
+from .log_records import RESERVED_RECORD_ATTRS
+
+__all__ = ['chunked', 'RESERVED_RECORD_ATTRS', 'encode_cursor', 'decode_cursor', 'iter_json_array', 'user_etag', 'EmptyJSONDocumentError', 'JSONItemTooLargeError', 'NotAJSONArrayError']
@@ -0,0 +1,15 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Divide un iterable en listas de como máximo `size` elementos"""
+    if size < 1:
+        raise ValueError("chunk size must be greater than zero")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,24 @@
+import base64
+import json
+from typing import Any, List, Optional
+
+def encode_cursor(order_by: str, values: List[Any]) -> str:
+    """Codifica la posición de una página como un token opaco"""
+    payload = json.dumps({'o': order_by, 'v': values}, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: str, order_by: str, length: Optional[int] = None) -> List[str]:
+    """Decodifica un cursor y valida que corresponda al orden solicitado (`length` columnas de texto)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Malformed cursor: {e}")
+    if not isinstance(payload, dict) or payload.get('o') != order_by or not isinstance(payload.get('v'), list):
+        raise ValueError("Cursor does not match the requested ordering")
+    values = payload['v']
+    if length is not None and len(values) != length:
+        raise ValueError("Unexpected cursor length")
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError("Cursor values must be strings")
+    return values
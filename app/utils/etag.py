@@ -0,0 +1,5 @@
+from typing import Any
+
+def user_etag(uuid: Any, version: int) -> str:
+    """ETag (sin comillas) de la representación de un usuario: cambia con cada UPDATE"""
+    return f"{uuid}.{version}"
@@ -0,0 +1,107 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+class NotAJSONArrayError(ValueError):
+    """El documento JSON no es un array"""
+
+class EmptyJSONDocumentError(ValueError):
+    """No se recibió ningún dato (o solo espacios)"""
+
+class JSONItemTooLargeError(ValueError):
+    """Un elemento del array supera `max_item_bytes`"""
+    def __init__(self, size: int, limit: int):
+        super().__init__(f"JSON array item larger than {limit} bytes")
+        self.size = size
+        self.limit = limit
+
+def _wait_for_more(pending: int, max_item_bytes: Optional[int]) -> None:
+    if max_item_bytes is not None and pending > max_item_bytes:
+        raise JSONItemTooLargeError(pending, max_item_bytes)
+
+def iter_json_array(chunks: Iterable[bytes], max_item_bytes: Optional[int] = None) -> Iterator[Any]:
+    """Decodifica incrementalmente un array JSON recibido por trozos y produce sus elementos.
+
+    Solo se mantiene en memoria el elemento en curso. Un elemento incompleto no se
+    vuelve a decodificar hasta que sus datos pendientes se duplican, de modo que
+    el coste total es lineal aunque llegue en muchos trozos. Lanza ValueError si
+    el documento está mal formado, NotAJSONArrayError si no es un array,
+    EmptyJSONDocumentError si no hay contenido y JSONItemTooLargeError si un
+    elemento supera `max_item_bytes` (medido en caracteres decodificados).
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ''
+    state = 'start'
+    chunks = iter(chunks)
+    final = False
+    # Datos pendientes del elemento en curso a partir de los que se reintenta decodificarlo
+    retry_at = 0
+
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        try:
+            buffer += text_decoder.decode(b'' if final else chunk, final=final)
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid UTF-8 in body: {e}")
+
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if state == 'start':
+                if char != '[':
+                    raise NotAJSONArrayError("Body is not a JSON array")
+                position += 1
+                state = 'first'
+            elif state == 'separator':
+                if char == ',':
+                    position += 1
+                    state = 'item'
+                elif char == ']':
+                    position += 1
+                    state = 'end'
+                else:
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            elif state == 'first' and char == ']':
+                position += 1
+                state = 'end'
+            elif state in ('first', 'item'):
+                pending = len(buffer) - position
+                if not final and pending < retry_at:
+                    break
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if final:
+                        raise ValueError(str(e))
+                    _wait_for_more(pending, max_item_bytes)
+                    retry_at = 2 * pending
+                    break
+                # Un número o literal cortado ('1' de '1.5') puede continuar en el siguiente trozo
+                if not final and not isinstance(item, (dict, list, str)) and (
+                        end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    _wait_for_more(pending, max_item_bytes)
+                    retry_at = 2 * pending
+                    break
+                if max_item_bytes is not None and end - position > max_item_bytes:
+                    raise JSONItemTooLargeError(end - position, max_item_bytes)
+                yield item
+                position = end
+                retry_at = 0
+                state = 'separator'
+            else:
+                raise ValueError("Unexpected data after the end of the JSON array")
+        buffer = buffer[position:]
+
+    if state == 'start':
+        raise EmptyJSONDocumentError("Empty body")
+    if state != 'end':
+        raise ValueError("Unterminated JSON array")
@@ -0,0 +1,4 @@
+import logging
+
+# Atributos propios de LogRecord: no pueden pasarse en `extra` ni se copian al JSON
+RESERVED_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'getMessage'}
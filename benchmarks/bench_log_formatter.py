@@ -0,0 +1,96 @@
+"""Micro-benchmark de CustomJSONFormatter.
+
+Compara el formatter anterior (conjunto de exclusión reconstruido en cada
+llamada, sondeos con hasattr y json.dumps(default=str)) con el actual, sobre
+registros como los que emite `handle_app_exception`:
+
+    python -m benchmarks.bench_log_formatter --records 50000
+"""
+import argparse
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.config import logging as log_config
+from app.config.logging import CustomJSONFormatter
+
+class LegacyJSONFormatter(logging.Formatter):
+    """Implementación anterior, conservada solo como referencia del benchmark"""
+    def format(self, record):
+        log_data = {
+            'timestamp': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if hasattr(record, 'exception_type'):
+            log_data['exception_type'] = record.exception_type
+        if hasattr(record, 'error_message'):
+            log_data['error_message'] = record.error_message
+        if hasattr(record, 'status_code'):
+            log_data['status_code'] = record.status_code
+        if hasattr(record, 'details'):
+            log_data['details'] = record.details
+        if hasattr(record, 'timestamp') and record.timestamp != log_data['timestamp']:
+            log_data['exception_timestamp'] = record.timestamp
+        excluded_fields = {
+            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+            'filename', 'module', 'lineno', 'funcName', 'created',
+            'msecs', 'relativeCreated', 'thread', 'threadName',
+            'processName', 'process', 'message', 'exc_info', 'exc_text',
+            'stack_info', 'getMessage', 'exception_type', 'error_message',
+            'status_code', 'details', 'timestamp'
+        }
+        for key, value in record.__dict__.items():
+            if key not in excluded_fields and not key.startswith('_'):
+                log_data[key] = value
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+def build_record() -> logging.LogRecord:
+    record = logging.LogRecord('app.errors', logging.WARNING, __file__, 1, "Application Error: User not found", (), None)
+    record.__dict__.update({
+        'exception_type': 'UserNotFoundException',
+        'error_message': 'User not found',
+        'status_code': 404,
+        'details': {'username': 'ana.garcia'},
+        'timestamp': datetime.utcnow().isoformat(),
+        'request_endpoint': 'api.users.get_user',
+        'request_method': 'GET',
+        'request_url': 'http://localhost/api/users/?username=ana.garcia',
+        'client_ip': '127.0.0.1',
+        'user_agent_header': 'benchmark',
+        'duration_ms': 1.25,
+        'db_time_ms': 0.5,
+        'db_statements': 1
+    })
+    return record
+
+def measure(formatter: logging.Formatter, record: logging.LogRecord, records: int) -> float:
+    started = time.perf_counter()
+    for _ in range(records):
+        formatter.format(record)
+    return records / (time.perf_counter() - started)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='CustomJSONFormatter micro-benchmark')
+    parser.add_argument('--records', type=int, default=50000, help='Records formatted per run')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per formatter (best is reported)')
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    record = build_record()
+    results: Dict[str, float] = {}
+    for name, formatter in (('before', LegacyJSONFormatter()), ('after', CustomJSONFormatter())):
+        results[name] = round(max(measure(formatter, record, args.records) for _ in range(args.repeat)))
+    print(json.dumps({
+        'json_backend': 'orjson' if log_config.orjson is not None else 'json',
+        'records_per_second': results,
+        'speedup': round(results['after'] / results['before'], 2)
+    }, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Micro-benchmark de validación de CreateUserSchema.
+
+Mide validaciones por segundo con el normalizador de nombres anterior
+(NFKD y dos pasadas por carácter en cada llamada), con el actual fila a fila
+y con la ruta masiva `validate_rows`:
+
+    python -m benchmarks.bench_validation --rows 5000
+"""
+import argparse
+import json
+import time
+import unicodedata
+from typing import Annotated, Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, EmailStr, StringConstraints, field_validator
+
+from app.schemas import CreateUserSchema, validate_rows
+from app.schemas.normalization import NAME_PATTERN, normalize_name
+
+from .factories import UserPayloadFactory
+
+def legacy_normalize(v: str) -> str:
+    """Normalizador anterior, conservado solo como referencia del benchmark"""
+    if not v:
+        return v
+    v = unicodedata.normalize('NFKD', v)
+    v = ''.join(c for c in v if not unicodedata.combining(c))
+    v = ''.join(c for c in v if c.isalpha() or c.isspace())
+
+    def capitalize_word(word: str) -> str:
+        if len(word) <= 1:
+            return word.upper()
+        return word[0].upper() + word[1:].lower()
+
+    return ' '.join(capitalize_word(word) for word in v.split())
+
+LegacyName = Annotated[str, StringConstraints(min_length=2, max_length=30, strip_whitespace=True, pattern=NAME_PATTERN)]
+LegacyPhone = Annotated[str, StringConstraints(max_length=20, strip_whitespace=True, pattern=r'^[\d\s\-\+\(\)]+$')]
+
+class LegacyCreateUserSchema(BaseModel):
+    """CreateUserSchema anterior: campos `str` sin AfterValidator y el normalizador como field_validator"""
+    first_name: LegacyName
+    middle_name: Optional[LegacyName] = None
+    last_name: LegacyName
+    email: EmailStr
+    phone: Optional[LegacyPhone] = None
+
+    @field_validator('first_name', 'last_name', 'middle_name')
+    def normalize_and_capitalize_names(cls, v: str) -> str:
+        return legacy_normalize(v)
+
+    @field_validator('email')
+    def normalize_email(cls, v: str) -> str:
+        return v.lower().strip()
+
+    @field_validator('phone')
+    def normalize_phone(cls, v: Optional[str]) -> Optional[str]:
+        if not v:
+            return None
+        return ''.join(c for c in v if c.isdigit() or c in '+-() ').strip()
+
+def rate(run: Callable[[], Any], items: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return round(items / best)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='CreateUserSchema validation micro-benchmark')
+    parser.add_argument('--rows', type=int, default=5000, help='Payloads validated per run')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    rows: List[Dict[str, Any]] = UserPayloadFactory.build_batch(args.rows)
+    names = [row['last_name'] for row in rows]
+
+    results = {
+        'names_per_second': {
+            'before': rate(lambda: [legacy_normalize(name) for name in names], len(names), args.repeat),
+            'after': rate(lambda: [normalize_name(name) for name in names], len(names), args.repeat)
+        },
+        'validations_per_second': {
+            'before': rate(lambda: [LegacyCreateUserSchema.model_validate(row) for row in rows], len(rows), args.repeat),
+            'after_per_row': rate(lambda: [CreateUserSchema.model_validate(row) for row in rows], len(rows), args.repeat),
+            'after_bulk': rate(lambda: validate_rows(CreateUserSchema, rows), len(rows), args.repeat)
+        }
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,32 @@
+import random
+import string
+
+import factory
+from faker import Faker
+
+fake = Faker()
+
+def letters(number: int, prefix: str = '') -> str:
+    """Codifica un entero en letras para generar nombres únicos que cumplan el esquema"""
+    result = ''
+    number += 1
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        result = string.ascii_lowercase[remainder] + result
+    return (prefix + result).capitalize()
+
+RUN_TAG = ''.join(random.choices(string.ascii_lowercase, k=4))
+
+class UserPayloadFactory(factory.DictFactory):
+    first_name = factory.Sequence(lambda n: letters(n, RUN_TAG))
+    last_name = factory.LazyFunction(lambda: ''.join(c for c in fake.last_name() if c.isalpha())[:20] or 'Bench')
+    email = factory.Sequence(lambda n: f"bench.{RUN_TAG}.{n}@example.com")
+    phone = factory.LazyFunction(lambda: fake.numerify('+34 ### ### ###'))
+
+class AddressPayloadFactory(factory.DictFactory):
+    street = factory.LazyFunction(lambda: ''.join(c for c in fake.street_name() if c.isalnum() or c == ' ')[:50])
+    number = factory.Faker('pyint', min_value=1, max_value=9999)
+    city = factory.LazyFunction(lambda: ''.join(c for c in fake.city() if c.isalnum() or c == ' ')[:30])
+    state = factory.LazyFunction(lambda: ''.join(c for c in fake.state() if c.isalnum() or c == ' ')[:30])
+    country = 'Spain'
+    instructions = factory.Faker('sentence')
@@ -0,0 +1,197 @@
+"""Benchmark de carga de la API.
+
+Arranca `create_app` contra una base de datos local, siembra usuarios y
+direcciones y lanza cada escenario con distintos niveles de concurrencia.
+El resultado (latencias p50/p95/p99 y RPS) se emite como JSON y puede
+compararse con una ejecución anterior:
+
+    python -m benchmarks.load --users 2000 --concurrency 1,8,32 --output run.json
+    python -m benchmarks.load --baseline run.json --max-regression 0.15
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from werkzeug.serving import make_server
+
+from app import create_app
+from app.config import Config, db
+from app.controllers import UserController
+from app.migrations import MIGRATIONS, migrate
+from app.models import UserStatus
+
+from .factories import AddressPayloadFactory, UserPayloadFactory
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+def seed(app, users: int, addresses_per_user: int) -> List[Dict[str, Any]]:
+    """Crea los usuarios y direcciones de partida y devuelve sus identificadores"""
+    with app.app_context():
+        migrate(db.engine, MIGRATIONS)
+        rows = [(index, UserPayloadFactory()) for index in range(users)]
+        addresses = {index: AddressPayloadFactory.build_batch(addresses_per_user) for index, _ in rows}
+        results = UserController.create_users_bulk(rows, chunk_size=1000, addresses=addresses)
+    return [
+        {'username': result['user']['username'], 'email': result['user']['email']}
+        for result in results if result['status'] == 'created'
+    ]
+
+def build_scenarios(identities: List[Dict[str, Any]]) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    """Cada escenario devuelve los argumentos de una petición httpx"""
+    def pick():
+        return random.choice(identities)
+
+    return {
+        'get_user_by_username': lambda: {'method': 'GET', 'url': '/api/users/', 'params': {'username': pick()['username']}},
+        'get_user_by_email': lambda: {'method': 'GET', 'url': '/api/users/', 'params': {'email': pick()['email']}},
+        'get_user_include_addresses': lambda: {
+            'method': 'GET', 'url': '/api/users/', 'params': {'username': pick()['username'], 'include': 'addresses'}
+        },
+        'get_user_not_found': lambda: {'method': 'GET', 'url': '/api/users/', 'params': {'username': f"missing{random.random()}"}},
+        'list_users': lambda: {'method': 'GET', 'url': '/api/users/list', 'params': {'limit': 50, 'order_by': 'last_name'}},
+        'get_user_addresses': lambda: {'method': 'GET', 'url': '/api/addresses/user', 'params': {'username': pick()['username']}},
+        'create_user': lambda: {'method': 'POST', 'url': '/api/users/', 'json': UserPayloadFactory()},
+        'create_users_bulk': lambda: {'method': 'POST', 'url': '/api/users/bulk', 'json': UserPayloadFactory.build_batch(100)},
+        'create_address': lambda: {
+            'method': 'POST', 'url': '/api/addresses/', 'params': {'username': pick()['username']}, 'json': AddressPayloadFactory()
+        },
+        'update_user': lambda: {
+            'method': 'PATCH', 'url': '/api/users/update/', 'params': {'username': pick()['username']},
+            'json': {'middle_name': random.choice(['Alpha', 'Beta', 'Gamma', 'Delta'])}
+        },
+        'update_user_status': lambda: {
+            'method': 'PATCH', 'url': '/api/users/status/', 'params': {'username': pick()['username']},
+            'json': {'status': random.choice([status.value for status in UserStatus])}
+        },
+    }
+
+def run_scenario(base_url: str, make_request: Callable[[], Dict[str, Any]], concurrency: int, requests: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    client_errors = 0
+    lock = threading.Lock()
+    local = threading.local()
+
+    def worker(_):
+        nonlocal errors, client_errors
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = httpx.Client(base_url=base_url, timeout=30)
+        request = make_request()
+        start = time.perf_counter()
+        try:
+            response = client.request(**request)
+            failed = response.status_code >= 500
+            rejected = 400 <= response.status_code < 500
+        except httpx.HTTPError:
+            failed = True
+            rejected = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            errors += failed
+            client_errors += rejected
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(requests)))
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'client_errors': client_errors,
+        'rps': round(requests / duration, 2) if duration else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Lista de regresiones de p95 o RPS por encima del umbral respecto a la línea base"""
+    regressions = []
+    for key, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(key)
+        if not previous:
+            continue
+        if previous['p95_ms'] and current['p95_ms'] > previous['p95_ms'] * (1 + max_regression):
+            regressions.append(f"{key}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if previous['rps'] and current['rps'] < previous['rps'] * (1 - max_regression):
+            regressions.append(f"{key}: rps {previous['rps']} -> {current['rps']}")
+    return regressions
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.load', description=__doc__.splitlines()[0])
+    parser.add_argument('--db-uri', default=None, help='Database URI (default: fresh SQLite file)')
+    parser.add_argument('--users', type=int, default=1000, help='Users to seed')
+    parser.add_argument('--addresses', type=int, default=2, help='Addresses per seeded user')
+    parser.add_argument('--concurrency', default='1,8,32', help='Comma-separated concurrency levels')
+    parser.add_argument('--requests', type=int, default=500, help='Requests per scenario and concurrency level')
+    parser.add_argument('--scenarios', default=None, help='Comma-separated subset of scenarios')
+    parser.add_argument('--output', default=None, help='Write the JSON report to this file')
+    parser.add_argument('--baseline', default=None, help='Compare against a previous JSON report')
+    parser.add_argument('--max-regression', type=float, default=0.2, help='Allowed regression ratio against the baseline')
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    db_uri = args.db_uri or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = db_uri
+
+    app = create_app(BenchmarkConfig)
+    identities = seed(app, args.users, args.addresses)
+    scenarios = build_scenarios(identities)
+    if args.scenarios:
+        scenarios = {name: scenarios[name] for name in args.scenarios.split(',')}
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = {
+        'database': db_uri.split(':', 1)[0],
+        'seeded_users': len(identities),
+        'scenarios': {}
+    }
+    try:
+        for concurrency in (int(level) for level in args.concurrency.split(',')):
+            for name, make_request in scenarios.items():
+                results['scenarios'][f"{name}@{concurrency}"] = run_scenario(
+                    base_url, make_request, concurrency, args.requests
+                )
+                print(f"{name}@{concurrency}: {results['scenarios'][f'{name}@{concurrency}']}", file=sys.stderr)
+    finally:
+        server.shutdown()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(report)
+    print(report)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
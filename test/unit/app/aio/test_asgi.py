@@ -0,0 +1,126 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.aio import AsyncApp, create_asgi_app
+from app.exceptions import UserNotFoundException, UserPreconditionFailedException
+
+pytestmark = pytest.mark.anyio
+
+USER = {
+    "username": "anatorres",
+    "uuid": "123e4567-e89b-12d3-a456-426614174000",
+    "version": 3,
+    "status": "active"
+}
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+@pytest.fixture
+def async_client(app):
+    transport = httpx.ASGITransport(app=AsyncApp(app))
+    return httpx.AsyncClient(transport=transport, base_url='http://testserver')
+
+class TestAsyncApp:
+    async def test_ping(self, async_client):
+        async with async_client as client:
+            response = await client.get('/ping')
+
+        assert response.status_code == 200
+        assert response.text == 'pong'
+
+    @patch('app.aio.asgi.AsyncUserController.get_user', new_callable=AsyncMock, return_value=USER)
+    async def test_get_user_etag(self, mock_get_user, async_client):
+        async with async_client as client:
+            response = await client.get('/api/users/', params={'username': 'anatorres'})
+            cached = await client.get('/api/users/', params={'username': 'anatorres'},
+                                      headers={'If-None-Match': response.headers['ETag']})
+
+        assert response.status_code == 200
+        assert response.json() == USER
+        assert response.headers['ETag'] == f'"{USER["uuid"]}.3"'
+        assert cached.status_code == 304
+        assert cached.content == b''
+        mock_get_user.assert_awaited_with('username', 'anatorres', None)
+
+    @patch('app.aio.asgi.AsyncUserController.get_user', new_callable=AsyncMock,
+           side_effect=UserNotFoundException('username', 'nadie'))
+    async def test_app_exception(self, mock_get_user, async_client):
+        async with async_client as client:
+            response = await client.get('/api/users/', params={'username': 'nadie'})
+
+        assert response.status_code == 404
+        assert response.json()['status_code'] == 404
+
+    async def test_invalid_query_params(self, async_client):
+        async with async_client as client:
+            response = await client.get('/api/users/', params={'phone': '123'})
+
+        assert response.status_code == 400
+
+    @patch('app.aio.asgi.AsyncUserController.create_user', new_callable=AsyncMock, return_value=USER)
+    async def test_create_user(self, mock_create_user, async_client):
+        payload = {"first_name": "Ana", "last_name": "Torres", "email": "ana@example.com"}
+        async with async_client as client:
+            response = await client.post('/api/users/', json=payload)
+
+        assert response.status_code == 201
+        assert mock_create_user.await_args.args[0]['email'] == 'ana@example.com'
+
+    async def test_create_user_invalid_body(self, async_client):
+        async with async_client as client:
+            missing = await client.post('/api/users/', content=b'', headers={'Content-Type': 'application/json'})
+            invalid = await client.post('/api/users/', json={"first_name": "Ana"})
+
+        assert missing.status_code == 400
+        assert invalid.status_code == 400
+
+    async def test_body_too_large(self, app, async_client):
+        app.config['MAX_JSON_BODY_BYTES'] = 10
+        try:
+            async with async_client as client:
+                response = await client.post('/api/users/', json={"first_name": "Ana Torres"})
+        finally:
+            app.config.pop('MAX_JSON_BODY_BYTES')
+
+        assert response.status_code == 413
+
+    @patch('app.aio.asgi.AsyncUserController.update_user', new_callable=AsyncMock,
+           side_effect=UserPreconditionFailedException('username', 'anatorres', 4))
+    async def test_update_user_precondition_failed(self, mock_update_user, async_client):
+        async with async_client as client:
+            response = await client.patch('/api/users/update/', params={'username': 'anatorres'},
+                                          json={"middle_name": "Isabela"}, headers={'If-Match': '"x.3"'})
+
+        assert response.status_code == 412
+        assert mock_update_user.await_args.args[3].contains('x.3')
+
+    @patch('app.aio.asgi.AsyncUserController.update_user_status', new_callable=AsyncMock, return_value=USER)
+    async def test_update_user_status(self, mock_update_status, async_client):
+        async with async_client as client:
+            response = await client.patch('/api/users/status/', params={'username': 'anatorres'},
+                                          json={"status": "pending"})
+
+        assert response.status_code == 204
+        assert response.headers['ETag'] == f'"{USER["uuid"]}.3"'
+
+    async def test_not_found_and_method_not_allowed(self, async_client):
+        async with async_client as client:
+            missing = await client.get('/api/unknown')
+            not_allowed = await client.delete('/api/users/')
+
+        assert missing.status_code == 404
+        assert not_allowed.status_code == 405
+        assert not_allowed.json()['status_code'] == 405
+
+    async def test_shared_cache_is_rejected(self, app):
+        previous = app.config.get('USER_CACHE_BACKEND')
+        app.config['USER_CACHE_BACKEND'] = 'shared'
+        try:
+            with pytest.raises(ValueError):
+                create_asgi_app(app)
+        finally:
+            app.config['USER_CACHE_BACKEND'] = previous
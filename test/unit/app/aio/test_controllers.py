@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip('greenlet')
+pytest.importorskip('aiosqlite')
+
+from sqlalchemy import create_engine
+from werkzeug.http import parse_etags
+
+from app.aio import AsyncUserController, async_db
+from app.exceptions import UserNotFoundException, UserPreconditionFailedException
+from app.models import db
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+@pytest.fixture
+async def async_database(tmp_path):
+    path = tmp_path / 'async.db'
+    engine = create_engine(f"sqlite:///{path}")
+    db.metadata.create_all(engine)
+    engine.dispose()
+    async_db.init(f"sqlite+aiosqlite:///{path}")
+    try:
+        yield async_db
+    finally:
+        await async_db.remove_session()
+        await async_db.dispose()
+
+class TestAsyncUserController:
+    async def test_create_and_get_user(self, async_database):
+        created = await AsyncUserController.create_user(
+            {"first_name": "Ana", "last_name": "Torres", "email": "ana.async@example.com"})
+
+        user = await AsyncUserController.get_user('email', 'ana.async@example.com', ('uuid', 'version'))
+
+        assert user == {'uuid': created['uuid'], 'version': 1}
+
+    async def test_update_user_status_checks_version(self, async_database):
+        created = await AsyncUserController.create_user(
+            {"first_name": "Luis", "last_name": "Gomez", "email": "luis.async@example.com"})
+
+        result = await AsyncUserController.update_user_status('uuid', created['uuid'], {'status': 'pending'})
+
+        assert result == {'uuid': created['uuid'], 'version': 2}
+        with pytest.raises(UserPreconditionFailedException):
+            await AsyncUserController.update_user_status(
+                'uuid', created['uuid'], {'status': 'inactive'}, parse_etags(f'"{created["uuid"]}.1"'))
+
+    async def test_get_user_not_found(self, async_database):
+        with pytest.raises(UserNotFoundException):
+            await AsyncUserController.get_user('email', 'nobody.async@example.com')
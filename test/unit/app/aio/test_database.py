@@ -0,0 +1,17 @@
+import pytest
+
+from app.aio import async_database_uri
+
+class TestAsyncDatabaseUri:
+    @pytest.mark.parametrize('uri, expected', [
+        ('mysql+pymysql://user:secret@db:3306/users', 'mysql+aiomysql://user:secret@db:3306/users'),
+        ('sqlite:////tmp/users.db', 'sqlite+aiosqlite:////tmp/users.db'),
+        ('postgresql://user@db/users', 'postgresql+asyncpg://user@db/users'),
+        ('mysql+aiomysql://user@db/users', 'mysql+aiomysql://user@db/users'),
+    ])
+    def test_maps_sync_driver(self, uri, expected):
+        assert async_database_uri(uri) == expected
+
+    def test_unknown_driver(self):
+        with pytest.raises(ValueError, match='ASYNC_DB_URI'):
+            async_database_uri('oracle+cx_oracle://user@db/users')
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from app.cache import MemoryCacheBackend, SharedCacheBackend, LocalSharedClient
+
+class TestMemoryCacheBackend:
+    def test_hit_and_miss_counters(self):
+        cache = MemoryCacheBackend(max_entries=10, ttl=60)
+        cache.set('a', {'value': 1})
+
+        assert cache.get('a') == {'value': 1}
+        assert cache.get('b') is None
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['size'] == 1
+
+    def test_lru_eviction(self):
+        cache = MemoryCacheBackend(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiration(self):
+        cache = MemoryCacheBackend(max_entries=2, ttl=10)
+        with patch('app.cache.backends.time.monotonic', return_value=100):
+            cache.set('a', 1)
+        with patch('app.cache.backends.time.monotonic', return_value=111):
+            assert cache.get('a') is None
+        assert cache.stats()['expirations'] == 1
+
+
+class TestSharedCacheBackend:
+    def test_roundtrip_with_local_client(self):
+        cache = SharedCacheBackend.from_url('local://', ttl=60)
+        assert isinstance(cache.client, LocalSharedClient)
+
+        cache.set('username:ana', {'username': 'ana'})
+        assert cache.get('username:ana') == {'username': 'ana'}
+        cache.delete('username:ana')
+        assert cache.get('username:ana') is None
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_clear_only_removes_prefix(self):
+        client = LocalSharedClient()
+        client.set('other:key', 'x')
+        cache = SharedCacheBackend(client, prefix='users:')
+        cache.set('email:a@b.com', {'email': 'a@b.com'})
+        cache.clear()
+
+        assert cache.get('email:a@b.com') is None
+        assert client.get('other:key') == b'x'
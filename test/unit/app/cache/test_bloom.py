@@ -0,0 +1,31 @@
+import pytest
+
+from app.cache import BloomFilter
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"user{index}" for index in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_close_to_target(self):
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for index in range(2000):
+            bloom.add(f"present{index}")
+        false_positives = sum(1 for index in range(10000) if f"absent{index}" in bloom)
+
+        assert false_positives / 10000 < 0.03
+
+    def test_memory_budget(self):
+        bloom = BloomFilter(capacity=1000000, error_rate=0.001, max_bytes=1024)
+        assert len(bloom.bits) == 1024
+        assert bloom.stats()['size_bytes'] == 1024
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
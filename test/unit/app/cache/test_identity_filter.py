@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+from app.cache import UserIdentityFilter
+
+class TestUserIdentityFilter:
+    def test_disabled_filter_allows_everything(self):
+        identity_filter = UserIdentityFilter()
+        assert identity_filter.might_exist('username', 'anyone') is True
+        assert identity_filter.stats() == {'enabled': False}
+
+    def test_rebuild_from_database(self, db_session, sample_user):
+        identity_filter = UserIdentityFilter()
+        identity_filter.rebuild(capacity=1000, error_rate=0.001)
+
+        assert identity_filter.might_exist('username', sample_user.username)
+        assert identity_filter.might_exist('email', sample_user.email.upper())
+        assert not identity_filter.might_exist('username', 'definitely-not-a-user')
+        assert identity_filter.stats()['negative_hits'] == 1
+
+    def test_add_keeps_filter_current(self, db_session):
+        identity_filter = UserIdentityFilter()
+        identity_filter.rebuild(capacity=1000, error_rate=0.001)
+        identity_filter.add({'username': 'newcomer', 'email': 'newcomer@example.com'})
+
+        assert identity_filter.might_exist('username', 'newcomer')
+        assert identity_filter.might_exist('email', 'newcomer@example.com')
+
+    def test_stale_filter_does_not_reject(self, db_session):
+        """Un filtro más antiguo que refresh_interval no descarta identidades creadas por otros procesos"""
+        identity_filter = UserIdentityFilter()
+        identity_filter.rebuild(capacity=1000, error_rate=0.001)
+        identity_filter.refresh_interval = 60
+
+        assert not identity_filter.might_exist('username', 'created-elsewhere')
+        identity_filter.built_at -= 61
+        with patch.object(identity_filter, '_refresh_in_background') as mock_refresh:
+            assert identity_filter.might_exist('username', 'created-elsewhere')
+        mock_refresh.assert_called_once()
+
+    def test_background_refresh_rebuilds(self, app, db_session, sample_user):
+        """La reconstrucción en segundo plano incorpora las altas de otros procesos"""
+        identity_filter = UserIdentityFilter()
+        app.config['USER_BLOOM_ENABLED'] = True
+        try:
+            with patch.object(UserIdentityFilter, 'rebuild') as mock_rebuild:
+                identity_filter.init_app(app)
+                identity_filter.filter = object()
+                identity_filter.built_at -= 3600
+                with patch('app.cache.identity_filter.threading.Thread') as mock_thread:
+                    identity_filter.might_exist('username', sample_user.username)
+                    mock_thread.call_args.kwargs['target']()
+        finally:
+            app.config.pop('USER_BLOOM_ENABLED')
+
+        assert mock_rebuild.call_count == 2
+        assert identity_filter._refreshing is False
@@ -0,0 +1,41 @@
+import pytest
+from flask import Flask
+
+from app.cache import UserCache, MemoryCacheBackend, SharedCacheBackend
+
+class TestUserCache:
+    user = {'uuid': '1', 'username': 'anatorres', 'email': 'ana@example.com'}
+
+    def test_disabled_cache_is_passthrough(self):
+        cache = UserCache()
+        cache.set(self.user)
+        assert cache.get('username', 'anatorres') is None
+        assert cache.stats() == {'backend': 'none'}
+
+    def test_set_indexes_by_username_and_email(self):
+        cache = UserCache(MemoryCacheBackend())
+        cache.set(self.user)
+
+        assert cache.get('username', 'anatorres') == self.user
+        assert cache.get('email', 'ana@example.com') == self.user
+        assert cache.get('uuid', '1') is None
+
+    def test_invalidate_removes_every_key(self):
+        cache = UserCache(MemoryCacheBackend())
+        cache.set(self.user)
+        cache.invalidate('username', 'anatorres')
+
+        assert cache.get('email', 'ana@example.com') is None
+
+    @pytest.mark.parametrize("backend, expected", [
+        ('memory', MemoryCacheBackend),
+        ('shared', SharedCacheBackend),
+    ])
+    def test_init_app_selects_backend(self, backend, expected):
+        app = Flask(__name__)
+        app.config['USER_CACHE_BACKEND'] = backend
+        cache = UserCache()
+        cache.init_app(app)
+
+        assert isinstance(cache.backend, expected)
+        assert app.extensions['user_cache'] is cache
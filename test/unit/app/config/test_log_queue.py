@@ -0,0 +1,117 @@
+import io
+import logging
+import queue
+
+import pytest
+
+from app.config.log_queue import BatchStreamHandler, BatchingQueueListener, BoundedQueueHandler, make_async, stop_log_listeners
+
+def make_record(message, level=logging.INFO, args=()):
+    return logging.LogRecord('app.test', level, __file__, 1, message, args, None)
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+class TestBoundedQueueHandler:
+    def test_drop_policy_counts_dropped_records(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), policy='drop')
+        for index in range(5):
+            handler.handle(make_record(f"message {index}"))
+
+        assert handler.queue.qsize() == 2
+        assert handler.take_dropped() == 3
+        assert handler.take_dropped() == 0
+
+    def test_prepare_freezes_message_without_formatting(self):
+        handler = BoundedQueueHandler(queue.Queue(), policy='block')
+        handler.handle(make_record("user %s", args=('ana',)))
+
+        record = handler.queue.get_nowait()
+        assert record.msg == 'user ana'
+        assert record.args is None
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(queue.Queue(), policy='ignore')
+
+class TestBatchingQueueListener:
+    def test_writes_batch_with_single_flush(self):
+        stream = CountingStream()
+        target = BatchStreamHandler(stream)
+        target.setFormatter(logging.Formatter('%(message)s'))
+        queue_handler = BoundedQueueHandler(queue.Queue(), policy='block')
+        for index in range(3):
+            queue_handler.handle(make_record(f"message {index}"))
+
+        listener = BatchingQueueListener(queue_handler, [target], batch_size=10)
+        listener.start()
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == ['message 0', 'message 1', 'message 2']
+        assert stream.flushes == 1
+
+    def test_respects_handler_level(self):
+        stream = io.StringIO()
+        target = BatchStreamHandler(stream)
+        target.setLevel(logging.WARNING)
+        queue_handler = BoundedQueueHandler(queue.Queue(), policy='block')
+        queue_handler.handle(make_record("info"))
+        queue_handler.handle(make_record("warning", level=logging.WARNING))
+
+        listener = BatchingQueueListener(queue_handler, [target])
+        listener.start()
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == ['warning']
+
+    def test_reports_dropped_records(self):
+        stream = io.StringIO()
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy='drop')
+        queue_handler.handle(make_record("kept"))
+        queue_handler.handle(make_record("dropped"))
+
+        listener = BatchingQueueListener(queue_handler, [BatchStreamHandler(stream)])
+        listener.start()
+        listener.stop()
+
+        assert listener.dropped_total == 1
+        assert '1 log records dropped' in stream.getvalue()
+
+def test_make_async_replaces_logger_handlers():
+    stream = io.StringIO()
+    logger = logging.getLogger('app.test.async')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers = [BatchStreamHandler(stream)]
+
+    make_async(logger, queue_size=100, policy='drop', batch_size=10)
+    logger.info("through the queue")
+    stop_log_listeners()
+
+    assert isinstance(logger.handlers[0], BoundedQueueHandler)
+    assert 'through the queue' in stream.getvalue()
+    logger.handlers = []
+
+def test_restart_after_fork_uses_new_queue():
+    stream = io.StringIO()
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=5), policy='drop')
+    listener = BatchingQueueListener(queue_handler, [BatchStreamHandler(stream)])
+    listener.start()
+    old_queue = listener.queue
+
+    listener.restart_after_fork()
+    # En un fork real el hilo anterior no existe en el hijo; aquí se detiene a mano
+    old_queue.put(None)
+    queue_handler.handle(make_record("after fork"))
+    listener.stop()
+
+    assert listener.queue is not old_queue
+    assert listener.queue is queue_handler.queue
+    assert listener.queue.maxsize == 5
+    assert 'after fork' in stream.getvalue()
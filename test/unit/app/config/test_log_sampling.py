@@ -0,0 +1,79 @@
+import logging
+
+import pytest
+
+from app.config.log_sampling import RateLimitFilter, parse_sample_ratios
+
+def make_record(exception_type='UserNotFoundException', endpoint='api.users.get_user', level=logging.WARNING):
+    record = logging.makeLogRecord({'name': 'app.test.sampling', 'levelno': level, 'levelname': logging.getLevelName(level), 'msg': 'error'})
+    record.exception_type = exception_type
+    record.request_endpoint = endpoint
+    return record
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('app.config.log_sampling.time.monotonic', lambda: now[0])
+    return now
+
+@pytest.fixture
+def summaries():
+    logger = logging.getLogger('app.test.sampling')
+    records = []
+
+    class Collector(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    handler = Collector()
+    logger.addHandler(handler)
+    logger.propagate = False
+    yield records
+    logger.removeHandler(handler)
+
+class TestRateLimitFilter:
+    def test_token_bucket_per_key(self, clock):
+        rate_limit = RateLimitFilter(rate=1, burst=2)
+
+        allowed = [rate_limit.filter(make_record()) for _ in range(4)]
+        other_key = rate_limit.filter(make_record(exception_type='UserAlreadyExistsException'))
+        clock[0] += 1
+        refilled = rate_limit.filter(make_record())
+
+        assert allowed == [True, True, False, False]
+        assert other_key is True
+        assert refilled is True
+
+    def test_summary_reports_suppressed_events(self, clock, summaries):
+        rate_limit = RateLimitFilter(rate=0, burst=1, summary_interval=60)
+        for _ in range(5):
+            rate_limit.filter(make_record())
+
+        clock[0] += 61
+        rate_limit.filter(make_record())
+
+        assert len(summaries) == 1
+        assert summaries[0].suppressed_events == 5
+        assert summaries[0].exception_type == 'UserNotFoundException'
+        assert rate_limit.filter(summaries[0]) is True
+
+    def test_sample_ratio_per_level(self, clock):
+        rate_limit = RateLimitFilter(rate=1000, burst=1000, sample_ratios={logging.WARNING: 0.0})
+
+        assert rate_limit.filter(make_record(level=logging.WARNING)) is False
+        assert rate_limit.filter(make_record(level=logging.ERROR)) is True
+
+    def test_keys_are_bounded(self, clock, summaries):
+        rate_limit = RateLimitFilter(rate=0, burst=0, max_keys=2, summary_interval=60)
+        for endpoint in ('a', 'b', 'c'):
+            rate_limit.filter(make_record(endpoint=endpoint))
+
+        assert len(rate_limit._buckets) == 2
+        clock[0] += 61
+        rate_limit.filter(make_record(endpoint='b'))
+        assert {record.suppressed_events for record in summaries if record.exception_type == '*'} == {1}
+
+def test_parse_sample_ratios():
+    assert parse_sample_ratios('WARNING=0.1, error=1') == {logging.WARNING: 0.1, logging.ERROR: 1.0}
+    with pytest.raises(ValueError):
+        parse_sample_ratios('LOUD=1')
@@ -1,4 +1,7 @@
 from flask import Flask
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
 import json
 import logging
 import os
@@ -55,6 +58,37 @@ class TestLogging:
         assert parsed["status_code"] == 500
         assert parsed["details"] == {"debug": "info"}
 
+    def test_custom_json_formatter_serializes_typed_values(self):
+        """Verifica que fechas, enums y UUID se serialicen sin recurrir a str()"""
+        class Color(Enum):
+            RED = 'red'
+
+        formatter = CustomJSONFormatter()
+        record = logging.makeLogRecord({'msg': 'typed', 'levelno': logging.INFO, 'levelname': 'INFO'})
+        record.created_at = datetime(2025, 1, 2, 3, 4, 5)
+        record.color = Color.RED
+        record.user_uuid = UUID('12345678-1234-5678-1234-567812345678')
+        record._private = 'hidden'
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["created_at"] == "2025-01-02T03:04:05"
+        assert parsed["color"] == "red"
+        assert parsed["user_uuid"] == "12345678-1234-5678-1234-567812345678"
+        assert "_private" not in parsed
+        assert "lineno" not in parsed
+
+    def test_custom_json_formatter_exception_timestamp(self):
+        """Verifica que el timestamp de la excepción se emita aparte del timestamp del log"""
+        formatter = CustomJSONFormatter()
+        record = logging.makeLogRecord({'msg': 'error', 'levelno': logging.ERROR, 'levelname': 'ERROR'})
+        record.timestamp = '2025-01-02T03:04:05'
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["exception_timestamp"] == '2025-01-02T03:04:05'
+        assert parsed["timestamp"] != '2025-01-02T03:04:05'
+
     def test_setup_logging_creates_log_dir(self, tmp_path):
         """Verifica que setup_logging cree la carpeta de logs y configure correctamente los loggers"""
         # Cambiar el directorio de logs temporalmente
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import column, create_engine, select, table, text, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.config import ReplicaSet, RoutingSession, use_primary, use_replica
+
+def make_engine(path, name):
+    engine = create_engine(f"sqlite:///{path / name}.db", poolclass=QueuePool)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE origin (name VARCHAR(20))"))
+        connection.execute(text("INSERT INTO origin VALUES (:name)"), {'name': name})
+    return engine
+
+origin = table('origin', column('name'))
+
+class FakeDatabase:
+    session = None
+
+class TestReplicaSet:
+    def test_round_robin(self, tmp_path):
+        engines = [make_engine(tmp_path, 'replica1'), make_engine(tmp_path, 'replica2')]
+        replicas = ReplicaSet(engines)
+
+        assert [replicas.choose() for _ in range(3)] == [engines[0], engines[1], engines[0]]
+
+    def test_least_connections(self, tmp_path):
+        engines = [make_engine(tmp_path, 'replica1'), make_engine(tmp_path, 'replica2')]
+        replicas = ReplicaSet(engines, strategy='least_connections')
+        busy = engines[0].connect()
+        try:
+            assert replicas.choose() is engines[1]
+        finally:
+            busy.close()
+
+    def test_from_uris_and_invalid_strategy(self, tmp_path):
+        replicas = ReplicaSet.from_uris(f" sqlite:///{tmp_path / 'a.db'}, ,sqlite:///{tmp_path / 'b.db'}")
+
+        assert len(replicas.engines) == 2
+        assert not ReplicaSet.from_uris('')
+        with pytest.raises(ValueError):
+            ReplicaSet(strategy='random')
+
+
+class TestRoutingSession:
+    @pytest.fixture
+    def database(self, tmp_path):
+        primary = make_engine(tmp_path, 'primary')
+        replica = make_engine(tmp_path, 'replica')
+        Session = sessionmaker(bind=primary, class_=RoutingSession, replicas=ReplicaSet([replica]))
+        database = FakeDatabase()
+        database.session = Session()
+        yield database
+        database.session.close()
+
+    @staticmethod
+    def origin(database):
+        return database.session.execute(select(origin.c.name)).scalar_one()
+
+    def test_reads_go_to_primary_by_default(self, database):
+        assert self.origin(database) == 'primary'
+
+    def test_marked_reads_go_to_replica(self, database):
+        read = use_replica(database)(self.origin)
+
+        assert read(database) == 'replica'
+        assert not database.session.info['read_only']
+
+    def test_read_after_write_stays_on_primary(self, database):
+        read = use_replica(database)(self.origin)
+        database.session.execute(update(origin).values(name='written'))
+
+        assert read(database) == 'written'
+        database.session.close()
+        assert read(database) == 'replica'
+
+    def test_use_primary_pins_the_session(self, database):
+        read = use_replica(database)(self.origin)
+
+        assert use_primary(database)(read)(database) == 'primary'
+
+    def test_create_app_binds_replicas(self, tmp_path):
+        from app import create_app
+        from app.config import TestConfig, db
+
+        class ReplicaConfig(TestConfig):
+            DB_REPLICA_URIS = f"sqlite:///{tmp_path / 'replica.db'}"
+            DB_REPLICA_STRATEGY = 'least_connections'
+
+        app = create_app(ReplicaConfig)
+        replicas = app.extensions['db_replicas']
+
+        assert len(replicas.engines) == 1
+        assert replicas.strategy == 'least_connections'
+        assert db.session().replicas is replicas
+        db.session.remove()
@@ -140,4 +140,39 @@ class TestAddressController:
             AddressController.create_address('email', sample_user.email, address_data)
 
         assert "Unknown error occurred" in str(excinfo.value)
-        assert excinfo.value.details['original_error'] == "Database error"
\ No newline at end of file
+        assert excinfo.value.details['original_error'] == "Database error"
+    def test_get_user_address_user_not_found(self, db_session):
+        """Test: Usuario inexistente devuelve 404 en lugar de fallar"""
+        with pytest.raises(UserNotFoundException) as excinfo:
+            AddressController.get_user_address('username', 'ghost-user')
+
+        assert excinfo.value.status_code == 404
+
+    def test_get_user_address_single_query(self, db_session, sample_user, sample_address):
+        """Test: Usuario y direcciones se obtienen en una sola consulta"""
+        username = sample_user.username
+        with patch('app.controllers.addresses.db.session.execute', wraps=db_session.execute) as mock_execute:
+            result = AddressController.get_user_address('username', username)
+
+        assert mock_execute.call_count == 1
+        assert result['metadata']['length'] == 1
+
+    def test_get_user_with_addresses(self, db_session, sample_user, sample_address):
+        """Test: Datos del usuario junto con sus direcciones"""
+        result = AddressController.get_user_with_addresses('email', sample_user.email)
+
+        assert result['uuid'] == sample_user.uuid
+        assert result['addresses'][0]['street'] == 'Calle Falsa'
+
+    def test_get_user_address_fields_projection(self, db_session, sample_user, sample_address):
+        """Test: Solo las columnas de dirección pedidas"""
+        result = AddressController.get_user_address('email', sample_user.email, ('street', 'city'))
+
+        assert result['addresses'] == [{'street': sample_address.street, 'city': sample_address.city}]
+
+    def test_get_user_with_addresses_fields_projection(self, db_session, sample_user, sample_address):
+        """Test: Proyección de las columnas del usuario con direcciones incluidas"""
+        result = AddressController.get_user_with_addresses('email', sample_user.email, ('uuid',))
+
+        assert set(result) == {'uuid', 'addresses'}
+        assert result['addresses'][0]['street'] == 'Calle Falsa'
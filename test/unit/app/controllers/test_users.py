@@ -1,14 +1,18 @@
 import pytest
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from unittest.mock import patch
+from uuid import uuid4
+from werkzeug.datastructures import ETags
 
 from app.controllers.users import UserController
 from app.exceptions import (
     UserNotFoundException, 
     UserAlreadyExistsException, 
     InvalidUserDataException, 
-    DatabaseException)
-from app.models import User
+    DatabaseException,
+    UserPreconditionFailedException)
+from app.models import db, User, USER_FIELDS
+from app.utils import decode_cursor, user_etag
 
 class TestUserController:
 
@@ -191,6 +195,7 @@ class TestUserController:
 
         assert result["username"] == sample_user.username
         assert ("first_name", "NuevoNombre") in result["fields_updated"]
+        assert result["version"] == 2
         assert updated_user.first_name == "NuevoNombre"
 
     def test_update_sqlalchemy_error(self, db_session, sample_user, monkeypatch):
@@ -223,11 +228,11 @@ class TestUserController:
 
     def test_successful_update(self, db_session, sample_user):
         """Debe actualizar el status correctamente"""
-        new_status = {'status': 'active'}
+        new_status = {'status': 'pending'}
         result = UserController.update_user_status("username", sample_user.username, new_status)
         updated_user = db_session.query(User).filter_by(username=sample_user.username).first()
 
-        assert result is None
+        assert result == {'uuid': updated_user.uuid, 'version': 2}
         assert updated_user.status == new_status['status']
 
     def test_status_sqlalchemy_error(self, db_session, sample_user, monkeypatch):
@@ -238,4 +243,293 @@ class TestUserController:
         monkeypatch.setattr(db_session, "commit", raise_db_error)
         with pytest.raises(DatabaseException) as excinfo:
             UserController.update_user_status("username", sample_user.username, {"status": "deleted"})
-        assert "Simulated DB error" in str(excinfo.value.details['original_error'])
\ No newline at end of file
+        assert "Simulated DB error" in str(excinfo.value.details['original_error'])
+    """
+      ______          __     __          ____                             __
+     /_  __/__  _____/ /_   / /_  __  __/ / /__   _______________  ____ _/ /____
+      / / / _ \/ ___/ __/  / __ \/ / / / / //_/  / ___/ ___/ _ \/ __ `/ __/ _ \\
+     / / /  __(__  ) /_   / /_/ / /_/ / / ,<    / /__/ /  /  __/ /_/ / /_/  __/
+    /_/  \___/____/\__/  /_.___/\__,_/_/_/|_|   \___/_/   \___/\__,_/\__/\___/
+    """
+
+    def test_create_users_bulk_success(self, db_session):
+        """Debe crear todos los usuarios válidos en lotes"""
+        rows = [
+            (0, {'first_name': 'Bulk', 'last_name': 'Alpha', 'email': 'bulk.alpha@example.com'}),
+            (1, {'first_name': 'Bulk', 'last_name': 'Beta', 'email': 'bulk.beta@example.com'}),
+            (2, {'first_name': 'Bulk', 'last_name': 'Gamma', 'email': 'bulk.gamma@example.com'}),
+        ]
+        results = UserController.create_users_bulk(rows, chunk_size=2)
+
+        assert [result['index'] for result in results] == [0, 1, 2]
+        assert all(result['status'] == 'created' for result in results)
+        assert results[0]['user']['username'] == 'bulkalpha'
+        assert tuple(results[0]['user']) == USER_FIELDS
+        assert results[0]['user']['version'] == 1
+        assert db_session.query(User).filter_by(email='bulk.gamma@example.com').first() is not None
+
+    def test_create_users_bulk_conflicts(self, db_session, sample_user):
+        """Debe reportar conflictos con la base de datos y dentro del mismo payload"""
+        rows = [
+            (0, {'first_name': 'Other', 'last_name': 'Person', 'email': sample_user.email}),
+            (1, {'first_name': 'Twin', 'last_name': 'Row', 'email': 'twin.one@example.com'}),
+            (2, {'first_name': 'Twin', 'last_name': 'Row', 'email': 'twin.two@example.com'}),
+            (3, {'first_name': 'Another', 'last_name': 'Row', 'email': 'twin.one@example.com'}),
+        ]
+        results = {result['index']: result for result in UserController.create_users_bulk(rows)}
+
+        assert results[0]['status'] == 'error'
+        assert results[0]['status_code'] == 409
+        assert results[1]['status'] == 'created'
+        assert results[2]['status'] == 'error'
+        assert "username" in results[2]['error']
+        assert results[3]['status'] == 'error'
+        assert "email" in results[3]['error']
+
+    def test_create_users_bulk_database_error(self, db_session):
+        """Debe marcar como error las filas del lote que falla"""
+        rows = [(0, {'first_name': 'Broken', 'last_name': 'Chunk', 'email': 'broken.chunk@example.com'})]
+        with patch('app.controllers.users.db.session.commit') as mock_commit:
+            mock_commit.side_effect = SQLAlchemyError("Simulated bulk error")
+            results = UserController.create_users_bulk(rows)
+
+        assert results[0]['status'] == 'error'
+        assert results[0]['status_code'] == 500
+
+    """
+      ______          __     ___      __                                 
+     /_  __/__  _____/ /_   / (_)____/ /_   __  __________  __________
+      / / / _ \/ ___/ __/  / / / ___/ __/  / / / / ___/ _ \/ ___/ ___/
+     / / /  __(__  ) /_   / / (__  ) /_   / /_/ (__  )  __/ /  (__  ) 
+    /_/  \___/____/\__/  /_/_/____/\__/   \__,_/____/\___/_/  /____/  
+    """
+
+    def test_list_users_keyset_pages(self, db_session):
+        """Debe recorrer todas las páginas sin repetir ni saltar usuarios"""
+        for index in range(5):
+            db_session.add(User(
+                uuid=f'00000000-0000-0000-0000-00000000000{index}',
+                first_name='Page',
+                last_name=f'Keyset{4 - index}',
+                username=f'pagekeyset{index}',
+                email=f'page.keyset{index}@example.com',
+                status='suspended'
+            ))
+        db_session.commit()
+
+        seen = []
+        after = None
+        while True:
+            page = UserController.list_users(order_by='last_name', limit=2, after=after, statuses=['suspended'])
+            seen.extend(user['last_name'] for user in page['data'])
+            if not page['metadata']['next_cursor']:
+                break
+            after = decode_cursor(page['metadata']['next_cursor'], 'last_name')
+
+        assert seen == [f'Keyset{index}' for index in range(5)]
+
+    def test_list_users_status_filter(self, db_session, sample_user):
+        """Debe filtrar por status"""
+        page = UserController.list_users(statuses=['deleted'], limit=100)
+        assert all(user['status'] == 'deleted' for user in page['data'])
+        assert sample_user.uuid not in [user['uuid'] for user in page['data']]
+
+    def test_get_user_uses_cache_and_update_invalidates(self, db_session, sample_user, monkeypatch):
+        """Debe servir get_user desde caché e invalidar la entrada al actualizar"""
+        from app.cache import MemoryCacheBackend, user_cache
+        monkeypatch.setattr(user_cache, 'backend', MemoryCacheBackend())
+
+        UserController.get_user('username', sample_user.username)
+        with patch('app.controllers.users.db.session.execute') as mock_execute:
+            cached = UserController.get_user('email', sample_user.email)
+            mock_execute.assert_not_called()
+        assert cached['uuid'] == sample_user.uuid
+
+        UserController.update_user('username', sample_user.username, {'first_name': 'Cached'})
+        assert user_cache.get('email', sample_user.email) is None
+        assert UserController.get_user('email', sample_user.email)['first_name'] == 'Cached'
+
+    def test_replica_reads_are_not_cached(self, db_session, sample_user, monkeypatch):
+        """No debe guardar en caché usuarios leídos de una réplica (pueden estar desfasados)"""
+        from app.cache import MemoryCacheBackend, user_cache
+        monkeypatch.setattr(user_cache, 'backend', MemoryCacheBackend())
+        monkeypatch.setitem(db.session.info, 'replica', db.session.get_bind())
+
+        assert UserController.get_user('username', sample_user.username)['uuid'] == sample_user.uuid
+        UserController.lookup_users([sample_user.username], [sample_user.email])
+
+        assert user_cache.get('username', sample_user.username) is None
+        assert user_cache.get('email', sample_user.email) is None
+
+    def test_get_user_identity_filter_short_circuits(self, db_session, sample_user, monkeypatch):
+        """Debe devolver 404 sin consultar la base de datos si el filtro descarta la identidad"""
+        from app.cache import UserIdentityFilter
+        identity_filter = UserIdentityFilter()
+        identity_filter.rebuild(capacity=1000, error_rate=0.001)
+        monkeypatch.setattr('app.controllers.users.user_identity_filter', identity_filter)
+
+        with patch('app.controllers.users.db.session.execute') as mock_execute:
+            with pytest.raises(UserNotFoundException):
+                UserController.get_user('username', 'missing-identity')
+            mock_execute.assert_not_called()
+
+        UserController.create_user({'first_name': 'Bloom', 'last_name': 'Added', 'email': 'bloom.added@example.com'})
+        assert UserController.get_user('username', 'bloomadded')['email'] == 'bloom.added@example.com'
+
+    def test_get_user_fields_projection(self, db_session, sample_user):
+        """Debe devolver solo las columnas pedidas"""
+        result = UserController.get_user('email', sample_user.email, ('uuid', 'status'))
+
+        assert result == {'uuid': sample_user.uuid, 'status': sample_user.status}
+
+    def test_get_user_fields_projection_not_found(self, db_session):
+        """Debe lanzar 404 también con proyección"""
+        with pytest.raises(UserNotFoundException):
+            UserController.get_user('username', 'missing-projection', ('uuid',))
+
+    def test_get_user_fields_from_cache(self, db_session, sample_user, monkeypatch):
+        """Debe proyectar la entrada de caché sin consultar la base de datos"""
+        from app.cache import MemoryCacheBackend, user_cache
+        monkeypatch.setattr(user_cache, 'backend', MemoryCacheBackend())
+        UserController.get_user('username', sample_user.username)
+
+        with patch('app.controllers.users.db.session.execute') as mock_execute:
+            result = UserController.get_user('username', sample_user.username, ('status',))
+            mock_execute.assert_not_called()
+        assert result == {'status': sample_user.status}
+
+    def test_lookup_users_found_and_missing(self, db_session, sample_user):
+        """Debe separar las claves encontradas de las inexistentes"""
+        result = UserController.lookup_users(
+            [sample_user.username, 'ghost.user'],
+            [sample_user.email, 'ghost@example.com']
+        )
+
+        assert result['metadata'] == {'requested': 4, 'found': 2, 'missing': 2}
+        assert result['found']['usernames'][sample_user.username]['uuid'] == sample_user.uuid
+        assert result['found']['emails'][sample_user.email]['uuid'] == sample_user.uuid
+        assert result['missing'] == {'usernames': ['ghost.user'], 'emails': ['ghost@example.com']}
+
+    def test_lookup_users_chunks_queries(self, db_session, sample_user):
+        """Debe lanzar una consulta por lote"""
+        username, uuid = sample_user.username, sample_user.uuid
+        with patch('app.controllers.users.db.session.execute', wraps=db_session.execute) as mock_execute:
+            result = UserController.lookup_users(['a.user', 'b.user', username], [], chunk_size=2, fields=('uuid',))
+
+        assert mock_execute.call_count == 2
+        assert result['found']['usernames'] == {username: {'uuid': uuid}}
+
+    def _create_users(self, db_session, count, domain, status='active'):
+        users = []
+        for _ in range(count):
+            unique_id = str(uuid4())
+            users.append(User(
+                uuid=unique_id,
+                first_name='Bulk',
+                last_name='User',
+                username=f'bulk{unique_id[:8]}',
+                email=f'bulk{unique_id[:8]}@{domain}',
+                status=status
+            ))
+        db_session.add_all(users)
+        db_session.commit()
+        return [(user.uuid, user.username) for user in users]
+
+    def test_update_users_status_bulk_by_identifiers(self, db_session, sample_user):
+        """Debe contar inexistentes y sin cambios y actualizar el resto por lotes"""
+        domain = f'{uuid4().hex[:8]}.example.com'
+        created = self._create_users(db_session, 3, domain)
+        created += self._create_users(db_session, 1, domain, status='suspended')
+        uuids = [uuid for uuid, _ in created] + ['missing-uuid']
+
+        report = UserController.update_users_status_bulk('suspended', {'uuid': uuids}, chunk_size=2)
+
+        assert report == {
+            'status': 'suspended', 'dry_run': False, 'matched': 3, 'unchanged': 1,
+            'not_found': 1, 'affected': 3, 'chunks': 2
+        }
+        statuses = db_session.execute(db.select(User.status).where(User.uuid.in_(uuids))).scalars().all()
+        assert set(statuses) == {'suspended'}
+
+    def test_update_users_status_bulk_dry_run(self, db_session, sample_user):
+        """En dry_run no debe modificar ninguna fila"""
+        username = sample_user.username
+        report = UserController.update_users_status_bulk('deleted', {'username': [username]}, dry_run=True)
+
+        assert report['matched'] == 1
+        assert report['affected'] == 0
+        db_session.expire_all()
+        assert db_session.execute(db.select(User.status).where(User.username == username)).scalar_one() == 'active'
+
+    def test_update_users_status_bulk_by_filter(self, db_session):
+        """Debe recorrer por uuid las filas del filtro y actualizarlas"""
+        domain = f'{uuid4().hex[:8]}.example.com'
+        self._create_users(db_session, 5, domain, status='pending')
+        self._create_users(db_session, 2, domain, status='suspended')
+        filters = {'statuses': ['pending'], 'email_domain': domain}
+
+        dry_run = UserController.update_users_status_bulk('active', filters=filters, dry_run=True)
+        report = UserController.update_users_status_bulk('active', filters=filters, chunk_size=2)
+
+        assert dry_run['matched'] == 5
+        assert report['matched'] == report['affected'] == 5
+        assert report['chunks'] == 3
+        assert UserController.update_users_status_bulk('active', filters=filters, dry_run=True)['matched'] == 0
+
+    def test_update_users_status_bulk_invalidates_cache(self, db_session, sample_user, monkeypatch):
+        """Debe invalidar la entrada de caché de cada usuario actualizado"""
+        from app.cache import MemoryCacheBackend, user_cache
+        monkeypatch.setattr(user_cache, 'backend', MemoryCacheBackend())
+        username = sample_user.username
+        UserController.get_user('username', username)
+
+        UserController.update_users_status_bulk('suspended', {'username': [username]})
+
+        assert UserController.get_user('username', username)['status'] == 'suspended'
+
+    def test_update_users_status_bulk_database_error(self, db_session):
+        with patch('app.controllers.users.db.session.execute') as mock_execute:
+            mock_execute.side_effect = SQLAlchemyError("Database error")
+            with pytest.raises(DatabaseException):
+                UserController.update_users_status_bulk('active', {'uuid': ['some-uuid']})
+
+    def test_update_user_if_match(self, db_session, sample_user):
+        """Debe aceptar el ETag vigente y rechazar con 412 uno obsoleto"""
+        username, uuid = sample_user.username, sample_user.uuid
+        current = ETags([user_etag(uuid, 1)])
+
+        result = UserController.update_user("username", username, {"first_name": "Primero"}, current)
+        with pytest.raises(UserPreconditionFailedException) as excinfo:
+            UserController.update_user("username", username, {"first_name": "Segundo"}, current)
+
+        assert result["version"] == 2
+        assert excinfo.value.status_code == 412
+        assert excinfo.value.details["current_version"] == 2
+        assert UserController.update_user_status("username", username, {"status": "pending"}, ETags(star_tag=True))["version"] == 3
+
+    def test_update_user_single_statement(self, db_session, sample_user):
+        """Debe resolver la actualización con un único UPDATE ... RETURNING"""
+        username = sample_user.username
+        with patch('app.controllers.users.db.session.execute', wraps=db_session.execute) as mock_execute:
+            result = UserController.update_user("username", username, {"first_name": "Directo", "phone": None})
+
+        assert mock_execute.call_count == 1
+        assert result["fields_updated"] == [("first_name", "Directo")]
+        assert result["version"] == 2
+
+    def test_update_user_without_returning(self, db_session, sample_user, monkeypatch):
+        """Sin RETURNING debe releer la fila actualizada"""
+        username, uuid = sample_user.username, sample_user.uuid
+        monkeypatch.setattr(db_session.get_bind().dialect, 'update_returning', False)
+
+        result = UserController.update_user("username", username, {"last_name": "Releido"})
+        status = UserController.update_user_status("username", username, {"status": "suspended"})
+
+        assert result["uuid"] == uuid and result["version"] == 2
+        assert status == {"uuid": uuid, "version": 3}
+
+    def test_update_user_status_unchanged_is_not_written(self, db_session, sample_user):
+        """Un status igual al actual no debe incrementar la versión"""
+        result = UserController.update_user_status("username", sample_user.username, {"status": "active"})
+
+        assert result["version"] == 1
@@ -1,4 +1,6 @@
 import pytest
+from app.decorators import parse_fields
+from app.exceptions import InvalidParameterValueException
 
 class TestQueryParams:
 
@@ -16,4 +18,26 @@ class TestQueryParams:
 
     def test_invalid_query_param(self, client):
         response = client.get("/api/test-user-query/?invalid=test")
-        assert response.status_code == 400
\ No newline at end of file
+        assert response.status_code == 400
+    def test_optional_query_param_is_not_counted(self, client):
+        response = client.get("/api/users/?email=missing@example.com&include=unknown")
+        assert response.status_code == 400
+        assert "include" in response.json["error"]
+
+    def test_invalid_fields_param(self, client):
+        response = client.get("/api/users/?email=test@example.com&fields=uuid,password")
+        assert response.status_code == 400
+        assert "fields" in response.json["error"]
+
+
+class TestParseFields:
+    def test_parse_fields(self):
+        assert parse_fields(" uuid, status,uuid ", ('uuid', 'status')) == ('uuid', 'status')
+
+    def test_parse_fields_not_requested(self):
+        assert parse_fields(None, ('uuid',)) is None
+
+    @pytest.mark.parametrize("value", ["", ",", "uuid,secret"])
+    def test_parse_fields_invalid(self, value):
+        with pytest.raises(InvalidParameterValueException):
+            parse_fields(value, ('uuid', 'status'))
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 class TestValideteBody:
     def test_valid_body(self, client):
         """Test para crear un usuario con un body válido"""
@@ -47,4 +49,100 @@ class TestValideteBody:
         assert response.status_code == 400
         assert data["error"] == "Request data validation failed"
         assert isinstance(data["validation_errors"], list)
-        assert any("email" in err["field"] for err in data["validation_errors"])
\ No newline at end of file
+        assert any("email" in err["field"] for err in data["validation_errors"])
+    def test_malformed_json_body(self, client):
+        """Test para un body con content-type JSON pero mal formado"""
+        response = client.post('/api/users/', data='{"first_name": ', content_type='application/json')
+        data = response.get_json()
+
+        assert response.status_code == 400
+        assert data["error"] == "Invalid JSON format"
+
+    def test_body_not_an_object(self, client):
+        """Test para un body JSON válido que no es un objeto"""
+        response = client.post('/api/users/', json=["not", "an", "object"])
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Request data validation failed"
+
+    def test_body_too_large(self, client):
+        """Test para un body que supera MAX_JSON_BODY_BYTES"""
+        client.application.config['MAX_JSON_BODY_BYTES'] = 16
+        try:
+            response = client.post('/api/users/', json={"first_name": "x" * 100})
+        finally:
+            client.application.config.pop('MAX_JSON_BODY_BYTES')
+
+        assert response.status_code == 413
+        assert response.get_json()["status_code"] == 413
+
+
+class TestValidateBulkBody:
+    def test_body_not_an_array(self, client):
+        """Test para un body masivo que no es un array"""
+        response = client.post('/api/users/bulk', json={"first_name": "Ana"})
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Bulk request body must be a non-empty JSON array"
+
+    def test_malformed_array(self, client):
+        """Test para un array masivo mal formado"""
+        response = client.post('/api/users/bulk', data='[{"first_name": "Ana"} {"x": 1}]', content_type='application/json')
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Invalid JSON format"
+
+    def test_missing_body(self, client):
+        """Test para una petición masiva sin body"""
+        response = client.post('/api/users/bulk', data='', content_type='application/json')
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Missing JSON body"
+
+    def test_item_limit_stops_reading(self, client):
+        """Test para un array con más elementos que BULK_MAX_ITEMS"""
+        client.application.config['BULK_MAX_ITEMS'] = 2
+        try:
+            response = client.post('/api/users/bulk', json=[{}, {}, {}, {}])
+        finally:
+            client.application.config.pop('BULK_MAX_ITEMS')
+
+        assert response.status_code == 413
+        assert response.get_json()["status_code"] == 413
+
+    def test_body_too_large(self, client):
+        """Test para un body masivo que supera MAX_BULK_BODY_BYTES"""
+        client.application.config['MAX_BULK_BODY_BYTES'] = 8
+        try:
+            response = client.post('/api/users/bulk', json=[{"first_name": "Ana"}])
+        finally:
+            client.application.config.pop('MAX_BULK_BODY_BYTES')
+
+        assert response.status_code == 413
+
+    def test_item_too_large(self, client):
+        """Test para un elemento mayor que MAX_JSON_BODY_BYTES"""
+        client.application.config['MAX_JSON_BODY_BYTES'] = 64
+        try:
+            response = client.post('/api/users/bulk', json=[{"first_name": "A" * 100}])
+        finally:
+            client.application.config.pop('MAX_JSON_BODY_BYTES')
+
+        assert response.status_code == 413
+        assert response.get_json()["error"] == "Bulk request item too large: more than 64 bytes"
+
+    def test_rows_are_validated_in_batches(self, client):
+        """Test que los índices de las filas rechazadas se mantienen al validar por lotes"""
+        rows = [{"first_name": "Ana", "last_name": "Lote", "email": f"lote{i}@example.com"} for i in range(5)]
+        rows[3]["email"] = "not-an-email"
+        client.application.config['BULK_INSERT_CHUNK_SIZE'] = 2
+        try:
+            with patch('app.routes.api.users.UserController.create_users_bulk') as mock_bulk:
+                mock_bulk.side_effect = lambda rows, chunk_size: [{'index': index, 'status': 'created'} for index, _ in rows]
+                response = client.post('/api/users/bulk', json=rows)
+        finally:
+            client.application.config.pop('BULK_INSERT_CHUNK_SIZE')
+
+        assert [index for index, _ in mock_bulk.call_args.args[0]] == [0, 1, 2, 4]
+        assert response.status_code == 207
+        assert response.get_json()["results"][3]["status"] == "error"
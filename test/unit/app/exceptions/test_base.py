@@ -48,4 +48,17 @@ class TestExceptionBase:
         assert log_context["status_code"] == 422
         assert log_context["details"] == {"reason": "invalid format"}
         assert log_context["user_id"] == "abc123"
-        assert log_context["ip_address"] == "127.0.0.1"
\ No newline at end of file
+        assert log_context["ip_address"] == "127.0.0.1"
+
+    def test_log_error_drops_reserved_record_attributes(self, caplog):
+        logger = logging.getLogger('test.base_exception')
+        exception = BaseAppException("Log this")
+
+        # `exc_info` o `message` en `extra` harían fallar a logging.makeRecord
+        with caplog.at_level(logging.ERROR, logger='test.base_exception'):
+            exception.log_error(logger, {"exc_info": "x", "message": "y", "request_method": "GET"})
+
+        record = caplog.records[-1]
+        assert record.request_method == "GET"
+        assert record.exc_info is None
+        assert record.message == "Application Error: Log this"
@@ -5,7 +5,11 @@ from app.exceptions import (
     MissingJSONBodyException,
     InvalidJSONFormatException,
     InvalidNullValueExeption,
-    SchemaValidationException
+    SchemaValidationException,
+    InvalidBulkBodyException,
+    BulkLimitExceededException,
+    BulkItemTooLargeException,
+    ImportLineTooLargeException
 )
 
 
@@ -66,4 +70,28 @@ class TestUserExceptions:
         validation_dict = exc.to_dict()
         assert len(validation_dict["validation_errors"]) == 2
         assert validation_dict["validation_errors"][0]["field"] == "email"
-        mock_get_message.assert_called_once_with('SCHEMA_VALIDATION_ERROR')
\ No newline at end of file
+        mock_get_message.assert_called_once_with('SCHEMA_VALIDATION_ERROR')
+
+    def test_bulk_limit_exceeded_exception(self, mock_get_message):
+        exc = BulkLimitExceededException(20, 10)
+        assert exc.status_code == 413
+        assert exc.details == {"received_items": 20, "max_items": 10}
+        mock_get_message.assert_called_once_with('BULK_LIMIT_EXCEEDED', count=20, limit=10)
+
+    def test_bulk_item_too_large_exception(self, mock_get_message):
+        exc = BulkItemTooLargeException(1024)
+        assert exc.status_code == 413
+        assert exc.details == {"max_item_bytes": 1024}
+        mock_get_message.assert_called_once_with('BULK_ITEM_TOO_LARGE', limit=1024)
+
+    def test_import_line_too_large_exception(self, mock_get_message):
+        exc = ImportLineTooLargeException(1024)
+        assert exc.status_code == 413
+        assert exc.details == {"max_line_bytes": 1024}
+        mock_get_message.assert_called_once_with('IMPORT_LINE_TOO_LARGE', limit=1024)
+
+    def test_invalid_bulk_body_exception(self, mock_get_message):
+        exc = InvalidBulkBodyException()
+        assert exc.status_code == 400
+        assert exc.log_level == logging.WARNING
+        mock_get_message.assert_called_once_with('BULK_BODY_NOT_A_LIST')
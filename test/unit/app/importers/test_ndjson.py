@@ -0,0 +1,101 @@
+import io
+import json
+
+from app.importers import NDJSONImporter, iter_ndjson_lines
+from app.models import User, Address
+
+def _ndjson(*records) -> bytes:
+    return b''.join(
+        (record if isinstance(record, bytes) else json.dumps(record).encode()) + b'\n'
+        for record in records
+    )
+
+class TestNDJSONImporter:
+
+    def test_iter_ndjson_lines_offsets(self):
+        """Devuelve los offsets de inicio y fin de cada línea no vacía"""
+        stream = io.BytesIO(b'{"a": 1}\n\n{"b": 2}\n')
+        lines = list(iter_ndjson_lines(stream))
+
+        assert [(start, end) for start, end, _ in lines] == [(0, 9), (10, 19)]
+
+    def test_iter_ndjson_lines_resume_from_offset(self):
+        """Reanuda desde un offset aunque el stream no admita seek"""
+        class NonSeekable(io.BytesIO):
+            def seekable(self):
+                return False
+
+        lines = list(iter_ndjson_lines(NonSeekable(b'{"a": 1}\n{"b": 2}\n'), offset=9))
+        assert [line for _, _, line in lines] == [b'{"b": 2}\n']
+
+    def test_iter_ndjson_lines_skips_long_lines(self):
+        """Descarta las líneas de más de max_line_bytes sin perder los offsets"""
+        stream = io.BytesIO(b'{"a": 1}\n' + b'x' * 50 + b'\n{"b": 2}\n')
+        lines = list(iter_ndjson_lines(stream, max_line_bytes=16))
+
+        assert lines == [(0, 9, b'{"a": 1}\n'), (9, 60, None), (60, 69, b'{"b": 2}\n')]
+
+    def test_run_imports_users_and_addresses(self, db_session):
+        """Importa usuarios con sus direcciones en lotes"""
+        payload = _ndjson(
+            {'first_name': 'Stream', 'last_name': 'One', 'email': 'stream.one@example.com',
+             'addresses': [{'street': 'Calle Uno', 'number': 1, 'country': 'Spain'}]},
+            {'first_name': 'Stream', 'last_name': 'Two', 'email': 'stream.two@example.com'},
+            {'first_name': 'Stream', 'last_name': 'Three', 'email': 'stream.three@example.com'},
+        )
+        checkpoints = []
+        importer = NDJSONImporter(batch_size=2, on_checkpoint=lambda progress: checkpoints.append(progress.offset))
+        progress = importer.run(io.BytesIO(payload))
+
+        assert progress.users_created == 3
+        assert progress.addresses_created == 1
+        assert progress.failed == 0
+        assert progress.batches == 2
+        assert checkpoints[-1] == len(payload)
+        user = db_session.query(User).filter_by(email='stream.one@example.com').first()
+        assert db_session.query(Address).filter_by(user_uuid=user.uuid).count() == 1
+
+    def test_run_reports_invalid_lines(self, db_session):
+        """Registra las líneas inválidas sin detener la importación"""
+        payload = _ndjson(
+            b'{not json',
+            {'first_name': 'Bad', 'last_name': 'Email', 'email': 'not-an-email'},
+            {'first_name': 'Good', 'last_name': 'Line', 'email': 'good.line@example.com'},
+        )
+        progress = NDJSONImporter(batch_size=10).run(io.BytesIO(payload))
+        result = progress.to_dict()
+
+        assert progress.users_created == 1
+        assert progress.failed == 2
+        assert result['errors'][0]['offset'] == 0
+        assert result['errors'][0]['error'] == "Invalid JSON format"
+        assert result['errors'][1]['error'] == "Request data validation failed"
+        assert result['checkpoint'] == {'offset': len(payload)}
+
+    def test_run_reports_invalid_addresses(self, db_session):
+        """Un campo `addresses` que no es una lista se registra como error de la línea"""
+        payload = _ndjson(
+            {'first_name': 'Bad', 'last_name': 'Addresses', 'email': 'bad.addresses@example.com', 'addresses': 5},
+            {'first_name': 'Bad', 'last_name': 'Item', 'email': 'bad.item@example.com', 'addresses': [5]},
+        )
+        progress = NDJSONImporter(batch_size=10).run(io.BytesIO(payload))
+        result = progress.to_dict()
+
+        assert progress.users_created == 0
+        assert progress.failed == 2
+        assert result['errors'][0]['validation_errors'][0]['field'] == 'addresses'
+        assert result['errors'][1]['error'] == "Request data validation failed"
+
+    def test_run_reports_long_lines(self, db_session):
+        """Una línea mayor que max_line_bytes se registra como error y la importación continúa"""
+        payload = b'{"first_name": "' + b'x' * 200 + b'"}\n' + _ndjson(
+            {'first_name': 'Short', 'last_name': 'Line', 'email': 'short.line@example.com'}
+        )
+        progress = NDJSONImporter(batch_size=10, max_line_bytes=128).run(io.BytesIO(payload))
+        result = progress.to_dict()
+
+        assert progress.users_created == 1
+        assert progress.failed == 1
+        assert result['errors'][0]['offset'] == 0
+        assert result['errors'][0]['status_code'] == 413
+        assert result['checkpoint'] == {'offset': len(payload)}
@@ -0,0 +1,169 @@
+import json
+import os
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.config import ReplicaSet, TimedQueuePool
+
+from app.exceptions import UserNotFoundException
+from app.handlers import setup_error_handlers
+from app.instrumentation import MetricsRegistry, listen_pool_events, metrics_registry, setup_metrics
+
+DEAD_PID = 2 ** 22 + 1
+
+class TestMetricsRegistry:
+    def test_render_counters_and_histograms(self):
+        registry = MetricsRegistry()
+        registry.describe('requests_total', 'counter', 'Requests.')
+        registry.inc('requests_total', {'endpoint': 'users'})
+        registry.inc('requests_total', {'endpoint': 'users'})
+        registry.observe('latency_seconds', 0.02, {'endpoint': 'users'}, buckets=(0.01, 0.1))
+        registry.observe('latency_seconds', 5, {'endpoint': 'users'}, buckets=(0.01, 0.1))
+
+        output = registry.render()
+
+        assert '# HELP requests_total Requests.' in output
+        assert 'requests_total{endpoint="users"} 2' in output
+        assert 'latency_seconds_bucket{endpoint="users",le="0.01"} 0' in output
+        assert 'latency_seconds_bucket{endpoint="users",le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{endpoint="users",le="+Inf"} 2' in output
+        assert 'latency_seconds_count{endpoint="users"} 2' in output
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.inc('errors_total', {'message': 'say "hi"\n'})
+
+        assert 'errors_total{message="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_aggregates_snapshots_from_other_processes(self, tmp_path):
+        registry = MetricsRegistry(directory=str(tmp_path))
+        registry.register_gauges('pool', lambda: [('pool_checked_out', {}, 1)])
+        registry.inc('requests_total', {'endpoint': 'users'}, 3)
+        for pid in (os.getppid(), DEAD_PID):
+            (tmp_path / f"metrics_{pid}.json").write_text(json.dumps({
+                'pid': pid,
+                'counters': [['requests_total', [['endpoint', 'users']], 2]],
+                'histograms': [],
+                'buckets': {},
+                'gauges': [['pool_checked_out', [], 4]]
+            }))
+
+        collected = registry.collect()
+
+        assert collected['counters'][('requests_total', (('endpoint', 'users'),))] == 7
+        # Los gauges de procesos terminados no se suman
+        assert collected['gauges'][('pool_checked_out', ())] == 5
+
+    def test_flush_is_throttled(self, tmp_path):
+        registry = MetricsRegistry(directory=str(tmp_path), flush_interval=60)
+        registry.inc('requests_total')
+        registry.flush()
+        registry.inc('requests_total')
+        registry.flush()
+
+        snapshot = json.loads((tmp_path / f"metrics_{os.getpid()}.json").read_text())
+        assert snapshot['counters'] == [['requests_total', [], 1]]
+
+        registry.flush(force=True)
+        snapshot = json.loads((tmp_path / f"metrics_{os.getpid()}.json").read_text())
+        assert snapshot['counters'] == [['requests_total', [], 2]]
+
+    def test_clear_directory(self, tmp_path):
+        registry = MetricsRegistry(directory=str(tmp_path))
+        registry.flush(force=True)
+        registry.clear_directory()
+
+        assert list(tmp_path.glob('metrics_*.json')) == []
+
+
+class TestSetupMetrics:
+    @pytest.fixture
+    def metrics_app(self):
+        app = Flask(__name__)
+        engine = create_engine('sqlite:///:memory:', poolclass=TimedQueuePool)
+        setup_error_handlers(app)
+        setup_metrics(app, engine=engine)
+
+        @app.route('/query')
+        def query():
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return jsonify({"ok": True})
+
+        @app.route('/missing')
+        def missing():
+            raise UserNotFoundException('username', 'ghost')
+
+        yield app
+        metrics_registry.configure(None)
+
+    def test_requests_are_counted_per_endpoint(self, metrics_app):
+        client = metrics_app.test_client()
+        client.get('/query')
+        client.get('/missing')
+
+        output = metrics_registry.render()
+        assert 'http_requests_total{endpoint="query",method="GET",status="200"}' in output
+        assert 'http_requests_total{endpoint="missing",method="GET",status="404"}' in output
+        assert 'http_request_duration_seconds_count{endpoint="query"}' in output
+        assert 'app_exceptions_total{exception="UserNotFoundException"}' in output
+
+    def test_pool_stats_are_exposed(self, metrics_app):
+        metrics_app.test_client().get('/query')
+
+        output = metrics_registry.render()
+        assert 'db_pool_checked_out{pool="primary"} 0.0' in output
+        assert 'db_pool_wait_seconds_count{pool="primary"}' in output
+
+    def test_pool_wait_survives_dispose(self, metrics_app):
+        engine = create_engine('sqlite:///:memory:', poolclass=TimedQueuePool)
+        listen_pool_events(engine, 'disposed')
+        engine.dispose(close=False)
+
+        def wait_count():
+            histogram = metrics_registry._histograms.get(('db_pool_wait_seconds', (('pool', 'disposed'),)))
+            return histogram['count'] if histogram else 0
+
+        before = wait_count()
+        engine.connect().close()
+
+        assert type(engine.pool) is TimedQueuePool
+        assert wait_count() - before == 1
+
+    def test_pool_events_count_connections_and_overflow(self):
+        engine = create_engine('sqlite:///:memory:', poolclass=QueuePool, pool_size=1, max_overflow=1)
+        listen_pool_events(engine)
+        listen_pool_events(engine)
+
+        def count(name, **labels):
+            return metrics_registry._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+        before = {key: count('db_pool_checkouts_total', pool='primary', overflow=key) for key in ('true', 'false')}
+        connects = count('db_pool_connections_total', pool='primary', event='connect')
+        first, second = engine.connect(), engine.connect()
+        second.close()
+        first.close()
+        engine.dispose()
+
+        assert count('db_pool_connections_total', pool='primary', event='connect') - connects == 2
+        assert count('db_pool_checkouts_total', pool='primary', overflow='false') - before['false'] == 1
+        assert count('db_pool_checkouts_total', pool='primary', overflow='true') - before['true'] == 1
+
+    def test_replica_pools_are_labelled(self):
+        app = Flask(__name__)
+        replica = create_engine('sqlite:///:memory:', poolclass=TimedQueuePool)
+        app.extensions['db_replicas'] = ReplicaSet([replica])
+        try:
+            setup_metrics(app, engine=create_engine('sqlite:///:memory:', poolclass=TimedQueuePool))
+            replica.connect().close()
+
+            output = metrics_registry.render()
+            assert 'db_pool_checked_out{pool="primary"} 0.0' in output
+            assert 'db_pool_size{pool="replica_0"} 5.0' in output
+            assert 'db_pool_checkouts_total{overflow="false",pool="replica_0"}' in output
+            assert 'db_pool_wait_seconds_count{pool="replica_0"} 1' in output
+        finally:
+            metrics_registry.configure(None)
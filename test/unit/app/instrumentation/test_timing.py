@@ -0,0 +1,105 @@
+import logging
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine, text
+
+from app.config import ReplicaSet
+from app.decorators import validate_body
+from app.instrumentation import RequestMetrics, setup_instrumentation
+from app.schemas import UpdateStatusUserSchema
+
+@pytest.fixture
+def instrumented_app():
+    app = Flask(__name__)
+    app.config['REQUEST_INSTRUMENTATION'] = True
+    engine = create_engine('sqlite://')
+    setup_instrumentation(app, engine=engine)
+
+    @app.route('/query')
+    def query():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return jsonify({"ok": True})
+
+    @app.route('/failing-query')
+    def failing_query():
+        with engine.connect() as connection:
+            for _ in range(3):
+                try:
+                    connection.execute(text("SELECT * FROM missing_table"))
+                except Exception:
+                    pass
+            connection.execute(text("SELECT 1"))
+            leftovers = [key for key in connection.info if 'query' in key]
+        return jsonify({"leftovers": leftovers})
+
+    @app.route('/validate', methods=['POST'])
+    @validate_body(UpdateStatusUserSchema)
+    def validate():
+        return jsonify({"ok": True})
+
+    return app
+
+class TestRequestInstrumentation:
+    def test_server_timing_header_counts_statements(self, instrumented_app):
+        response = instrumented_app.test_client().get('/query')
+
+        header = response.headers['Server-Timing']
+        assert 'db;dur=' in header
+        assert 'desc="2 statements"' in header
+        assert 'total;dur=' in header
+
+    def test_failed_statements_leave_no_state_on_connection(self, instrumented_app):
+        response = instrumented_app.test_client().get('/failing-query')
+
+        assert response.json == {"leftovers": []}
+        assert 'desc="1 statements"' in response.headers['Server-Timing']
+
+    def test_validation_time_is_recorded(self, instrumented_app, caplog):
+        with caplog.at_level(logging.INFO, logger='app.requests'):
+            response = instrumented_app.test_client().post('/validate', json={'status': 'active'})
+
+        assert response.status_code == 200
+        record = next(record for record in caplog.records if record.name == 'app.requests')
+        assert record.validation_time_ms > 0
+        assert record.db_statements == 0
+        assert record.status_code == 200
+
+    def test_replica_statements_are_counted(self):
+        app = Flask(__name__)
+        app.config['REQUEST_INSTRUMENTATION'] = True
+        replica = create_engine('sqlite://')
+        app.extensions['db_replicas'] = ReplicaSet([replica])
+        setup_instrumentation(app, engine=create_engine('sqlite://'))
+
+        @app.route('/replica')
+        def replica_query():
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return jsonify({"ok": True})
+
+        response = app.test_client().get('/replica')
+
+        assert 'desc="1 statements"' in response.headers['Server-Timing']
+
+    def test_disabled_by_default(self):
+        app = Flask(__name__)
+        setup_instrumentation(app)
+
+        @app.route('/plain')
+        def plain():
+            return 'ok'
+
+        assert 'Server-Timing' not in app.test_client().get('/plain').headers
+
+    def test_log_fields(self):
+        metrics = RequestMetrics()
+        metrics.db_time = 0.002
+        metrics.db_statements = 3
+        fields = metrics.log_fields()
+
+        assert fields['db_time_ms'] == 2.0
+        assert fields['db_statements'] == 3
+        assert fields['duration_ms'] >= 0
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.types import BINARY, CHAR
+
+from app.migrations.versions import compact_uuid_statements
+from app.migrations import MIGRATIONS, Migration, MigrationError, applied_versions, migrate, pending_migrations
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+class TestMigrations:
+    def test_migrate_creates_tables_and_indexes(self, engine):
+        applied = migrate(engine, MIGRATIONS)
+
+        assert [migration.version for migration in applied] == [1, 2, 4]
+        inspector = inspect(engine)
+        assert {'users', 'addresses'} <= set(inspector.get_table_names())
+        user_indexes = {index['name'] for index in inspector.get_indexes('users')}
+        address_indexes = {index['name'] for index in inspector.get_indexes('addresses')}
+        assert {'ix_users_last_name_uuid', 'ix_users_status_last_name_uuid'} <= user_indexes
+        assert 'ix_addresses_user_uuid' in address_indexes
+        assert 'version' in {column['name'] for column in inspector.get_columns('users')}
+
+    def test_migrate_is_idempotent(self, engine):
+        migrate(engine, MIGRATIONS)
+        assert migrate(engine, MIGRATIONS) == []
+        assert applied_versions(engine) == [1, 2, 4]
+
+    def test_optional_migration_is_skipped_until_requested(self, engine):
+        assert [migration.name for migration in pending_migrations(engine, MIGRATIONS)] == ['base-tables', 'lookup-indexes', 'user-version']
+        pending = pending_migrations(engine, MIGRATIONS, include_optional=['compact-uuid'])
+        assert 'compact-uuid' in [migration.name for migration in pending]
+
+    def test_failed_migration_is_not_recorded(self, engine):
+        def broken(connection):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+        with pytest.raises(MigrationError):
+            migrate(engine, [Migration(1, 'broken', broken)])
+        assert applied_versions(engine) == []
+
+    def test_compact_uuid_requires_mysql(self, engine):
+        migrate(engine, MIGRATIONS)
+        with pytest.raises(MigrationError, match='only supported on MySQL'):
+            migrate(engine, MIGRATIONS, include_optional=['compact-uuid'])
+
+    def test_compact_uuid_resumes_partial_conversion(self):
+        """Solo se generan los pasos que faltan según el tipo actual de las columnas"""
+        fresh = compact_uuid_statements({'uuid': CHAR(36)}, {'uuid': CHAR(36), 'user_uuid': CHAR(36)})
+        assert len(fresh) == 6
+
+        partial = compact_uuid_statements(
+            {'uuid': BINARY(16)},
+            {'uuid': CHAR(36), 'user_uuid': CHAR(36), 'uuid_bin': BINARY(16)}
+        )
+        assert partial[0] == "ALTER TABLE addresses ADD COLUMN user_uuid_bin BINARY(16)"
+        assert all(not statement.startswith(('UPDATE users', 'ALTER TABLE users')) for statement in partial)
+
+        assert compact_uuid_statements({'uuid': BINARY(16)}, {'uuid': BINARY(16), 'user_uuid': BINARY(16)}) == []
+
+    def test_user_version_is_added_to_existing_tables(self, engine):
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE users (uuid CHAR(36) PRIMARY KEY, first_name VARCHAR(30), last_name VARCHAR(30), "
+                "username VARCHAR(30), status VARCHAR(30), email VARCHAR(100))"
+            ))
+            connection.execute(text("INSERT INTO users (uuid, username) VALUES ('u-1', 'ana')"))
+
+        migrate(engine, MIGRATIONS)
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT version FROM users")).scalar_one() == 1
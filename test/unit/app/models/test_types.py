@@ -0,0 +1,38 @@
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, select
+
+from app.models import CompactUUID
+
+class TestCompactUUID:
+    def _roundtrip(self, binary):
+        engine = create_engine("sqlite://")
+        table = Table('items', MetaData(), Column('id', CompactUUID(binary=binary), primary_key=True))
+        table.create(engine)
+        value = str(uuid.uuid4())
+        with engine.begin() as connection:
+            connection.execute(table.insert().values(id=uuid.UUID(value)))
+            stored = connection.exec_driver_sql("SELECT id FROM items").scalar()
+            loaded = connection.execute(select(table.c.id).where(table.c.id == value)).scalar()
+        return value, stored, loaded
+
+    def test_string_storage(self):
+        value, stored, loaded = self._roundtrip(binary=False)
+        assert stored == value
+        assert loaded == value
+
+    def test_binary_storage(self):
+        value, stored, loaded = self._roundtrip(binary=True)
+        assert stored == uuid.UUID(value).bytes
+        assert len(stored) == 16
+        assert loaded == value
+
+    def test_storage_from_app_config(self, app):
+        """Sin `binary` explícito se usa UUID_STORAGE de la app activa"""
+        app.config['UUID_STORAGE'] = 'binary'
+        try:
+            with app.app_context():
+                assert CompactUUID().binary is True
+        finally:
+            app.config.pop('UUID_STORAGE')
+        assert CompactUUID().binary is False
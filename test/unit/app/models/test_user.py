@@ -1,6 +1,6 @@
 import pytest
 from uuid import uuid4
-from app.models import User
+from app.models import User, USER_FIELDS
 
 class TestUserModel:
     def test_user_creation(self, db_session):
@@ -84,8 +84,15 @@ class TestUserModel:
             'username': 'dicttest',
             'status': 'active',
             'email': 'dict@example.com',
-            'phone': '123456789'
+            'phone': '123456789',
+            'version': None
         }
         
         assert result == expected
         assert isinstance(result, dict)
+
+    def test_to_dict_exposes_only_user_fields(self):
+        """Las columnas fuera de USER_FIELDS no aparecen en las respuestas"""
+        result = User(uuid="u-1", username="fields").to_dict()
+
+        assert tuple(result) == USER_FIELDS
@@ -45,7 +45,7 @@ class TestAddresses:
         assert len(data) == 2
         assert data['addresses'][0]['street'] == 'Calle Falsa'
         assert data['metadata']['username'] == sample_user.username
-        mock_controller.assert_called_once_with(param_key, param_value)
+        mock_controller.assert_called_once_with(param_key, param_value, None)
 
 
     """
@@ -1,5 +1,6 @@
 from unittest.mock import patch
-from app.controllers import UserController
+from app.controllers import UserController, AddressController
+from app.utils import encode_cursor
 
 class TestUsers:
 
@@ -33,8 +34,10 @@ class TestUsers:
     mock_user_update_payload = {"middle_name": "Isabela"}
 
     mock_user_updated_data = {
-            "fields_updated": [["middle_name", "Isabela"]],
-            "identifier": {"username": "anatorres"}
+            "username": "anatorres",
+            "uuid": "123e4567-e89b-12d3-a456-426614174000",
+            "version": 2,
+            "fields_updated": [["middle_name", "Isabela"]]
         }
 
     """
@@ -54,7 +57,7 @@ class TestUsers:
 
         assert response.status_code == 200
         assert response.json == self.mock_user_input_all_data
-        mock_get_user.assert_called_once_with('username', self.mock_user_output_all_data['username'])
+        mock_get_user.assert_called_once_with('username', self.mock_user_output_all_data['username'], None)
 
     @patch.object(UserController, 'get_user')
     def test_get_user_by_email(self, mock_get_user, client):
@@ -64,7 +67,89 @@ class TestUsers:
         
         assert response.status_code == 200
         assert response.json == self.mock_user_input_all_data
-        mock_get_user.assert_called_once_with('email', self.mock_user_output_all_data["email"])
+        mock_get_user.assert_called_once_with('email', self.mock_user_output_all_data["email"], None)
+
+    @patch.object(AddressController, 'get_user_with_addresses')
+    def test_get_user_include_addresses(self, mock_get_user_with_addresses, client):
+        """Test búsqueda con direcciones incluidas"""
+        mock_get_user_with_addresses.return_value = {**self.mock_user_output_all_data, 'addresses': []}
+        response = client.get(f"/api/users/?username={self.mock_user_output_all_data['username']}&include=addresses")
+
+        assert response.status_code == 200
+        assert response.json['addresses'] == []
+        mock_get_user_with_addresses.assert_called_once_with('username', self.mock_user_output_all_data['username'], None)
+
+    @patch.object(UserController, 'get_user')
+    def test_get_user_with_fields(self, mock_get_user, client):
+        """Test búsqueda con proyección de columnas"""
+        mock_get_user.return_value = {'uuid': 'abc', 'status': 'active'}
+        response = client.get(f"/api/users/?username={self.mock_user_output_all_data['username']}&fields=uuid,status")
+
+        assert response.status_code == 200
+        assert response.json == {'uuid': 'abc', 'status': 'active'}
+        mock_get_user.assert_called_once_with('username', self.mock_user_output_all_data['username'], ('uuid', 'status'))
+
+    @patch.object(UserController, 'lookup_users')
+    def test_lookup_users(self, mock_lookup, client):
+        """Test búsqueda por lotes de usernames y emails"""
+        mock_lookup.return_value = {'metadata': {'requested': 2, 'found': 0, 'missing': 2}}
+        response = client.post('/api/users/lookup?fields=uuid', json={'usernames': ['Ana', 'ana'], 'emails': ['B@Example.com']})
+
+        assert response.status_code == 200
+        mock_lookup.assert_called_once_with(['ana'], ['b@example.com'], chunk_size=500, fields=('uuid',))
+
+    def test_lookup_users_without_keys(self, client):
+        """Test búsqueda por lotes sin claves"""
+        response = client.post('/api/users/lookup', json={'usernames': []})
+
+        assert response.status_code == 400
+
+    def test_lookup_users_too_many_keys(self, client):
+        """Test búsqueda por lotes que supera USERS_LOOKUP_MAX_KEYS"""
+        client.application.config['USERS_LOOKUP_MAX_KEYS'] = 2
+        try:
+            response = client.post('/api/users/lookup', json={'usernames': ['a', 'b', 'c']})
+        finally:
+            client.application.config.pop('USERS_LOOKUP_MAX_KEYS')
+
+        assert response.status_code == 413
+
+    @patch.object(UserController, 'get_user')
+    def test_get_user_etag_and_if_none_match(self, mock_get_user, client):
+        """Test ETag en la respuesta y 304 cuando If-None-Match coincide"""
+        mock_get_user.return_value = {'uuid': 'u-1', 'username': 'ana', 'version': 4}
+        response = client.get("/api/users/?username=ana")
+        not_modified = client.get("/api/users/?username=ana", headers={'If-None-Match': response.headers['ETag']})
+        modified = client.get("/api/users/?username=ana", headers={'If-None-Match': '"u-1.3"'})
+
+        assert response.headers['ETag'] == '"u-1.4"'
+        assert not_modified.status_code == 304
+        assert not_modified.data == b''
+        assert modified.status_code == 200
+
+    @patch.object(UserController, 'update_user')
+    def test_update_user_passes_if_match(self, mock_update_user, client):
+        """Test que If-Match llega al controlador y que sin cabecera se pasa None"""
+        mock_update_user.return_value = self.mock_user_updated_data
+        client.patch('/api/users/update/?username=anatorres', json=self.mock_user_update_payload, headers={'If-Match': '"u-1.2"'})
+        client.patch('/api/users/update/?username=anatorres', json=self.mock_user_update_payload)
+
+        if_match = mock_update_user.call_args_list[0].args[3]
+        assert if_match.contains('u-1.2') and not if_match.contains('u-1.1')
+        assert mock_update_user.call_args_list[1].args[3] is None
+
+    def test_update_user_stale_if_match(self, client, sample_user):
+        """Test 412 al actualizar con un ETag obsoleto"""
+        response = client.patch(f'/api/users/update/?username={sample_user.username}',
+                                json={'first_name': 'Obsoleto'}, headers={'If-Match': f'"{sample_user.uuid}.0"'})
+
+        assert response.status_code == 412
+        assert "has been modified" in response.json['error']
+
+    def test_get_user_invalid_include(self, client):
+        """Test búsqueda con un include no soportado"""
+        response = client.get("/api/users/?username=someone&include=orders")
+        assert response.status_code == 400
 
     """
        __            __                          __                                   
@@ -118,6 +203,7 @@ class TestUsers:
 
             assert response.status_code == 200
             assert response.json == self.mock_user_updated_data
+            assert response.headers['ETag'] == '"123e4567-e89b-12d3-a456-426614174000.2"'
 
     """
       ______          __                     __      __               __        __                
@@ -132,10 +218,133 @@ class TestUsers:
         """Test update de status por username exitosa"""
         with patch(
             'app.controllers.users.UserController.update_user_status', 
-            return_value=None
+            return_value={'uuid': 'u-1', 'version': 3}
         ):
             response = client.patch(f'/api/users/status/?username={sample_user.username}', 
                                     json={'status': 'pending'}, content_type='application/json')
 
             assert response.status_code == 204
-            assert response.data == b''
\ No newline at end of file
+            assert response.data == b''
+            assert response.headers['ETag'] == '"u-1.3"'
+    def test_create_users_bulk(self, client):
+        """Test creación masiva con filas válidas e inválidas"""
+        controller_results = [{'index': 0, 'status': 'created', 'user': self.mock_user_output_necesary_data}]
+        with patch(
+            'app.controllers.users.UserController.create_users_bulk',
+            return_value=controller_results
+        ) as mock_bulk:
+            response = client.post('/api/users/bulk', json=[
+                self.mock_user_input_necesary_data,
+                {"first_name": "X", "email": "invalid"}
+            ])
+
+            assert response.status_code == 207
+            assert response.json['metadata'] == {'total': 2, 'created': 1, 'failed': 1}
+            assert response.json['results'][1]['index'] == 1
+            assert response.json['results'][1]['status'] == 'error'
+            validated_rows = mock_bulk.call_args.args[0]
+            assert len(validated_rows) == 1
+            assert validated_rows[0][0] == 0
+            assert validated_rows[0][1]['email'] == self.mock_user_input_necesary_data['email']
+
+    def test_create_users_bulk_requires_list(self, client):
+        """Test creación masiva con un body que no es una lista"""
+        response = client.post('/api/users/bulk', json=self.mock_user_input_necesary_data)
+
+        assert response.status_code == 400
+        assert response.json['error'] == "Bulk request body must be a non-empty JSON array"
+
+    def test_import_users_invalid_offset(self, client):
+        """Test importación NDJSON con un offset inválido"""
+        response = client.post('/api/users/import?offset=abc', data=b'')
+
+        assert response.status_code == 400
+        assert "offset" in response.json['error']
+
+    @patch.object(UserController, 'create_users_bulk')
+    def test_import_users_long_line(self, mock_bulk, client):
+        """Test importación NDJSON con una línea mayor que MAX_JSON_BODY_BYTES"""
+        client.application.config['MAX_JSON_BODY_BYTES'] = 64
+        try:
+            response = client.post('/api/users/import', data=b'{"first_name": "' + b'x' * 200 + b'"}\n')
+        finally:
+            client.application.config.pop('MAX_JSON_BODY_BYTES')
+
+        assert response.status_code == 200
+        assert response.json['failed'] == 1
+        assert response.json['errors'][0]['status_code'] == 413
+        mock_bulk.assert_not_called()
+
+    @patch.object(UserController, 'list_users')
+    def test_list_users(self, mock_list_users, client):
+        """Test listado paginado con filtros"""
+        mock_list_users.return_value = {'metadata': {'count': 0, 'next_cursor': None}, 'data': []}
+        response = client.get('/api/users/list?limit=5&order_by=last_name&status=active,pending')
+
+        assert response.status_code == 200
+        mock_list_users.assert_called_once_with(
+            limit=5, order_by='last_name', statuses=['active', 'pending'], after=None
+        )
+
+    def test_list_users_invalid_params(self, client):
+        """Test listado con límite, status y cursor inválidos"""
+        assert client.get('/api/users/list?limit=1000').status_code == 400
+        assert client.get('/api/users/list?status=unknown').status_code == 400
+        assert client.get('/api/users/list?cursor=not-a-cursor').status_code == 400
+        assert client.get('/api/users/list?page=2').status_code == 400
+
+    @patch.object(UserController, 'list_users')
+    def test_list_users_forged_cursor(self, mock_list_users, client):
+        """Test cursores manipulados: valores no textuales responden 400 sin consultar"""
+        for values in ([None], [{"a": 1}]):
+            response = client.get('/api/users/list', query_string={'cursor': encode_cursor('uuid', values)})
+            assert response.status_code == 400
+            assert "parameter 'cursor'" in response.json['error']
+        mock_list_users.assert_not_called()
+
+    @patch.object(UserController, 'update_users_status_bulk')
+    def test_update_users_status_bulk_by_identifiers(self, mock_bulk, client):
+        """Test cambio masivo de status por identificadores"""
+        mock_bulk.return_value = {'status': 'suspended', 'matched': 1, 'affected': 1}
+        response = client.patch('/api/users/status/bulk', json={
+            'status': 'suspended', 'uuids': ['u-1', 'u-1'], 'usernames': ['Ana']
+        })
+
+        assert response.status_code == 200
+        assert response.json == mock_bulk.return_value
+        mock_bulk.assert_called_once_with(
+            'suspended', identifiers={'uuid': ['u-1'], 'username': ['ana']},
+            filters=None, dry_run=False, chunk_size=1000
+        )
+
+    @patch.object(UserController, 'update_users_status_bulk')
+    def test_update_users_status_bulk_by_filter(self, mock_bulk, client):
+        """Test cambio masivo de status por filtro en dry_run"""
+        mock_bulk.return_value = {'status': 'active', 'matched': 3, 'affected': 0}
+        response = client.patch('/api/users/status/bulk', json={
+            'status': 'active', 'filter': {'statuses': ['pending'], 'email_domain': '@Example.com'}, 'dry_run': True
+        })
+
+        assert response.status_code == 200
+        mock_bulk.assert_called_once_with(
+            'active', identifiers=None,
+            filters={'statuses': ['pending'], 'email_domain': 'example.com'}, dry_run=True, chunk_size=1000
+        )
+
+    def test_update_users_status_bulk_invalid_body(self, client):
+        """Test cambio masivo sin selección, con selección doble o con status inválido"""
+        assert client.patch('/api/users/status/bulk', json={'status': 'active'}).status_code == 400
+        assert client.patch('/api/users/status/bulk', json={
+            'status': 'active', 'uuids': ['u-1'], 'filter': {'statuses': ['pending']}
+        }).status_code == 400
+        assert client.patch('/api/users/status/bulk', json={'status': 'archived', 'uuids': ['u-1']}).status_code == 400
+
+    def test_update_users_status_bulk_too_many_identifiers(self, client):
+        """Test cambio masivo que supera BULK_MAX_ITEMS"""
+        client.application.config['BULK_MAX_ITEMS'] = 2
+        try:
+            response = client.patch('/api/users/status/bulk', json={'status': 'active', 'uuids': ['a', 'b', 'c']})
+        finally:
+            client.application.config.pop('BULK_MAX_ITEMS')
+
+        assert response.status_code == 413
@@ -1,4 +1,17 @@
 def test_home_route(client):
     """Test para el endpoint ping"""
     response = client.get('/ping')
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+def test_cache_stats_route(client):
+    """Test para el endpoint de estadísticas de caché"""
+    response = client.get('/cache/stats')
+    assert response.status_code == 200
+    assert 'backend' in response.json['user_cache']
+    assert 'enabled' in response.json['identity_filter']
+
+def test_metrics_route(client):
+    """Test para el endpoint de métricas Prometheus"""
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
@@ -0,0 +1,22 @@
+from app.schemas import CreateUserSchema, validate_rows
+
+def make_row(**overrides):
+    return {"first_name": "ana", "last_name": "silva", "email": "Ana@Example.com", **overrides}
+
+class TestValidateRows:
+    def test_all_rows_valid(self):
+        validated, rejected = validate_rows(CreateUserSchema, [make_row(), make_row(email="luis@example.com")])
+
+        assert rejected == []
+        assert [index for index, _ in validated] == [0, 1]
+        assert validated[0][1]["first_name"] == "Ana"
+        assert validated[0][1]["email"] == "ana@example.com"
+
+    def test_invalid_rows_are_reported_by_index(self):
+        rows = [make_row(), make_row(first_name="J0hn", email="bad"), make_row(email="luis@example.com"), "not an object"]
+
+        validated, rejected = validate_rows(CreateUserSchema, rows)
+
+        assert [index for index, _ in validated] == [0, 2]
+        assert [index for index, _ in rejected] == [1, 3]
+        assert {error["loc"] for error in rejected[0][1]} == {("first_name",), ("email",)}
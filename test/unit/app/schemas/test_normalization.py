@@ -0,0 +1,23 @@
+import pytest
+
+from app.schemas.normalization import normalize_name
+
+class TestNormalizeName:
+    @pytest.mark.parametrize("value,expected", [
+        ("jOhn", "John"),
+        ("  mary   ann ", "Mary Ann"),
+        ("josé  DE la", "Jose De La"),
+        ("Ñandú", "Nandu"),
+        ("O'Neil", "Oneil"),
+        ("a b", "A B"),
+        ("", "")
+    ])
+    def test_normalize_name(self, value, expected):
+        assert normalize_name(value) == expected
+
+    def test_repeated_names_are_memoized(self):
+        normalize_name.cache_clear()
+        normalize_name("garcia")
+        normalize_name("garcia")
+
+        assert normalize_name.cache_info().hits == 1
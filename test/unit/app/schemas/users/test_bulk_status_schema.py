@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from app.exceptions import InvalidNullValueExeption
+from app.models import UserStatus
+from app.schemas import BulkStatusSchema
+
+class TestBulkStatusSchema:
+    def test_identifiers_are_normalized_and_deduplicated(self):
+        bulk = BulkStatusSchema(status="suspended", uuids=[" u-1", "u-1", ""], emails=["Ana@Example.com"])
+
+        assert bulk.status == UserStatus.SUSPENDED
+        assert bulk.uuids == ["u-1"]
+        assert bulk.emails == ["ana@example.com"]
+        assert bulk.dry_run is False
+
+    def test_filter_domain_is_normalized(self):
+        bulk = BulkStatusSchema(status="active", filter={"email_domain": " @Example.COM "})
+
+        assert bulk.filter.email_domain == "example.com"
+
+    def test_identifiers_or_filter_required(self):
+        with pytest.raises(InvalidNullValueExeption):
+            BulkStatusSchema(status="active")
+        with pytest.raises(InvalidNullValueExeption):
+            BulkStatusSchema(status="active", filter={})
+
+    def test_identifiers_and_filter_are_exclusive(self):
+        with pytest.raises(ValidationError):
+            BulkStatusSchema(status="active", uuids=["u-1"], filter={"statuses": ["pending"]})
@@ -0,0 +1,20 @@
+import pytest
+from pydantic import ValidationError
+
+from app.exceptions import InvalidNullValueExeption
+from app.schemas import LookupUsersSchema
+
+class TestLookupUsersSchema:
+    def test_keys_are_normalized_and_deduplicated(self):
+        lookup = LookupUsersSchema(usernames=[" AnaSilva", "anasilva", ""], emails=["Ana@Example.com"])
+
+        assert lookup.usernames == ["anasilva"]
+        assert lookup.emails == ["ana@example.com"]
+
+    def test_at_least_one_key(self):
+        with pytest.raises(InvalidNullValueExeption):
+            LookupUsersSchema(usernames=[], emails=[])
+
+    def test_extra_fields_are_forbidden(self):
+        with pytest.raises(ValidationError):
+            LookupUsersSchema(usernames=["ana"], ids=[1])
@@ -0,0 +1,55 @@
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from flask import Flask, jsonify
+
+from app.models import UserStatus
+from app.serialization import OrjsonJSONProvider, setup_json_provider
+
+pytest.importorskip('orjson')
+
+@pytest.fixture
+def json_app():
+    app = Flask(__name__)
+    app.config['JSON_PROVIDER'] = 'orjson'
+    setup_json_provider(app)
+
+    @app.route('/payload')
+    def payload():
+        return jsonify({
+            'b': UserStatus.ACTIVE,
+            'a': UUID('12345678-1234-5678-1234-567812345678'),
+            'when': datetime(2025, 1, 2, 3, 4, 5),
+            'name': 'Añá'
+        })
+
+    return app
+
+class TestOrjsonJSONProvider:
+    def test_provider_is_installed(self, json_app):
+        assert isinstance(json_app.json, OrjsonJSONProvider)
+
+    def test_response_matches_default_provider(self, json_app):
+        default_app = Flask(__name__)
+        default_app.config['JSON_PROVIDER'] = 'default'
+        setup_json_provider(default_app)
+        default_app.view_functions['payload'] = json_app.view_functions['payload']
+        default_app.add_url_rule('/payload', 'payload')
+
+        fast = json_app.test_client().get('/payload')
+        default = default_app.test_client().get('/payload')
+
+        assert fast.mimetype == 'application/json'
+        assert fast.get_json() == default.get_json()
+        assert fast.get_json()['when'] == 'Thu, 02 Jan 2025 03:04:05 GMT'
+        assert fast.data.index(b'"a"') < fast.data.index(b'"b"')
+
+    def test_loads(self, json_app):
+        assert json_app.json.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+
+    def test_invalid_provider(self):
+        app = Flask(__name__)
+        app.config['JSON_PROVIDER'] = 'ujson'
+        with pytest.raises(ValueError):
+            setup_json_provider(app)
@@ -0,0 +1,34 @@
+from app.models import Address, User
+from app.serialization import column_keys, rows_to_dicts, serializer_for
+
+class TestSerializers:
+    def test_column_keys_follow_declaration_order(self):
+        assert column_keys(User)[:3] == ('uuid', 'first_name', 'middle_name')
+        assert 'addresses' not in column_keys(User)
+
+    def test_serializer_is_generated_once(self):
+        assert serializer_for(User) is serializer_for(User)
+
+    def test_serializer_with_fields(self):
+        address = Address(street='Main', number=1, city='Madrid', state=None, country='Spain', instructions=None)
+
+        assert serializer_for(Address, ('street', 'country'))(address) == {'street': 'Main', 'country': 'Spain'}
+        assert serializer_for(Address, ('city',))(address) == {'city': 'Madrid'}
+
+    def test_to_dict_uses_all_columns(self):
+        user = User(uuid='u-1', first_name='Ana', last_name='Silva', username='anasilva', status='active', email='a@b.c')
+
+        assert user.to_dict() == {
+            'uuid': 'u-1',
+            'first_name': 'Ana',
+            'middle_name': None,
+            'last_name': 'Silva',
+            'username': 'anasilva',
+            'status': 'active',
+            'email': 'a@b.c',
+            'phone': None,
+            'version': None
+        }
+
+    def test_rows_to_dicts(self):
+        assert rows_to_dicts(('a', 'b'), [(1, 2), (3, 4)]) == [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
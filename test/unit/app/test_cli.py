@@ -0,0 +1,57 @@
+import json
+import sys
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.cli import main
+
+class TestCli:
+    @patch('app.cli.create_app')
+    def test_import_ndjson_resumes_from_checkpoint(self, mock_create_app, tmp_path):
+        """Test que import-ndjson reanuda desde el checkpoint y lo actualiza"""
+        data_file = tmp_path / 'users.ndjson'
+        data_file.write_bytes(b'{}\n')
+        checkpoint = tmp_path / 'users.checkpoint'
+        checkpoint.write_text(json.dumps({'offset': 3}))
+
+        progress = MagicMock(offset=3, users_created=0, failed=0, lines_read=0)
+        progress.to_dict.return_value = {'checkpoint': {'offset': 3}}
+        with patch('app.importers.NDJSONImporter') as mock_importer:
+            def run(stream, offset):
+                mock_importer.call_args.kwargs['on_checkpoint'](progress)
+                return progress
+            mock_importer.return_value.run.side_effect = run
+
+            exit_code = main(['import-ndjson', str(data_file), '--checkpoint', str(checkpoint)])
+
+        assert exit_code == 0
+        assert mock_importer.return_value.run.call_args.kwargs['offset'] == 3
+        assert json.loads(checkpoint.read_text())['offset'] == 3
+
+    @patch('app.cli.create_app')
+    def test_bulk_status_from_ids_file(self, mock_create_app, tmp_path, capsys):
+        """Test que bulk-status lee los identificadores del fichero y muestra el informe"""
+        ids_file = tmp_path / 'ids.txt'
+        ids_file.write_text('ana\n\nana\nluis\n')
+
+        with patch('app.controllers.UserController.update_users_status_bulk') as mock_bulk:
+            mock_bulk.return_value = {'matched': 2, 'affected': 2}
+            exit_code = main(['bulk-status', '--status', 'suspended', '--key', 'username', '--ids-file', str(ids_file), '--chunk-size', '10'])
+
+        assert exit_code == 0
+        mock_bulk.assert_called_once_with(
+            'suspended', identifiers={'username': ['ana', 'luis']}, filters=None, dry_run=False, chunk_size=10
+        )
+        assert json.loads(capsys.readouterr().out) == {'matched': 2, 'affected': 2}
+
+    def test_bulk_status_requires_one_selection(self):
+        """Test que bulk-status exige fichero de identificadores o filtro, no ambos"""
+        assert main(['bulk-status', '--status', 'active']) == 2
+
+    @patch('app.cli.create_app')
+    def test_serve_async_requires_uvicorn(self, mock_create_app):
+        """Test que serve-async indica el extra necesario si falta uvicorn"""
+        with patch.dict(sys.modules, {'uvicorn': None}):
+            with pytest.raises(RuntimeError, match="'async' extra"):
+                main(['serve-async', '--port', '8001'])
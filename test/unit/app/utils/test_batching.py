@@ -0,0 +1,14 @@
+import pytest
+
+from app.utils import chunked
+
+class TestChunked:
+    def test_chunked_splits_iterable(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_chunked_empty_iterable(self):
+        assert list(chunked([], 3)) == []
+
+    def test_chunked_invalid_size(self):
+        with pytest.raises(ValueError):
+            list(chunked([1, 2], 0))
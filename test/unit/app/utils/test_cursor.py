@@ -0,0 +1,23 @@
+import pytest
+
+from app.utils import encode_cursor, decode_cursor
+
+class TestCursor:
+    def test_roundtrip(self):
+        cursor = encode_cursor('last_name', ['Perez', 'abc'])
+        assert decode_cursor(cursor, 'last_name') == ['Perez', 'abc']
+
+    def test_order_mismatch(self):
+        cursor = encode_cursor('uuid', ['abc'])
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'last_name')
+
+    def test_malformed_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor('%%%', 'uuid')
+
+    @pytest.mark.parametrize("values", [[None], [{"a": 1}], ['abc', 'def']])
+    def test_forged_values(self, values):
+        cursor = encode_cursor('uuid', values)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'uuid', 1)
@@ -0,0 +1,51 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import EmptyJSONDocumentError, JSONItemTooLargeError, NotAJSONArrayError, iter_json_array
+
+def split(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("size", [1, 3, 16, 4096])
+    def test_items_across_chunk_boundaries(self, size):
+        items = [{"index": i, "name": "Añá" * i} for i in range(20)] + [123456, 1.5, True, None, "a]b"]
+        data = json.dumps(items, ensure_ascii=False).encode()
+
+        assert list(iter_json_array(split(data, size))) == items
+
+    def test_empty_array(self):
+        assert list(iter_json_array([b' [ ] '])) == []
+
+    @pytest.mark.parametrize("data", [b'[1, 2', b'[1 2]', b'[1] x', b'[{"a": }]', b'\xff'])
+    def test_malformed(self, data):
+        with pytest.raises(ValueError):
+            list(iter_json_array([data]))
+
+    def test_not_an_array(self):
+        with pytest.raises(NotAJSONArrayError):
+            list(iter_json_array([b'{"a": 1}']))
+
+    def test_empty_document(self):
+        with pytest.raises(EmptyJSONDocumentError):
+            list(iter_json_array([b'  ']))
+
+    def test_large_item_is_not_reparsed_per_chunk(self):
+        """Un elemento que llega en muchos trozos se decodifica un número logarítmico de veces"""
+        data = json.dumps(["x" * 100000, 1]).encode()
+        raw_decode = json.JSONDecoder.raw_decode
+        with patch.object(json.JSONDecoder, 'raw_decode', autospec=True, side_effect=raw_decode) as mock_decode:
+            assert list(iter_json_array(split(data, 100))) == ["x" * 100000, 1]
+
+        assert mock_decode.call_count < 40
+
+    def test_max_item_bytes(self):
+        data = json.dumps([{"name": "a"}, {"name": "x" * 500}]).encode()
+
+        with pytest.raises(JSONItemTooLargeError):
+            list(iter_json_array(split(data, 16), max_item_bytes=100))
+        with pytest.raises(JSONItemTooLargeError):
+            list(iter_json_array([data], max_item_bytes=100))
+        assert len(list(iter_json_array(split(data, 16), max_item_bytes=1000))) == 2